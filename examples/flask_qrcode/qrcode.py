@@ -9,7 +9,7 @@
 Example Flask app to show different possibilities to embed Segno.
 """
 import io
-from flask import Flask, render_template, request, send_file, abort
+from flask import Flask, Response, render_template, request, send_file, abort
 import segno
 
 app = Flask(__name__)
@@ -36,12 +36,11 @@ def qrcode_png():
     data = request.args.get('data')
     if data not in ('Savoy Truffle', 'Rocky Raccoon'):
         return abort(404)
-    buff = io.BytesIO()
-    segno.make(data, micro=False) \
-        .save(buff, kind='png', scale=4, dark='darkblue', data_dark='#474747',
-              light='#efefef')
-    buff.seek(0)
-    return send_file(buff, mimetype='image/png')
+    qr = segno.make(data, micro=False)
+    # The image is created while the response is sent
+    return Response(qr.iter_bytes('png', scale=4, dark='darkblue', data_dark='#474747',
+                                  light='#efefef'),
+                    mimetype='image/png')
 
 
 if __name__ == '__main__':
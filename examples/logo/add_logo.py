@@ -10,16 +10,12 @@ Example how to add an image i.e. a logo to a QR code.
 
 Requires the Pillow lib.
 """
-import io
 from PIL import Image
 import segno
 
-out = io.BytesIO()
-# Nothing special here, let Segno generate the QR code and save it as PNG in a buffer
-segno.make('Blackbird singing in the dead of night', error='h').save(out, scale=5, kind='png')
-out.seek(0)  # Important to let Pillow load the PNG
-img = Image.open(out)
-# Ensure colors (Segno saves a grayscale PNG to reduce the file size), use 'RGBA' if you need transparency
+# Nothing special here, let Segno generate the QR code as Pillow image
+img = segno.make('Blackbird singing in the dead of night', error='h').to_pil(scale=5)
+# Ensure colors (Segno creates a bilevel image by default), use 'RGBA' if you need transparency
 img = img.convert('RGB')
 img_width, img_height = img.size
 logo_max_size = img_height // 3  # May use a fixed value as well
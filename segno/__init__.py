@@ -10,15 +10,18 @@ QR Code and Micro QR Code implementation.
 "QR Code" and "Micro QR Code" are registered trademarks of DENSO WAVE INCORPORATED.
 """
 import sys
-import io
+import struct
+from functools import partial
 from . import encoder
 from .encoder import DataOverflowError
-from . import writers, utils
+from .writers import Renderer, ArchiveWriter
+from . import consts, writers, utils
 
 __version__ = '1.6.2.dev'
 
-__all__ = ('make', 'make_qr', 'make_micro', 'make_sequence', 'QRCode',
-           'QRCodeSequence', 'DataOverflowError')
+__all__ = ('make', 'make_qr', 'make_micro', 'make_sequence', 'save_multipage',
+           'render_sheet', 'register_converter', 'clear_converter_cache', 'QRCode',
+           'QRCodeSequence', 'DataOverflowError', 'Renderer', 'ArchiveWriter')
 
 
 def make(content, error=None, version=None, mode=None, mask=None, encoding=None,
@@ -209,6 +212,170 @@ def make_sequence(content, error=None, version=None, mode=None, mask=None,
                                                       symbol_count=symbol_count)))
 
 
+def save_multipage(codes, out, kind=None, **kw):
+    """\
+    Saves several QR codes into one document.
+
+    Supported formats are PDF, TIFF and ZPL. The codes are written while
+    iterating over ``codes``, so a large number of codes can be saved.
+
+    .. code-block:: python
+
+        import segno
+
+        codes = (segno.make(f'Ticket {i}') for i in range(1000))
+        segno.save_multipage(codes, 'tickets.pdf', scale=4, cols=3, rows=4, gap=10)
+
+    **PDF**: By default, each QR code is placed onto its own page. The ``cols``
+    and ``rows`` parameters place several QR codes onto one page. Identical QR
+    codes are stored only once.
+
+    ==============  ==============================================================
+    Name            Description
+    ==============  ==============================================================
+    scale           Scaling factor (default: 1).
+    border          Size of the quiet zone (default: ``None`` = recommended
+                    border of the respective code).
+    dark            Color of the dark modules (default: black).
+    light           Background color of the codes (default: ``None`` = no
+                    background color).
+    compresslevel   Compression level (default: 9).
+    outline         Draws the modules as filled outlines (default: ``False``).
+    cols            Number of codes per row (default: 1).
+    rows            Number of rows per page (default: 1).
+    gap             Space between the codes (default: 0), the gap is not scaled.
+    ==============  ==============================================================
+
+    **TIFF**: Bilevel image with one QR code per page.
+
+    ==============  ==============================================================
+    Name            Description
+    ==============  ==============================================================
+    scale           Integer scaling factor (default: 1).
+    border          Size of the quiet zone (default: ``None`` = recommended
+                    border of the respective code).
+    dpi             DPI setting (default: ``None`` = no resolution information).
+    ==============  ==============================================================
+
+    **ZPL**: Print job with one QR code per label.
+
+    ==============  ==============================================================
+    Name            Description
+    ==============  ==============================================================
+    scale           Integer scaling factor (default: 1).
+    border          Size of the quiet zone (default: ``None`` = recommended
+                    border of the respective code).
+    x               Horizontal position of the codes in dots (default: 0).
+    y               Vertical position of the codes in dots (default: 0).
+    ==============  ==============================================================
+
+    :param codes: Iterable of :py:class:`QRCode` instances or matrices.
+    :param out: A filename or a writable file-like object which accepts bytes.
+            If ``None``, the document is returned as :py:class:`bytes`
+            (requires the ``kind`` parameter).
+    :param str kind: If the desired output format cannot be determined from
+            the ``out`` parameter, this parameter can be used to indicate the
+            serialization format ("pdf", "tiff", or "zpl").
+    :param kw: See tables above.
+    :rtype: bytes or None
+    """
+    return writers.save_multipage((getattr(code, 'matrix', code) for code in codes), out,
+                                  kind=kind, **kw)
+
+
+def render_sheet(codes, out, kind=None, cols=None, gap=0, **kw):
+    """\
+    Renders several QR codes into one raster image (contact sheet) and
+    returns the position of each QR code.
+
+    Supported formats are PNG, PBM and TIFF. The QR codes are placed into a
+    grid, each cell has the size of the largest QR code. The image is
+    created row by row of QR codes, so large sheets do not require much
+    memory. TIFF images are kept in memory after compression since the TIFF
+    header refers to the size of the compressed data.
+
+    .. code-block:: python
+
+        import segno
+
+        codes = [segno.make(f'Ticket {i}') for i in range(500)]
+        tiles = segno.render_sheet(codes, 'tickets.png', cols=20, gap=8, scale=4)
+        # Position and size (including the quiet zone) of the first QR code
+        x, y, width, height = tiles[0]
+
+    ==============  ==============================================================
+    Name            Description
+    ==============  ==============================================================
+    scale           Integer scaling factor (default: 1).
+    border          Size of the quiet zone (default: ``None`` = recommended
+                    border of the respective code).
+    dark            PNG only: Color of the dark modules (default: black).
+    light           PNG only: Color of the light modules and the gaps
+                    (default: white).
+    compresslevel   PNG only: Compression level (default: 9).
+    dpi             PNG and TIFF only: DPI setting (default: ``None`` = no
+                    resolution information).
+    ==============  ==============================================================
+
+    :param codes: Iterable of :py:class:`QRCode` instances or matrices.
+    :param out: A filename or a writable file-like object which accepts bytes.
+    :param str kind: If the desired output format cannot be determined from
+            the ``out`` parameter, this parameter can be used to indicate the
+            serialization format ("png", "pbm", or "tiff").
+    :param int cols: Number of QR codes per row. If ``None`` (default), the
+            QR codes are arranged in a (nearly) square grid.
+    :param int gap: Space between the QR codes in pixels (default: 0). The
+            gap is not scaled.
+    :param kw: See table above.
+    :return: List of ``(x, y, width, height)`` tuples (with the attributes
+            ``x``, ``y``, ``width``, and ``height``) in pixels, one tuple per
+            QR code in the order of ``codes``. The origin is the upper left
+            corner of the image.
+    :rtype: list
+    """
+    return writers.write_sheet([getattr(code, 'matrix', code) for code in codes], out,
+                               kind=kind, cols=cols, gap=gap, **kw)
+
+
+def register_converter(name, converter):
+    """\
+    Registers a converter which is available as ``QRCode.to_<name>`` method.
+
+    The converter is invoked with the :py:class:`QRCode` instance and any
+    further arguments or keywords. Registered converters take precedence over
+    installed ``segno.plugin.converter`` plugins and built-in converters.
+
+    .. code-block:: python
+
+        >>> import segno
+        >>> segno.register_converter('lines', lambda qrcode: [bytes(row) for row in qrcode.matrix])
+        >>> lines = segno.make('Norwegian Wood').to_lines()
+
+    :param str name: The name of the converter.
+    :param converter: A callable or ``None`` to remove a registered converter.
+    """
+    if converter is None:
+        _registered_converters.pop(name, None)
+    elif not callable(converter):
+        raise TypeError(f'The converter "{name}" is not callable')
+    else:
+        _registered_converters[name] = converter
+
+
+def clear_converter_cache():
+    """\
+    Discards the cached ``segno.plugin.converter`` plugins.
+
+    The installed plugins are looked up once and cached for the lifetime of
+    the process. This function forces a new lookup, i.e. after a plugin was
+    installed at runtime. Converters registered by
+    :py:func:`register_converter` are not affected.
+    """
+    global _converter_plugins
+    _converter_plugins = None
+    _loaded_converters.clear()
+
+
 class QRCode:
     """\
     Represents a (Micro) QR Code.
@@ -434,7 +601,7 @@ class QRCode:
             t.start()
 
     def svg_data_uri(self, xmldecl=False, encode_minimal=False,
-                     omit_charset=False, nl=False, **kw):
+                     omit_charset=False, nl=False, base64=False, **kw):
         """\
         Converts the QR code into an SVG data URI.
 
@@ -445,9 +612,10 @@ class QRCode:
 
         Aside from the missing `out` parameter, the different `xmldecl` and
         `nl` default values, and the additional parameters
-        :paramref:`encode_minimal <segno.QRCode.svg_data_uri.encode_minimal>`
-        and :paramref:`omit_charset <segno.QRCode.svg_data_uri.omit_charset>`,
-        this method uses the same parameters as the usual SVG serializer, see
+        :paramref:`encode_minimal <segno.QRCode.svg_data_uri.encode_minimal>`,
+        :paramref:`omit_charset <segno.QRCode.svg_data_uri.omit_charset>`, and
+        :paramref:`base64 <segno.QRCode.svg_data_uri.base64>`, this method
+        uses the same parameters as the usual SVG serializer, see
         :py:func:`save` and the available `SVG parameters <#svg>`_
 
         .. note::
@@ -459,16 +627,22 @@ class QRCode:
                         serialized (default: ``False``)
         :param bool encode_minimal: Indicates if the resulting data URI should
                         use minimal percent encoding (disabled by default).
+                        Ignored if ``base64`` is ``True``.
         :param bool omit_charset: Indicates if the ``;charset=...`` should be omitted
                         (disabled by default)
         :param bool nl: Indicates if the document should have a trailing newline
                         (default: ``False``)
+        :param bool base64: Indicates if the SVG document should be base64
+                        encoded instead of percent encoded (disabled by default).
+                        Base64 encoding is considerably faster than percent
+                        encoding.
         :rtype: str
         """
         return writers.as_svg_data_uri(self.matrix, self._matrix_size,
                                        xmldecl=xmldecl, nl=nl,
                                        encode_minimal=encode_minimal,
-                                       omit_charset=omit_charset, **kw)
+                                       omit_charset=omit_charset,
+                                       base64=base64, **kw)
 
     def svg_inline(self, **kw):
         """\
@@ -495,9 +669,8 @@ class QRCode:
 
         :rtype: str
         """
-        buff = io.BytesIO()
-        self.save(buff, kind='svg', xmldecl=False, svgns=False, nl=False, **kw)
-        return buff.getvalue().decode(kw.get('encoding', 'utf-8'))
+        return self.save(None, kind='svg', xmldecl=False, svgns=False, nl=False,
+                         **kw).decode(kw.get('encoding', 'utf-8'))
 
     def png_data_uri(self, **kw):
         """\
@@ -702,6 +875,8 @@ class QRCode:
                          added to the graphic (default: ``False``)
         nl               Indicates if the document should have a trailing newline
                          (default: ``True``)
+        outline          Indicates if the modules should be drawn as filled outlines
+                         instead of lines (default: ``False``).
         ================ ==============================================================
 
 
@@ -750,11 +925,13 @@ class QRCode:
         =============    ==============================================================
         Name             Description
         =============    ==============================================================
-        out              Filename or :py:class:`io.StringIO`
+        out              Filename, :py:class:`io.StringIO` or :py:class:`io.BytesIO`
         kind             "eps"
         scale            integer or float
         dark             Default: "#000" (black)
         light            Default value: ``None`` (transparent light modules)
+        outline          Indicates if the modules should be drawn as filled outlines
+                         instead of lines (default: ``False``).
         =============    ==============================================================
 
 
@@ -775,6 +952,8 @@ class QRCode:
         compresslevel    Default: 9. Integer indicating the compression level.
                          1 is fastest and produces the least compression, 9 is slowest
                          and produces the most. 0 is no compression.
+        outline          Indicates if the modules should be drawn as filled outlines
+                         instead of lines (default: ``False``).
         =============    ==============================================================
 
 
@@ -787,7 +966,7 @@ class QRCode:
         =============    ==============================================================
         Name             Description
         =============    ==============================================================
-        out              Filename or :py:class:`io.StringIO`
+        out              Filename, :py:class:`io.StringIO` or :py:class:`io.BytesIO`
         kind             "txt"
         dark             Default: "1"
         light            Default: "0"
@@ -803,7 +982,7 @@ class QRCode:
         =============    ==============================================================
         Name             Description
         =============    ==============================================================
-        out              Filename or :py:class:`io.StringIO`
+        out              Filename, :py:class:`io.StringIO` or :py:class:`io.BytesIO`
         kind             "ans"
         =============    ==============================================================
 
@@ -863,6 +1042,76 @@ class QRCode:
 
 
 
+        .. _tiff:
+
+        **Tagged Image File Format (TIFF)**
+
+        Bilevel image with CCITT Group 4 compression. The serializer does not
+        support any coloring. Use :py:func:`segno.save_multipage` to save
+        several QR codes as multipage TIFF image.
+
+        All :ref:`common keywords <common_keywords>` are supported.
+
+        =============    ==============================================================
+        Name             Description
+        =============    ==============================================================
+        out              Filename or :py:class:`io.BytesIO`
+        kind             "tiff" or "tif"
+        scale            integer
+        dpi              Default: ``None``. Specifies the DPI value for the image.
+        =============    ==============================================================
+
+
+        .. _zpl:
+
+        **Zebra Programming Language (ZPL)**
+
+        Label for Zebra printers, the QR code is written as compressed
+        graphic field. The serializer does not support any coloring.
+        Use :py:func:`segno.save_multipage` to write several labels into one
+        print job.
+
+        All :ref:`common keywords <common_keywords>` are supported.
+
+        =============    ==============================================================
+        Name             Description
+        =============    ==============================================================
+        out              Filename or :py:class:`io.BytesIO`
+        kind             "zpl"
+        scale            integer, one module corresponds to ``scale`` x ``scale``
+                         dots.
+        x                Horizontal position of the QR code on the label in dots
+                         (default: 0).
+        y                Vertical position of the QR code on the label in dots
+                         (default: 0).
+        =============    ==============================================================
+
+
+        .. _escpos:
+
+        **ESC/POS**
+
+        Bit image for receipt printers. The serializer does not support any
+        coloring.
+
+        All :ref:`common keywords <common_keywords>` are supported.
+
+        =============    ==============================================================
+        Name             Description
+        =============    ==============================================================
+        out              Filename or :py:class:`io.BytesIO`
+        kind             "escpos"
+        scale            integer, one module corresponds to ``scale`` x ``scale``
+                         dots.
+        head_width       Default: ``None``. Width of the print head in dots
+                         (i.e. ``384`` or ``576``). If provided, the QR code is
+                         centered.
+        column           Default: ``False``. Indicates if the 24-dot column format
+                         (``ESC *``) should be used instead of the raster format
+                         (``GS v 0``).
+        =============    ==============================================================
+
+
         .. _latex:
 
         **LaTeX / PGF/TikZ**
@@ -876,7 +1125,7 @@ class QRCode:
         =============    ==============================================================
         Name             Description
         =============    ==============================================================
-        out              Filename or :py:class:`io.StringIO`
+        out              Filename, :py:class:`io.StringIO` or :py:class:`io.BytesIO`
         kind             "tex"
         scale            integer or float
         dark             LaTeX color name (default: "black"). The color is written
@@ -885,6 +1134,8 @@ class QRCode:
         url              Default: ``None``. Optional URL where the QR code should
                          point to. Requires the ``hyperref`` package in the LaTeX
                          environment.
+        outline          Indicates if the modules should be drawn as filled outlines
+                         instead of lines (default: ``False``).
         =============    ==============================================================
 
 
@@ -897,7 +1148,7 @@ class QRCode:
         =============    ==============================================================
         Name             Description
         =============    ==============================================================
-        out              Filename or :py:class:`io.StringIO`
+        out              Filename, :py:class:`io.StringIO` or :py:class:`io.BytesIO`
         kind             "xbm"
         scale            integer
         name             Name of the variable (default: "img")
@@ -913,7 +1164,7 @@ class QRCode:
         =============    ==============================================================
         Name             Description
         =============    ==============================================================
-        out              Filename or :py:class:`io.StringIO`
+        out              Filename, :py:class:`io.StringIO` or :py:class:`io.BytesIO`
         kind             "xpm"
         scale            integer
         dark             Default: "#000" (black).
@@ -928,7 +1179,15 @@ class QRCode:
                 ``name`` attribute. Use the :paramref:`kind <segno.QRCode.save.kind>`
                 parameter if `out` is a :py:class:`io.BytesIO` or
                 :py:class:`io.StringIO` stream which don't have a ``name``
-                attribute.
+                attribute. If ``None``, the serialized QR code is returned as
+                :py:class:`bytes` (requires the :paramref:`kind <segno.QRCode.save.kind>`
+                parameter)::
+
+                    >>> import segno
+                    >>> qrcode = segno.make('Yellow Submarine')
+                    >>> qrcode.save(None, kind='svg')[:4]
+                    b'<?xm'
+
         :param str kind: Default ``None``.
                 If the desired output format cannot be determined from
                 the :paramref:`out <segno.QRCode.save.out>` parameter, this
@@ -936,8 +1195,124 @@ class QRCode:
                 (i.e. "svg" to enforce SVG output). The value is case
                 insensitive.
         :param kw: Any of the supported keywords by the specific serializer.
+        :rtype: bytes or None
+        """
+        return writers.save(self.matrix, self._matrix_size, out, kind, **kw)
+
+    def save_many(self, targets, **kw):
+        """\
+        Serializes the QR code into several files or streams at once.
+
+        The representations of the QR code which are used by the serializers
+        (i.e. the runs of dark modules, the rows including the quiet zone and
+        the module types) are computed once and shared by all serializers.
+
+        .. code-block:: python
+
+            >>> import segno
+            >>> qrcode = segno.make('Penny Lane')
+            >>> qrcode.save_many({'penny-lane.png': {'scale': 4},
+            ...                   'penny-lane.svg': {'dark': 'darkblue'},
+            ...                   'penny-lane.pdf': None}, border=2)
+
+        :param dict targets: Mapping of a filename or a writable file-like
+                object to the keyword arguments of the specific serializer (or
+                ``None``). Use the ``kind`` keyword to specify the format of
+                streams, see :py:meth:`save`.
+        :param kw: Keyword arguments which apply to all targets. The keywords
+                of the targets take precedence.
+        """
+        with writers.geometry_cache():
+            for out, options in targets.items():
+                self.save(out, **dict(kw, **(options or {})))
+
+    def iter_bytes(self, kind, chunk_size=8192, **kw):
+        """\
+        Serializes the QR code and returns an iterator over the chunks
+        (:py:class:`bytes`) of the document.
+
+        The iterator can be used as body of a streaming response (i.e. by
+        WSGI applications). PNG images are created while the iterator is
+        consumed, so the first bytes are available before the whole image is
+        created. SVG documents are joined into chunks while the iterator is
+        consumed, the path data is created in advance.
+
+        .. code-block:: python
+
+            >>> import segno
+            >>> qrcode = segno.make('Paperback Writer')
+            >>> body = b''.join(qrcode.iter_bytes('png', scale=10))
+
+        :param str kind: The serialization format, i.e. "png", "svg" or
+                "pdf". All formats supported by :py:meth:`save` are accepted.
+        :param int chunk_size: The approximate size of the chunks in bytes
+                (default: 8192).
+        :param kw: Any of the supported keywords by the specific serializer.
+        :raises: :py:exc:`ValueError` if the options are invalid. The
+                options are validated before the iterator is returned.
+        :rtype: iterator over bytes
+        """
+        return writers.iter_bytes(self.matrix, self._matrix_size, kind, chunk_size, **kw)
+
+    def aiter_bytes(self, kind, chunk_size=8192, **kw):
+        """\
+        Asynchronous counterpart of :py:meth:`iter_bytes` which can be used as
+        body of a streaming response of ASGI applications.
+
+        .. code-block:: python
+
+            >>> async def body(qrcode):
+            ...     return b''.join([chunk async for chunk in qrcode.aiter_bytes('svg')])
+
+        See :py:meth:`iter_bytes` for a description of the parameters.
+
+        :rtype: asynchronous iterator over bytes
+        """
+        return writers.aiter_bytes(self.matrix, self._matrix_size, kind, chunk_size, **kw)
+
+    def to_bytes(self):
+        """\
+        Returns a compact binary representation of the QR code.
+
+        The representation contains the version, error correction level, mask
+        and mode and the matrix (one bit per module). It is intended for
+        transferring QR codes between processes or storing them in a cache,
+        :py:meth:`from_bytes` restores the QR code without encoding the data
+        again. Pickling a QR code uses the same representation.
+
+        .. code-block:: python
+
+            >>> import segno
+            >>> qrcode = segno.make('Getting Better')
+            >>> data = qrcode.to_bytes()
+            >>> qrcode == segno.QRCode.from_bytes(data)
+            True
+
+        :rtype: bytes
+        """
+        width, height = self._matrix_size
+        return _WIRE_HEADER.pack(_WIRE_MAGIC, width, height, self._version,
+                                 _WIRE_NONE if self._error is None else self._error, self.mask,
+                                 _WIRE_NONE if self._mode is None else self._mode) \
+            + writers._pack_matrix(self.matrix)
+
+    @staticmethod
+    def from_bytes(data):
+        """\
+        Returns the QR code from the representation created by
+        :py:meth:`to_bytes`.
+
+        :param data: Bytes-like object.
+        :raises: :py:exc:`ValueError` if `data` is not a valid representation.
+        :rtype: QRCode
         """
-        writers.save(self.matrix, self._matrix_size, out, kind, **kw)
+        qrcode, end = _qrcode_from_bytes(data, 0)
+        if end != len(data):
+            raise ValueError('Invalid QR code representation: Unexpected trailing data')
+        return qrcode
+
+    def __reduce__(self):
+        return QRCode.from_bytes, (self.to_bytes(),)
 
     def __getattr__(self, name):
         """\
@@ -947,22 +1322,152 @@ class QRCode:
         a ``segno.plugin.converter`` plugin with the provided ``<name>``.
         If such a plugin exists, a callable function is returned. The result
         of invoking the function depends on the plugin.
+
+        If no plugin is found, the built-in converters ``to_pil`` (requires
+        Pillow) and ``to_array`` (requires NumPy) are used.
+
+        Converters registered by :py:func:`segno.register_converter` take
+        precedence over plugins. The plugins are looked up once per process,
+        see :py:func:`segno.clear_converter_cache`.
         """
         if name.startswith('to_'):
-            try:
-                # Try to use the 3rd party lib first. This is required for
-                # Python versions < 3.10
-                import importlib_metadata as metadata
-            except ImportError:
-                from importlib import metadata
-            from functools import partial
-            for ep in metadata.entry_points(group='segno.plugin.converter',
-                                            name=name[3:]):
-                plugin = ep.load()
-                return partial(plugin, self)
+            converter = _find_converter(name[3:])
+            if converter is not None:
+                return partial(converter, self)
         raise AttributeError(f'{self.__class__} object has no attribute {name}')
 
 
+# Representation created by QRCode.to_bytes: magic, width, height, version,
+# error, mask, mode (-128 = None), followed by the packed matrix
+_WIRE_HEADER = struct.Struct('<2sHHbbbb')
+_WIRE_MAGIC = b'Q1'
+_WIRE_SEQUENCE_MAGIC = b'S1'
+_WIRE_NONE = -128
+
+
+def _qrcode_from_bytes(data, offset):
+    """\
+    Returns the QR code at the provided offset and the offset after the
+    QR code.
+    """
+    try:
+        magic, width, height, version, error, mask, mode = _WIRE_HEADER.unpack_from(data, offset)
+    except struct.error:
+        raise ValueError('Invalid QR code representation: Incomplete header')
+    if magic != _WIRE_MAGIC:
+        raise ValueError('Invalid QR code representation')
+    is_micro = version in consts.MICRO_VERSIONS
+    if not is_micro and not 1 <= version <= 40:
+        raise ValueError(f'Invalid QR code representation: Invalid version "{version}"')
+    error = None if error == _WIRE_NONE else error
+    if error not in (consts.ERROR_LEVEL_TO_MICRO_MAPPING[version] if is_micro
+                     else consts.ERROR_MAPPING.values()):
+        raise ValueError(f'Invalid QR code representation: Invalid error correction level "{error}"')
+    if not 0 <= mask < (4 if is_micro else 8):
+        raise ValueError(f'Invalid QR code representation: Invalid data mask "{mask}"')
+    mode = None if mode == _WIRE_NONE else mode
+    if mode is not None and mode not in consts.MODE_MAPPING.values():
+        raise ValueError(f'Invalid QR code representation: Invalid mode "{mode}"')
+    size = encoder.calc_matrix_size(version)
+    if width != size or height != size:
+        raise ValueError('Invalid QR code representation: Invalid matrix size')
+    start = offset + _WIRE_HEADER.size
+    end = start + writers._packed_matrix_size(width, height)
+    if end > len(data):
+        raise ValueError('Invalid QR code representation: Incomplete matrix')
+    qrcode = QRCode.__new__(QRCode)
+    qrcode.matrix = writers._unpack_matrix(data[start:end], width, height)
+    qrcode.mask = mask
+    qrcode._matrix_size = width, height
+    qrcode._version = version
+    qrcode._error = error
+    qrcode._mode = mode
+    return qrcode, end
+
+
+def _to_pil(qrcode, scale=1, border=None, dark='#000', light='#fff'):
+    """\
+    Converts the QR code into a Pillow image without creating a PNG image.
+
+    Available as ``QRCode.to_pil()`` if no plugin (i.e. ``qrcode-artistic``)
+    provides this method. Requires `Pillow <https://pypi.org/project/pillow/>`_.
+
+    .. code-block:: python
+
+        >>> import segno
+        >>> qrcode = segno.make('Blackbird singing in the dead of night')
+        >>> img = qrcode.to_pil(scale=5, dark='darkblue')
+
+    :param int scale: Integer scaling factor (default: 1).
+    :param int border: Size of the quiet zone (default: ``None`` = recommended
+            border of the QR code).
+    :param dark: Color of the dark modules (default: black).
+    :param light: Color of the light modules (default: white).
+    :rtype: PIL.Image.Image
+    """
+    return writers.as_pil_image(qrcode.matrix, qrcode._matrix_size, scale=scale,
+                                border=border, dark=dark, light=light)
+
+
+def _to_array(qrcode, scale=1, border=None):
+    """\
+    Converts the QR code into a two-dimensional NumPy array of unsigned bytes,
+    ``1`` indicates a dark module, ``0`` a light module.
+
+    Available as ``QRCode.to_array()`` if no plugin provides this method.
+    Requires `NumPy <https://pypi.org/project/numpy/>`_.
+
+    :param int scale: Integer scaling factor (default: 1).
+    :param int border: Size of the quiet zone (default: ``None`` = recommended
+            border of the QR code).
+    :rtype: numpy.ndarray
+    """
+    return writers.as_array(qrcode.matrix, qrcode._matrix_size, scale=scale, border=border)
+
+
+# Converters which are available as QRCode.to_<name> methods if no
+# segno.plugin.converter plugin with the same name is installed
+_BUILTIN_CONVERTERS = {
+    'pil': _to_pil,
+    'array': _to_array,
+}
+
+# Converters registered by register_converter
+_registered_converters = {}
+# Name -> entry point of the installed plugins, created on first use
+_converter_plugins = None
+# Name -> loaded plugin
+_loaded_converters = {}
+
+
+def _find_converter(name):
+    """\
+    Returns the converter with the provided name or ``None``.
+    """
+    global _converter_plugins
+    converter = _registered_converters.get(name) or _loaded_converters.get(name)
+    if converter is not None:
+        return converter
+    plugins = _converter_plugins
+    if plugins is None:
+        try:
+            # Try to use the 3rd party lib first. This is required for
+            # Python versions < 3.10
+            import importlib_metadata as metadata
+        except ImportError:
+            from importlib import metadata
+        plugins = {}
+        for ep in metadata.entry_points(group='segno.plugin.converter'):
+            plugins.setdefault(ep.name, ep)
+        _converter_plugins = plugins
+    ep = plugins.get(name)
+    if ep is not None:
+        converter = _loaded_converters[name] = ep.load()
+        return converter
+    # Built-in converters have a lower priority than installed plugins
+    return _BUILTIN_CONVERTERS.get(name)
+
+
 class QRCodeSequence(tuple):
     """\
     Represents a sequence of  1 .. n (max. n = 16) :py:class:`QRCode` instances.
@@ -1008,6 +1513,40 @@ class QRCodeSequence(tuple):
         for n, qrcode in enumerate(self, start=1):
             qrcode.save(filename(out, n), kind=kind, **kw)
 
+    def to_bytes(self):
+        """\
+        Returns a compact binary representation of the sequence.
+
+        See :py:meth:`QRCode.to_bytes()` for details.
+
+        :rtype: bytes
+        """
+        return _WIRE_SEQUENCE_MAGIC + bytes([len(self)]) + b''.join(qrcode.to_bytes() for qrcode in self)
+
+    @staticmethod
+    def from_bytes(data):
+        """\
+        Returns the sequence from the representation created by
+        :py:meth:`to_bytes`.
+
+        :param data: Bytes-like object.
+        :raises: :py:exc:`ValueError` if `data` is not a valid representation.
+        :rtype: QRCodeSequence
+        """
+        if len(data) < 3 or data[:2] != _WIRE_SEQUENCE_MAGIC:
+            raise ValueError('Invalid QR code sequence representation')
+        qrcodes = []
+        offset = 3
+        for _ in range(data[2]):
+            qrcode, offset = _qrcode_from_bytes(data, offset)
+            qrcodes.append(qrcode)
+        if offset != len(data):
+            raise ValueError('Invalid QR code sequence representation: Unexpected trailing data')
+        return QRCodeSequence(qrcodes)
+
+    def __reduce__(self):
+        return QRCodeSequence.from_bytes, (self.to_bytes(),)
+
     def __getattr__(self, item):
         """\
         Behaves like :py:class:`QRCode` iff this sequence contains a single item.
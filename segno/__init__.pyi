@@ -1,3 +1,4 @@
+from collections.abc import AsyncIterator
 from typing import Any, AnyStr, Callable, IO, TextIO, Iterator, Iterable
 from .encoder import DataOverflowError as DataOverflowError
 
@@ -43,6 +44,48 @@ def make_sequence(content: int | str | bytes,
                   symbol_count: int | None = None) -> QRCodeSequence: ...
 
 
+def save_multipage(codes: Iterable[QRCode | tuple[bytearray, ...]],
+                   out: IO[bytes] | str | None, kind: str | None = None,
+                   **kw: Any) -> bytes | None: ...
+
+
+def render_sheet(codes: Iterable[QRCode | tuple[bytearray, ...]],
+                 out: IO[bytes] | str, kind: str | None = None,
+                 cols: int | None = None, gap: int = 0,
+                 **kw: Any) -> list[tuple[int, int, int, int]]: ...
+
+
+def register_converter(name: str, converter: Callable | None) -> None: ...
+
+
+def clear_converter_cache() -> None: ...
+
+
+class Renderer:
+    kind: str
+
+    def __init__(self, kind: str, **kw: Any) -> None: ...
+
+    def render(self, qrcode: QRCode | tuple[bytearray, ...],
+               out: IO[AnyStr] | str | None = None) -> bytes | None: ...
+
+
+class ArchiveWriter:
+    kind: str
+
+    def __init__(self, out: IO[bytes] | str, kind: str | None = None,
+                 compress: bool = True) -> None: ...
+
+    def add(self, qrcode: QRCode | tuple[bytearray, ...], name: str,
+            kind: str | None = None, **kw: Any) -> None: ...
+
+    def close(self) -> None: ...
+
+    def __enter__(self) -> ArchiveWriter: ...
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None: ...
+
+
 class QRCode:
     matrix: tuple[bytearray, ...]
     mask: int
@@ -78,6 +121,7 @@ class QRCode:
 
     def svg_data_uri(self, xmldecl: bool = False, encode_minimal: bool = False,
                      omit_charset: bool = False, nl: bool = False,
+                     base64: bool = False,
                      **kw: Any) -> str: ...
 
     def svg_inline(self, **kw: Any) -> str: ...
@@ -87,8 +131,28 @@ class QRCode:
     def terminal(self, out: TextIO | str | None = None,
                  border: int | None = None, compact: bool = False) -> None: ...
 
-    def save(self, out: IO[AnyStr] | str, kind: str | None = None,
-             **kw: Any) -> None: ...
+    def save(self, out: IO[AnyStr] | str | None, kind: str | None = None,
+             **kw: Any) -> bytes | None: ...
+
+    def save_many(self, targets: dict[IO[AnyStr] | str, dict[str, Any] | None],
+                  **kw: Any) -> None: ...
+
+    def iter_bytes(self, kind: str, chunk_size: int = 8192,
+                   **kw: Any) -> Iterator[bytes]: ...
+
+    def aiter_bytes(self, kind: str, chunk_size: int = 8192,
+                    **kw: Any) -> AsyncIterator[bytes]: ...
+
+    def to_bytes(self) -> bytes: ...
+
+    @staticmethod
+    def from_bytes(data: bytes | bytearray | memoryview) -> QRCode: ...
+
+    def to_pil(self, scale: int = 1, border: int | None = None,
+               dark: tuple | str | None = '#000',
+               light: tuple | str | None = '#fff', **kw: Any) -> Any: ...
+
+    def to_array(self, scale: int = 1, border: int | None = None) -> Any: ...
 
     def __getattr__(self, name: Any) -> Callable | None: ...
 
@@ -104,4 +168,9 @@ class QRCodeSequence(tuple):
     def save(self, out: IO[AnyStr] | str, kind: str | None = None,
              **kw: Any) -> None: ...
 
+    def to_bytes(self) -> bytes: ...
+
+    @staticmethod
+    def from_bytes(data: bytes | bytearray | memoryview) -> QRCodeSequence: ...
+
     def __getattr__(self, name: Any) -> Callable | None: ...
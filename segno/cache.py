@@ -0,0 +1,241 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Persistent cache for QR codes and serialized documents.
+
+The cache stores the results of :py:func:`segno.make` and
+:py:meth:`segno.QRCode.save` in a directory, the cached results are shared
+between processes. The key of an entry is a hash of the provided parameters,
+the QR codes are stored in the representation of
+:py:meth:`segno.QRCode.to_bytes`, serialized documents are stored as they
+are.
+
+.. code-block:: python
+
+    >>> from segno.cache import RenderCache
+    >>> cache = RenderCache('/var/cache/qrcodes')
+    >>> qrcode = cache.make('Yellow Submarine', error='h')
+    >>> cache.save(qrcode, 'yellow-submarine.png', scale=4)
+    >>> cache.stats()
+    CacheStats(hits=0, misses=2)
+"""
+import os
+import hashlib
+import tempfile
+from collections import namedtuple
+import segno
+from . import writers
+
+__all__ = ('RenderCache', 'CacheStats')
+
+CacheStats = namedtuple('CacheStats', 'hits misses')
+
+_DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+# Fraction of max_size which is kept after an eviction
+_EVICTION_TARGET = .9
+_CACHEABLE_TYPES = (type(None), bool, int, float, str, bytes)
+
+
+def _is_cacheable(value):
+    """\
+    Returns if the value has a stable representation and can be part of a
+    cache key.
+    """
+    if isinstance(value, tuple):
+        return all(_is_cacheable(v) for v in value)
+    return type(value) in _CACHEABLE_TYPES
+
+
+class RenderCache:
+    """\
+    Caches QR codes and serialized documents in a directory.
+
+    The entries are distributed over subdirectories named by the first two
+    characters of the key. New entries are written into temporary files
+    which are renamed afterwards, processes which share the directory never
+    read incomplete entries. If the size of the entries exceeds `max_size`,
+    the least recently used entries are removed.
+
+    Parameters which cannot be represented reliably as part of a key (i.e.
+    objects which are not strings, numbers, bytes or tuples) bypass the cache.
+
+    :param str path: The cache directory. It is created if it does not exist.
+    :param int max_size: The maximum size of all entries in bytes.
+    """
+    def __init__(self, path, max_size=_DEFAULT_MAX_SIZE):
+        if max_size < 1:
+            raise ValueError(f'Invalid cache size "{max_size}". Must be greater than zero')
+        self.path = os.fspath(path)
+        self.max_size = max_size
+        os.makedirs(self.path, exist_ok=True)
+        self._size = None  # Determined when the first entry is stored
+        self._hits = 0
+        self._misses = 0
+
+    def make(self, content, **kw):
+        """\
+        Returns a QR code, see :py:func:`segno.make` for the parameters.
+
+        :rtype: segno.QRCode
+        """
+        key = self._key(('make', type(content).__name__), content, kw)
+        data = self._read(key)
+        if data is None:
+            qrcode = segno.make(content, **kw)
+            if key is not None:
+                self._write(key, qrcode.to_bytes())
+            return qrcode
+        return segno.QRCode.from_bytes(data)
+
+    def save(self, qrcode, out, kind=None, **kw):
+        """\
+        Serializes the QR code, see :py:meth:`segno.QRCode.save` for the
+        parameters.
+
+        :param segno.QRCode qrcode: The QR code to serialize.
+        :rtype: bytes or None
+        """
+        if kind is None and out is not None:
+            fname = getattr(out, 'name', out)
+            kind = fname[fname.rfind('.') + 1:]
+        if kind is None:
+            raise ValueError('The serialization format ("kind") is required if "out" is None')
+        kind = kind.lower()
+        key = self._key(('save', kind, qrcode.version), qrcode.matrix, kw)
+        data = self._read(key)
+        if data is None:
+            data = qrcode.save(None, kind=kind, **kw)
+            if key is not None:
+                self._write(key, data)
+        if out is None:
+            return data
+        mode = 'wt' if kind in writers._TEXT_KINDS else 'wb'
+        encoding = kw.get('encoding', 'utf-8') if kind == 'svg' else None
+        with writers._byte_writer(out, mode, encoding) as f:
+            f.write(data)
+
+    def stats(self):
+        """\
+        Returns the number of cache hits and misses of this instance.
+
+        :rtype: CacheStats
+        """
+        return CacheStats(self._hits, self._misses)
+
+    def clear(self):
+        """\
+        Removes all entries.
+        """
+        for path, _ in self._entries():
+            _remove(path)
+        self._size = 0
+
+    def _key(self, params, data, kw):
+        """\
+        Returns the key of the parameters or ``None`` if the parameters
+        cannot be cached.
+
+        :param tuple params: Description of the operation.
+        :param data: The content of the QR code or the matrix.
+        :param dict kw: The keyword arguments of the operation.
+        """
+        kw = tuple(sorted(kw.items()))
+        if not _is_cacheable(kw):
+            return None
+        h = hashlib.sha256(repr((segno.__version__, params, kw)).encode('utf-8'))
+        if isinstance(data, tuple):  # Matrix
+            for row in data:
+                h.update(row)
+        elif _is_cacheable(data):
+            h.update(repr(data).encode('utf-8'))
+        else:
+            return None
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.path, key[:2], key[2:])
+
+    def _read(self, key):
+        """\
+        Returns the cached data or ``None``.
+        """
+        data = None
+        if key is not None:
+            path = self._path(key)
+            try:
+                with open(path, 'rb') as f:
+                    data = f.read()
+                # The modification time is used to find the least recently used entries
+                os.utime(path)
+            except OSError:  # Not cached or removed by another process
+                pass
+        if data is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return data
+
+    def _write(self, key, data):
+        """\
+        Stores the data atomically and removes old entries if necessary.
+        """
+        if self._size is None:
+            self._evict()
+        directory = os.path.dirname(self._path(key))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            _remove(tmp_path)
+            raise
+        self._size += len(data)
+        if self._size > self.max_size:
+            self._evict()
+
+    def _entries(self):
+        """\
+        Returns the paths and stat results of all entries.
+        """
+        entries = []
+        for shard in os.scandir(self.path):
+            if not shard.is_dir() or len(shard.name) != 2:
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.name.startswith('.'):  # Incomplete entry
+                    continue
+                try:
+                    entries.append((entry.path, entry.stat()))
+                except OSError:  # Removed by another process
+                    pass
+        return entries
+
+    def _evict(self):
+        """\
+        Determines the size of the cache and removes the least recently
+        used entries if the cache is too large.
+        """
+        entries = self._entries()
+        size = sum(stat.st_size for _, stat in entries)
+        if size > self.max_size:
+            entries.sort(key=lambda entry: entry[1].st_mtime)
+            target = self.max_size * _EVICTION_TARGET
+            for path, stat in entries:
+                if size <= target:
+                    break
+                _remove(path)
+                size -= stat.st_size
+        self._size = size
+
+
+def _remove(path):
+    try:
+        os.unlink(path)
+    except OSError:  # Removed by another process
+        pass
@@ -0,0 +1,24 @@
+from . import QRCode
+import os
+from typing import IO, Any, NamedTuple
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+
+
+class RenderCache:
+    path: str
+    max_size: int
+
+    def __init__(self, path: str | os.PathLike, max_size: int = ...) -> None: ...
+
+    def make(self, content: int | str | bytes, **kw: Any) -> QRCode: ...
+
+    def save(self, qrcode: QRCode, out: str | IO[bytes] | IO[str] | None,
+             kind: str | None = None, **kw: Any) -> bytes | None: ...
+
+    def stats(self) -> CacheStats: ...
+
+    def clear(self) -> None: ...
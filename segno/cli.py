@@ -11,11 +11,18 @@ Command line script to generate (Micro) QR codes with Segno.
 
 "QR Code" and "Micro QR Code" are registered trademarks of DENSO WAVE INCORPORATED.
 """
+import io
 import os
 import sys
+import csv
+import json
 import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import segno
 from segno import writers
+from segno.cache import RenderCache
+from segno import worker
 
 # file extension to supported keywords mapping
 _EXT_TO_KW_MAPPING = {}
@@ -98,6 +105,13 @@ def make_parser():
                         type=_convert_scale)
     parser.add_argument('--output', '-o', help='Output file. If not specified, the QR Code is printed to the terminal',
                         required=False)
+    parser.add_argument('--outline', help='Draws the dark modules as filled outlines instead of lines. '
+                                          'Supported by the vector formats SVG, PDF, EPS, and LaTeX.',
+                        action='store_true')
+    parser.add_argument('--cache', help='Directory of a persistent cache which stores the created QR codes and '
+                                        'output files. The cache is shared between several invocations of the '
+                                        'command.',
+                        required=False)
 
     color_group = parser.add_argument_group('Module Colors', 'Arguments to specify the module colors. '
                                                              'Multiple colors are supported for SVG and PNG. '
@@ -165,18 +179,50 @@ def make_parser():
                            default='utf-8')
     svg_group.add_argument('--draw-transparent', help='Indicates that transparent paths should be drawn',
                            action='store_true')
-    # PNG
-    png_group = parser.add_argument_group('PNG', 'PNG specific options')
-    png_group.add_argument('--dpi', help='Sets the DPI value of the PNG file',
+    # PNG and TIFF
+    png_group = parser.add_argument_group('PNG and TIFF', 'PNG and TIFF specific options')
+    png_group.add_argument('--dpi', help='Sets the DPI value of the PNG or TIFF file',
                            type=int)
     # Terminal
     terminal_group = parser.add_argument_group('Terminal', 'Terminal specific options')
     terminal_group.add_argument('--compact', help='Indicates that the QR code should be printed in a more compact manner',   # noqa: E501
                                 action='store_true')
+    # Batch
+    batch_group = parser.add_argument_group('Batch', 'Creates several QR codes, one QR code per record of a CSV '
+                                                     'or JSON Lines file')
+    batch_group.add_argument('--batch', help='CSV file (with header row) or JSON Lines file. The field "content" '
+                                             'provides the content of the QR code, all other fields (i.e. "scale" '
+                                             'or "dark") override the command line arguments. '
+                                             'Use "-" to read the records from stdin',
+                             metavar='FILE')
+    batch_group.add_argument('--output-pattern', help='Pattern of the output files, i.e. "out/{id}.png". All fields '
+                                                      'of a record can be used, "{id}" refers to the "id" field or '
+                                                      'to the number of the record. '
+                                                      'If not specified or "-", the QR codes are printed to the '
+                                                      'terminal')
+    batch_group.add_argument('--jobs', '-j', help='Number of worker processes (default: 1). '
+                                                  '0 uses a worker process per CPU',
+                             default=1,
+                             type=int)
+    # Worker
+    worker_group = parser.add_argument_group('Worker', 'Long-running process which creates QR codes '
+                                                       'on behalf of other programs')
+    worker_group.add_argument('--serve-stdio', help='Reads requests (JSON Lines) from stdin and writes the '
+                                                    'responses to stdout until stdin is closed. '
+                                                    'Supports --jobs and --cache',
+                              action='store_true')
+    worker_group.add_argument('--serve-http', help='Starts an HTTP server which renders QR codes, '
+                                                   'i.e. GET /qr.png?data=Segno&scale=4',
+                              action='store_true')
+    worker_group.add_argument('--host', help='Host name or IP address of the HTTP server (default: 127.0.0.1)',
+                              default='127.0.0.1')
+    worker_group.add_argument('--port', help='Port of the HTTP server (default: 8000)',
+                              default=8000,
+                              type=int)
     # Show Segno's version --version and -v are taken by QR Code version
     parser.add_mutually_exclusive_group().add_argument('--ver', '-V', help="Shows Segno's version",
                                                        action='version', version=f'Segno {segno.__version__}')
-    parser.add_argument('content', nargs='+', help='The content to encode')
+    parser.add_argument('content', nargs='*', help='The content to encode')
     return parser
 
 
@@ -188,7 +234,19 @@ def parse(args):
     if not len(args):
         parser.print_help()
         sys.exit(1)
+    return _parse(parser, args)
+
+
+def _parse(parser, args):
+    """\
+    Parses the arguments with the provided parser and returns the result.
+    """
     parsed_args = parser.parse_args(args)
+    if not parsed_args.content and parsed_args.batch is None \
+            and not parsed_args.serve_stdio and not parsed_args.serve_http:
+        parser.error('the following arguments are required: content')
+    if parsed_args.jobs < 0:
+        parser.error('argument --jobs/-j: must not be negative')
     if parsed_args.error == '-':
         parsed_args.error = None
     # 'micro' is False by default. If version is set to a Micro QR Code version,
@@ -248,7 +306,7 @@ def build_config(config, filename=None):
     return config
 
 
-def make_code(config):
+def make_code(config, cache=None):
     """\
     Creates the (Micro) QR Code (Sequence).
 
@@ -256,9 +314,11 @@ def make_code(config):
     or QR Code Sequence are removed from the configuration.
 
     :param config: Configuration, see :py:func:`build_config`
+    :param cache: Optional :py:class:`segno.cache.RenderCache` to look up
+            (Micro) QR Codes. Sequences are not cached.
     :return: :py:class:`segno.QRCode` or :py:class:`segno.QRCodeSequence`.
     """
-    make = segno.make
+    make = segno.make if cache is None else cache.make
     kw = dict(mode=config.pop('mode'), error=config.pop('error'),
               version=config.pop('version'), mask=config.pop('pattern'),
               encoding=config.pop('encoding'),
@@ -273,19 +333,261 @@ def make_code(config):
 
 def main(args=sys.argv[1:]):
     config = parse(args)
+    if config.serve_stdio:
+        try:
+            worker.serve(jobs=config.jobs or os.cpu_count() or 1, cache=config.cache)
+        except KeyboardInterrupt:
+            pass
+        return 0
+    if config.serve_http:
+        from segno import web  # segno.web depends on this module
+        web.serve(config.host, config.port)
+        return 0
+    if config.batch is not None:
+        return _run_batch(args, config)
+    cache = config.pop('cache')
+    if cache is not None:
+        cache = RenderCache(cache)
     try:
-        qr = make_code(config)
+        qr = make_code(config, cache)
     except ValueError as ex:
         sys.stderr.writelines([str(ex), os.linesep])
         return sys.exit(1)
     output = config.pop('output')
     if output is None:
         qr.terminal(border=config['border'], compact=config.get('compact', False))
+    elif cache is not None and isinstance(qr, segno.QRCode):
+        cache.save(qr, output, **build_config(config, filename=output))
     else:
         qr.save(output, **build_config(config, filename=output))
     return 0
 
 
+# Options which are not supported as fields of batch records
+_BATCH_OPTIONS = frozenset(('batch', 'output_pattern', 'jobs', 'cache', 'serve_stdio', 'serve_http', 'host',
+                            'port'))
+# Number of records passed to a worker process at once
+_BATCH_CHUNK_SIZE = 32
+# Worker state, see _init_batch_worker
+_batch_state = None
+
+
+def _run_batch(args, config):
+    """\
+    Creates a QR code for each record of the batch file.
+
+    Errors are reported to stderr and do not stop the processing of the
+    remaining records.
+
+    :param list args: The command line arguments.
+    :param config: The parsed command line arguments.
+    :return: ``0`` if all QR codes were created, ``1`` otherwise.
+    """
+    jobs = config.jobs or os.cpu_count() or 1
+    if config.batch == '-':
+        return _report_batch(_process_batch(args, _read_records(sys.stdin, '-'), jobs))
+    with open(config.batch, encoding='utf-8', newline='') as f:
+        return _report_batch(_process_batch(args, _read_records(f, config.batch), jobs))
+
+
+def _report_batch(results):
+    """\
+    Writes the terminal output of the QR codes to stdout and the errors
+    and the progress to stderr.
+    """
+    stderr = sys.stderr
+    show_progress = stderr.isatty()
+    # Overwrite the progress indicator
+    prefix = '\r' if show_progress else ''
+    created = errors = 0
+    for recno, ident, error, text in results:
+        if error is not None:
+            errors += 1
+            stderr.write(f'{prefix}Record {recno} (id: {ident}): {error}{os.linesep}')
+        else:
+            created += 1
+            if text is not None:
+                sys.stdout.write(text)
+        if show_progress and (created + errors) % 100 == 0:
+            stderr.write(f'\r{created + errors} records')
+            stderr.flush()
+    stderr.write(f'{prefix}Created {created} QR codes, {errors} errors{os.linesep}')
+    return 0 if not errors else 1
+
+
+def _read_records(f, name):
+    """\
+    Returns an iterator over ``(record number, record)`` tuples.
+
+    The format is determined by the file extension (".csv", ".jsonl",
+    ".ndjson"). Otherwise, the file is treated as JSON Lines file if the first
+    line starts with "{". Invalid records are returned as
+    :py:exc:`ValueError` instances.
+    """
+    ext = name[name.rfind('.') + 1:].lower()
+    lines = iter(f)
+    if ext not in ('csv', 'jsonl', 'ndjson'):
+        first = next(lines, '')
+        ext = 'jsonl' if first.lstrip().startswith('{') else 'csv'
+        lines = _chain_first(first, lines)
+    if ext == 'csv':
+        for recno, record in enumerate(csv.DictReader(lines), start=1):
+            if None in record:
+                record = ValueError('Unexpected number of fields')
+            yield recno, record
+        return
+    for recno, line in enumerate((line for line in lines if line.strip()), start=1):
+        try:
+            record = json.loads(line)
+        except ValueError as ex:
+            record = ValueError(f'Invalid JSON: {ex}')
+        if not isinstance(record, (dict, ValueError)):
+            record = ValueError('Expected a JSON object')
+        yield recno, record
+
+
+def _chain_first(first, lines):
+    yield first
+    yield from lines
+
+
+def _process_batch(args, records, jobs):
+    """\
+    Creates the QR codes and returns an iterator over the results in the
+    order of the records.
+
+    The records are consumed lazily, only a limited number of records is
+    passed to the worker processes at the same time.
+    """
+    chunks = _chunks(records, _BATCH_CHUNK_SIZE)
+    if jobs == 1:
+        _init_batch_worker(args)
+        for chunk in chunks:
+            yield from _create_batch_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker, initargs=(args,)) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_create_batch_chunk, chunk))
+            if len(pending) >= jobs * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _raise_value_error(message):
+    raise ValueError(message)
+
+
+def _init_batch_worker(args):
+    """\
+    Initializes the state of a (worker) process which creates QR codes.
+    """
+    global _batch_state
+    parser = make_parser()
+    # Report invalid records as ValueError instead of terminating the process
+    parser.error = _raise_value_error
+    config = _parse(parser, args)
+    cache = RenderCache(config.cache) if config.cache is not None else None
+    _batch_state = parser, args, config.output_pattern, cache
+
+
+def _create_batch_chunk(chunk):
+    """\
+    Creates the QR codes of the provided records and returns a list of
+    ``(record number, id, error, terminal output)`` tuples.
+    """
+    results = []
+    for recno, record in chunk:
+        ident = recno
+        try:
+            if isinstance(record, ValueError):
+                raise record
+            ident = record.get('id')
+            if ident is None or ident == '':
+                ident = recno
+            text = _create_batch_code(record, ident)
+            results.append((recno, ident, None, text))
+        except Exception as ex:
+            results.append((recno, ident, str(ex) or ex.__class__.__name__, None))
+    return results
+
+
+def _create_batch_code(record, ident):
+    """\
+    Creates the QR code of the record and returns the terminal output or
+    ``None`` if the QR code was written into a file.
+    """
+    parser, args, pattern, cache = _batch_state
+    content = record.get('content')
+    if content is None:
+        raise ValueError('The record provides no "content"')
+    options = {name: value for name, value in record.items() if name not in ('id', 'content')}
+    config = _parse(parser, args + _options_to_args(parser, options, _BATCH_OPTIONS) + ['--', str(content)])
+    config.pop('cache')
+    qr = make_code(config, cache)
+    output = config.pop('output')
+    if output is None and pattern not in (None, '-'):
+        output = pattern.format_map(dict(record, id=ident))
+    if output is None or output == '-':
+        out = io.StringIO()
+        qr.terminal(out, border=config['border'], compact=config.get('compact', False))
+        return out.getvalue()
+    directory = os.path.dirname(output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if cache is not None and isinstance(qr, segno.QRCode):
+        cache.save(qr, output, **build_config(config, filename=output))
+    else:
+        qr.save(output, **build_config(config, filename=output))
+    return None
+
+
+def _options_to_args(parser, options, unsupported):
+    """\
+    Converts the options into command line arguments.
+
+    :param parser: The command line parser.
+    :param dict options: Maps the long option names (without leading dashes,
+            dashes may be replaced by underscores) to the values. Flags are
+            set if the value is ``True`` or "1", "true", "yes". Empty values
+            are ignored.
+    :param unsupported: Names (with underscores) of options which must not be
+            used.
+    :raises: :py:exc:`ValueError` in case of an unknown or unsupported option.
+    :rtype: list
+    """
+    args = []
+    for name, value in options.items():
+        if value is None or value == '':
+            continue
+        name = name.replace('-', '_')
+        option = '--' + name.replace('_', '-')
+        action = parser._option_string_actions.get(option)
+        if action is None:
+            raise ValueError(f'Unknown option "{name}"')
+        # --help and --ver terminate the process
+        if name in unsupported or action.dest in ('help', 'ver'):
+            raise ValueError(f'Unsupported option "{name}"')
+        if action.nargs == 0:  # Flag
+            if value is True or str(value).lower() in ('1', 'true', 'yes'):
+                args.append(option)
+        else:
+            args.append(f'{option}={value}')
+    return args
+
+
 class _AttrDict(dict):
     """\
     Internal helper class.
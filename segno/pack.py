@@ -0,0 +1,260 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Compact binary container ("QR pack") for many QR codes.
+
+A QR pack stores the matrices of the QR codes packed into bits, eight modules
+per byte. The records are appended while the pack is written, the index is
+written when the pack is closed. Reading a pack does not load it into memory,
+the file is memory-mapped and each QR code is accessible by its record number.
+
+.. code-block:: python
+
+    >>> import segno
+    >>> from segno import pack
+    >>> with pack.PackWriter('tickets.qrp') as writer:
+    ...     for i in range(100000):
+    ...         writer.add(segno.make(f'Ticket {i}'))
+    >>> with pack.PackReader('tickets.qrp') as tickets:
+    ...     tickets[4711].save('ticket-4711.png', scale=4)
+
+File format (all integers are little endian):
+
+Header
+    Magic ``SEGNOQRP``, format version (uint32), reserved (uint32).
+Records
+    The rows of each matrix, one bit per module (the most significant bit is
+    the first module). Each row is padded to a full byte.
+Index
+    One entry per record: offset of the record (uint64), width (uint16),
+    height (uint16), version, error correction level, mask, and mode
+    (int8 each, ``-128`` indicates ``None``).
+Trailer
+    Offset of the index (uint64), number of records (uint64), magic
+    ``SEGNOEND``.
+"""
+import os
+import mmap
+from struct import Struct
+from . import QRCode
+from .writers import _pack_matrix, _unpack_matrix, _packed_matrix_size
+
+__all__ = ('PackWriter', 'PackReader', 'PackedQRCode')
+
+_MAGIC = b'SEGNOQRP'
+_TRAILER_MAGIC = b'SEGNOEND'
+_FORMAT_VERSION = 1
+_HEADER = Struct('<8sII')
+_INDEX_ENTRY = Struct('<QHHbbbb')
+_TRAILER = Struct('<QQ8s')
+_NONE = -128
+
+
+def _encode_optional(value):
+    return _NONE if value is None else value
+
+
+def _decode_optional(value):
+    return None if value == _NONE else value
+
+
+class PackWriter:
+    """\
+    Writes QR codes into a QR pack.
+
+    The records are written immediately, only the index (16 bytes per QR
+    code) is kept in memory until the pack is closed.
+
+    :param out: A filename or a writable file-like object which accepts
+            bytes. The file-like object does not need to be seekable.
+    """
+    def __init__(self, out):
+        try:
+            out.write
+            self._file = out
+            self._close_file = False
+        except AttributeError:
+            self._file = open(out, 'wb')
+            self._close_file = True
+        header = _HEADER.pack(_MAGIC, _FORMAT_VERSION, 0)
+        self._file.write(header)
+        self._position = len(header)
+        self._index = bytearray()
+        self._count = 0
+
+    def add(self, qrcode):
+        """\
+        Appends the QR code to the pack.
+
+        :param qrcode: A :py:class:`segno.QRCode` instance.
+        :rtype: int
+        :return: The record number of the QR code.
+        """
+        if self._file is None:
+            raise ValueError('The pack is closed')
+        matrix = qrcode.matrix
+        width, height = len(matrix[0]), len(matrix)
+        data = _pack_matrix(matrix)
+        self._file.write(data)
+        self._index += _INDEX_ENTRY.pack(self._position, width, height, qrcode._version,
+                                         _encode_optional(qrcode._error), qrcode.mask,
+                                         _encode_optional(qrcode._mode))
+        self._position += len(data)
+        self._count += 1
+        return self._count - 1
+
+    def close(self):
+        """\
+        Writes the index and finishes the pack. A file-like object provided
+        as `out` is not closed.
+        """
+        if self._file is None:
+            return
+        self._file.write(bytes(self._index) + _TRAILER.pack(self._position, self._count, _TRAILER_MAGIC))
+        if self._close_file:
+            self._file.close()
+        self._file = None
+        self._index = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class PackReader:
+    """\
+    Provides access to the QR codes of a QR pack.
+
+    Files are memory-mapped, the QR codes are decoded on demand. Accessing a
+    QR code by its record number does not depend on the size of the pack.
+
+    :param source: A filename or a bytes-like object which provides the
+            content of the pack.
+    """
+    def __init__(self, source):
+        self._file = None
+        if isinstance(source, (str, os.PathLike)):
+            self._file = open(source, 'rb')
+            try:
+                buff = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty file
+                buff = b''
+        else:
+            buff = source
+        self._buffer = buff
+        try:
+            self._read_header()
+        except ValueError:
+            self.close()
+            raise
+
+    def _read_header(self):
+        buff = self._buffer
+        if len(buff) < _HEADER.size + _TRAILER.size:
+            raise ValueError('Not a QR pack')
+        magic, version, _ = _HEADER.unpack_from(buff)
+        if magic != _MAGIC:
+            raise ValueError('Not a QR pack')
+        if version != _FORMAT_VERSION:
+            raise ValueError(f'Unsupported QR pack format version "{version}"')
+        index_offset, count, magic = _TRAILER.unpack_from(buff, len(buff) - _TRAILER.size)
+        if magic != _TRAILER_MAGIC or index_offset + count * _INDEX_ENTRY.size + _TRAILER.size != len(buff):
+            raise ValueError('Incomplete QR pack, the index is missing')
+        self._index_offset = index_offset
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        """\
+        Returns the QR code with the provided record number.
+
+        :param int index: The record number, negative values are counted from
+                the end.
+        :rtype: PackedQRCode
+        """
+        if self._buffer is None:
+            raise ValueError('The pack is closed')
+        index = int(index)
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('Record number out of range')
+        return PackedQRCode(self, *_INDEX_ENTRY.unpack_from(self._buffer,
+                                                            self._index_offset + index * _INDEX_ENTRY.size))
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def _read_matrix(self, offset, width, height):
+        """\
+        Returns the matrix of the record at the provided offset.
+
+        The record is read through a memory view, it is not copied.
+        """
+        if self._buffer is None:
+            raise ValueError('The pack is closed')
+        with memoryview(self._buffer) as view, \
+                view[offset:offset + _packed_matrix_size(width, height)] as record:
+            return _unpack_matrix(record, width, height)
+
+    def close(self):
+        """\
+        Closes the pack. QR codes which were decoded already remain usable.
+        """
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._buffer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class PackedQRCode(QRCode):
+    """\
+    A :py:class:`segno.QRCode` stored in a QR pack.
+
+    The matrix is decoded when it is accessed for the first time, all other
+    methods of :py:class:`segno.QRCode` are supported.
+    """
+    __slots__ = ('_pack', '_offset', '_matrix')
+
+    def __init__(self, pack, offset, width, height, version, error, mask, mode):
+        self._pack = pack
+        self._offset = offset
+        self._matrix = None
+        self._matrix_size = width, height
+        self._version = version
+        self._error = _decode_optional(error)
+        self.mask = mask
+        self._mode = _decode_optional(mode)
+
+    @property
+    def matrix(self):
+        """\
+        Returns the matrix.
+
+        :rtype: tuple of :py:class:`bytearray` instances.
+        """
+        if self._matrix is None:
+            self._matrix = self._pack._read_matrix(self._offset, *self._matrix_size)
+        return self._matrix
+
+    def __eq__(self, other):
+        return isinstance(other, QRCode) and self.matrix == other.matrix
+
+    __hash__ = None
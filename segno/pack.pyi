@@ -0,0 +1,36 @@
+from . import QRCode
+import os
+from typing import IO, Any, Iterator
+
+
+class PackWriter:
+    def __init__(self, out: str | os.PathLike | IO[bytes]) -> None: ...
+
+    def add(self, qrcode: QRCode) -> int: ...
+
+    def close(self) -> None: ...
+
+    def __enter__(self) -> PackWriter: ...
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None: ...
+
+
+class PackReader:
+    def __init__(self, source: str | os.PathLike | bytes | bytearray | memoryview) -> None: ...
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: int) -> PackedQRCode: ...
+
+    def __iter__(self) -> Iterator[PackedQRCode]: ...
+
+    def close(self) -> None: ...
+
+    def __enter__(self) -> PackReader: ...
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None: ...
+
+
+class PackedQRCode(QRCode):
+    def __init__(self, pack: PackReader, offset: int, width: int, height: int,
+                 version: int, error: int, mask: int, mode: int) -> None: ...
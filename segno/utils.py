@@ -10,12 +10,16 @@ Utility functions useful for writers or QR Code objects.
 
 DOES NOT belong to the public API.
 """
-from itertools import chain, repeat
+from itertools import chain, repeat, groupby
+from operator import sub
+from functools import lru_cache
 from . import consts
 
 __all__ = ('get_default_border_size', 'get_border', 'get_symbol_size',
            'check_valid_scale', 'check_valid_border', 'matrix_to_lines',
-           'matrix_iter', 'matrix_iter_verbose')
+           'matrix_to_outlines',
+           'matrix_iter', 'matrix_iter_verbose', 'matrix_iter_module_codes',
+           'get_module_type_template', 'MODULE_CODE_TO_TYPE')
 
 
 def get_default_border_size(matrix_size):
@@ -119,6 +123,84 @@ def matrix_to_lines(matrix, x, y, incby=1):
             last_bit = 0x0
 
 
+def matrix_to_outlines(matrix, x=0, y=0):
+    """\
+    Converts the dark modules of the `matrix` into a list of polygons which
+    outline the dark areas.
+
+    Each polygon is a list of (x, y) tuples which represent the corners of the
+    polygon. The first edge of each polygon is a horizontal line, horizontal
+    and vertical edges alternate. The last corner is connected to the first
+    corner, the polygons are implicitly closed.
+
+    The y-axis points downwards. The outer outlines are oriented clockwise,
+    the outlines of holes are oriented counterclockwise, the polygons must be
+    filled with the "nonzero" (or "evenodd") rule.
+    Diagonally adjacent dark modules are not merged into one polygon.
+
+    :param matrix: A sequence of bytearrays.
+    :param x: Initial position on the x-axis (default: 0).
+    :param y: Initial position on the y-axis (default: 0).
+    :rtype: list of lists of (x, y) tuples
+    """
+    height = len(matrix)
+    width = len(matrix[0]) if height else 0
+    # Edges are stored as (start point, direction) -> end point
+    # Horizontal edges, direction 1: dark module below, -1: dark module above
+    hedges = {}
+    above = bytes(width)
+    for i in range(height + 1):
+        below = matrix[i] if i < height else bytes(width)
+        j = 0
+        for direction, run in groupby(map(sub, below, above)):
+            n = sum(1 for _ in run)
+            if direction == 1:
+                hedges[(j, i), 1] = j + n, i
+            elif direction == -1:
+                hedges[(j + n, i), -1] = j, i
+            j += n
+        above = below
+    # Vertical edges, direction 1: dark module left, -1: dark module right
+    vedges = {}
+    columns = tuple(zip(*matrix))
+    left = bytes(height)
+    for j in range(width + 1):
+        right = columns[j] if j < width else bytes(height)
+        i = 0
+        for direction, run in groupby(map(sub, left, right)):
+            n = sum(1 for _ in run)
+            if direction == 1:
+                vedges[(j, i), 1] = j, i + n
+            elif direction == -1:
+                vedges[(j, i + n), -1] = j, i
+            i += n
+        left = right
+    polygons = []
+    while hedges:
+        start = key = next(iter(hedges))
+        corners = []
+        while True:
+            point, direction = key
+            end = hedges.pop(key)
+            corners.append(point)
+            corners.append(end)
+            # Turn right, if possible, otherwise turn left
+            key = end, direction
+            if key not in vedges:
+                key = end, -direction
+            direction = key[1]
+            end = vedges.pop(key)
+            for key in ((end, -direction), (end, direction)):
+                if key == start or key in hedges:
+                    break
+            if key == start:
+                break
+        if x or y:
+            corners = [(cx + x, cy + y) for cx, cy in corners]
+        polygons.append(corners)
+    return polygons
+
+
 def matrix_iter(matrix, matrix_size, scale=1, border=None):
     """\
     Returns an iterator / generator over the provided matrix which includes
@@ -168,11 +250,98 @@ def matrix_iter_verbose(matrix, matrix_size, scale=1, border=None):
             default quiet zone (4 for QR Codes, 2 for Micro QR Codes).
     :raises: :py:exc:`ValueError` if an illegal scale or border value is provided
     """
-    from segno import encoder
     check_valid_border(border)
     scale = int(scale)
     check_valid_scale(scale)
     border = get_border(matrix_size, border)
+    to_module_type = MODULE_CODE_TO_TYPE.__getitem__
+    for codes in matrix_iter_module_codes(matrix, matrix_size, border):
+        row = tuple(map(to_module_type, codes))
+        if scale > 1:
+            row = tuple(chain.from_iterable(repeat(mt, scale) for mt in row))
+        for s in repeat(None, scale):
+            yield row
+
+
+def matrix_iter_module_codes(matrix, matrix_size, border):
+    """\
+    Returns an iterator over the module codes of the provided matrix which
+    includes the border but does not support any scaling factor.
+
+    Each row is a :py:class:`bytes` object. A module code is the code of the
+    module type (see :py:func:`get_module_type_template`) combined with the
+    module value (``0x0`` or ``0x1``) in its lowest bit. Use
+    :py:data:`MODULE_CODE_TO_TYPE` to translate the codes into module types,
+    or translate whole rows with :py:meth:`bytes.translate`.
+
+    :param matrix: An iterable of bytearrays.
+    :param tuple(int, int) matrix_size: Tuple of width and height of the matrix.
+    :param int border: The border size.
+    """
+    width = matrix_size[0]
+    row_length = width + 2 * border
+    border_row = bytes([_CODE_QUIET_ZONE]) * row_length
+    quiet_zone = bytes([_CODE_QUIET_ZONE]) * border
+    for s in repeat(None, border):
+        yield border_row
+    for template_row, row in zip(get_module_type_template(matrix_size), matrix):
+        # The template codes are even numbers, the module value occupies the
+        # lowest bit: A bitwise OR of the whole rows combines them.
+        codes = (int.from_bytes(template_row, 'big') | int.from_bytes(row, 'big')).to_bytes(width, 'big')
+        yield quiet_zone + codes + quiet_zone
+    for s in repeat(None, border):
+        yield border_row
+
+
+# Codes of the module types which are used by the module type template.
+# All codes are even, the lowest bit is reserved for the module value.
+# Most codes are equal to the light module type, the codes of module types
+# which do not depend on the module value are listed below.
+_CODE_DARKMODULE = 2
+_CODE_ALIGNMENT_PATTERN_DARK = 20
+_CODE_QUIET_ZONE = consts.TYPE_QUIET_ZONE
+
+
+def _make_code_to_type_table():
+    table = [None] * 256
+    for mt in (consts.TYPE_DATA_LIGHT, consts.TYPE_FINDER_PATTERN_LIGHT,
+               consts.TYPE_TIMING_LIGHT, consts.TYPE_FORMAT_LIGHT,
+               consts.TYPE_VERSION_LIGHT):
+        table[mt] = mt
+        table[mt | 0x1] = mt << 8
+    for code, mt in ((consts.TYPE_SEPARATOR, consts.TYPE_SEPARATOR),
+                     (consts.TYPE_ALIGNMENT_PATTERN_LIGHT, consts.TYPE_ALIGNMENT_PATTERN_LIGHT),
+                     (_CODE_ALIGNMENT_PATTERN_DARK, consts.TYPE_ALIGNMENT_PATTERN_DARK),
+                     (_CODE_DARKMODULE, consts.TYPE_DARKMODULE),
+                     (_CODE_QUIET_ZONE, consts.TYPE_QUIET_ZONE)):
+        table[code] = mt
+        table[code | 0x1] = mt
+    return tuple(table)
+
+
+MODULE_CODE_TO_TYPE = _make_code_to_type_table()
+"""\
+Tuple which maps a module code (see :py:func:`matrix_iter_module_codes`) to
+the module type (see :py:mod:`segno.consts`).
+"""
+
+
+@lru_cache(maxsize=64)
+def get_module_type_template(matrix_size):
+    """\
+    Returns the module type template for a matrix of the provided size.
+
+    The template is a tuple of :py:class:`bytes` objects (one per row) which
+    contains the code of the module type for each module. The codes are even
+    numbers which can be combined with the module value (see
+    :py:func:`matrix_iter_module_codes`).
+
+    The template depends on the matrix size only and is cached.
+
+    :param tuple(int, int) matrix_size: Tuple of width and height of the matrix.
+    :rtype: tuple of bytes
+    """
+    from segno import encoder
     width, height = matrix_size
     is_square = width == height
     is_micro = is_square and width < 21  # 21 == QR Code version 1
@@ -180,46 +349,38 @@ def matrix_iter_verbose(matrix, matrix_size, scale=1, border=None):
     alignment_matrix = encoder.make_matrix(width, height, reserve_regions=False, add_timing=False)
     encoder.add_alignment_patterns(alignment_matrix, width, height)
 
-    def get_bit(i, j):
-        # Check if we operate upon the matrix or the "virtual" border
-        if 0 <= i < height and 0 <= j < width:
-            val = matrix[i][j]
-            if not is_micro:
-                # Alignment pattern
-                alignment_val = alignment_matrix[i][j]
-                if alignment_val != 0x2:
-                    return (consts.TYPE_ALIGNMENT_PATTERN_LIGHT, consts.TYPE_ALIGNMENT_PATTERN_DARK)[alignment_val]
-                if is_square and width > 41:  # QR Codes < version 7 do not carry any version information
-                    if i < 6 and width - 12 < j < width - 8 \
-                            or height - 12 < i < height - 8 and j < 6:
-                        return (consts.TYPE_VERSION_LIGHT, consts.TYPE_VERSION_DARK)[val]
-                # Dark module
-                if i == height - 8 and j == 8:
-                    return consts.TYPE_DARKMODULE
-            # Timing - IMPORTANT: Check alignment (see above) in advance!
-            if not is_micro and ((i == 6 and 7 < j < width - 8) or (j == 6 and 7 < i < height - 8)) \
-                    or is_micro and (i == 0 and j > 7 or j == 0 and i > 7):
-                return (consts.TYPE_TIMING_LIGHT, consts.TYPE_TIMING_DARK)[val]
-            # Format - IMPORTANT: Check timing (see above) in advance!
-            if i == 8 and (j < 9 or (not is_micro and j > width - 10)) \
-                    or j == 8 and (i < 8 or not is_micro and i > height - 9):
-                return (consts.TYPE_FORMAT_LIGHT, consts.TYPE_FORMAT_DARK)[val]
-            # Finder pattern
-            # top left             top right
-            if i < 7 and (j < 7 or (not is_micro and j > width - 8)) \
-                    or not is_micro and i > height - 8 and j < 7:  # bottom left
-                return (consts.TYPE_FINDER_PATTERN_LIGHT, consts.TYPE_FINDER_PATTERN_DARK)[val]
-            # Separator
-            # top left              top right
-            if i < 8 and (j < 8 or (not is_micro and j > width - 9)) \
-                    or not is_micro and (i > height - 9 and j < 8):  # bottom left
-                return consts.TYPE_SEPARATOR
-            return (consts.TYPE_DATA_LIGHT, consts.TYPE_DATA_DARK)[val]
-        else:
-            return consts.TYPE_QUIET_ZONE
-
-    width_range, height_range = range(-border, width + border), range(-border, height + border)
-    for i in height_range:
-        row = tuple(chain.from_iterable(repeat(get_bit(i, j), scale) for j in width_range))
-        for s in repeat(None, scale):
-            yield row
+    def get_code(i, j):
+        if not is_micro:
+            # Alignment pattern
+            alignment_val = alignment_matrix[i][j]
+            if alignment_val != 0x2:
+                return (consts.TYPE_ALIGNMENT_PATTERN_LIGHT, _CODE_ALIGNMENT_PATTERN_DARK)[alignment_val]
+            if is_square and width > 41:  # QR Codes < version 7 do not carry any version information
+                if i < 6 and width - 12 < j < width - 8 \
+                        or height - 12 < i < height - 8 and j < 6:
+                    return consts.TYPE_VERSION_LIGHT
+            # Dark module
+            if i == height - 8 and j == 8:
+                return _CODE_DARKMODULE
+        # Timing - IMPORTANT: Check alignment (see above) in advance!
+        if not is_micro and ((i == 6 and 7 < j < width - 8) or (j == 6 and 7 < i < height - 8)) \
+                or is_micro and (i == 0 and j > 7 or j == 0 and i > 7):
+            return consts.TYPE_TIMING_LIGHT
+        # Format - IMPORTANT: Check timing (see above) in advance!
+        if i == 8 and (j < 9 or (not is_micro and j > width - 10)) \
+                or j == 8 and (i < 8 or not is_micro and i > height - 9):
+            return consts.TYPE_FORMAT_LIGHT
+        # Finder pattern
+        # top left             top right
+        if i < 7 and (j < 7 or (not is_micro and j > width - 8)) \
+                or not is_micro and i > height - 8 and j < 7:  # bottom left
+            return consts.TYPE_FINDER_PATTERN_LIGHT
+        # Separator
+        # top left              top right
+        if i < 8 and (j < 8 or (not is_micro and j > width - 9)) \
+                or not is_micro and (i > height - 9 and j < 8):  # bottom left
+            return consts.TYPE_SEPARATOR
+        return consts.TYPE_DATA_LIGHT
+
+    width_range = range(width)
+    return tuple(bytes([get_code(i, j) for j in width_range]) for i in range(height))
@@ -0,0 +1,367 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+HTTP server which renders QR codes.
+
+The QR codes are requested by ``GET /qr.<kind>?data=<content>&<options>``,
+i.e. ``/qr.png?data=Strawberry+Fields&scale=4&dark=darkblue``. Supported
+formats are PNG, SVG, PDF, EPS and text. The parameter ``data`` provides the
+content of the QR code, all other parameters correspond to the long options
+of the command line script (i.e. ``scale``, ``border``, ``dark``, ``error``,
+``version``, or ``micro``).
+
+The rendered documents are kept in a size-limited in-memory cache. Each
+response provides an ETag which is derived from the normalized parameters,
+conditional requests (``If-None-Match``) are answered with
+``304 Not Modified`` without rendering the QR code. The ETags of PDF and EPS
+documents are weak since the documents contain the creation date. Requests
+which may exceed the maximum image size are rejected. ``GET /metrics``
+returns the number of requests, the cache hit rate and the render latency
+as JSON object.
+
+The server is available as standalone server based on the standard library:
+
+.. code-block:: bash
+
+    $ segno --serve-http --port 8000
+    $ python -m segno.web --port 8000
+
+and as ASGI application which can be used with any ASGI server:
+
+.. code-block:: python
+
+    >>> from segno import web
+    >>> app = web.app(cache_size=64 * 1024 * 1024)
+"""
+import sys
+import json
+import time
+import asyncio
+import hashlib
+import argparse
+import threading
+from collections import OrderedDict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qsl
+import segno
+from . import cli
+
+__all__ = ('RenderService', 'app', 'make_server', 'serve')
+
+_CONTENT_TYPES = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+    'pdf': 'application/pdf',
+    'eps': 'application/postscript',
+    'txt': 'text/plain',
+}
+# Options of the command line script which are used to create the QR code
+_MAKE_OPTIONS = ('mode', 'error', 'version', 'pattern', 'encoding', 'boost_error', 'micro')
+# Options of the command line script which are not supported as parameters
+_UNSUPPORTED_OPTIONS = frozenset(('output', 'outline_pattern', 'batch', 'output_pattern', 'jobs', 'cache',
+                                  'serve_stdio', 'serve_http', 'host', 'port', 'seq', 'symbol_count',
+                                  'compact'))
+# Formats which contain the creation date, the documents are not reproducible
+_TIMESTAMPED_KINDS = frozenset(('pdf', 'eps'))
+_DEFAULT_CACHE_SIZE = 32 * 1024 * 1024
+_DEFAULT_MAX_AGE = 24 * 60 * 60
+_DEFAULT_MAX_SIZE = 8192
+# Width of the largest QR code (version 40) in modules
+_MAX_SYMBOL_WIDTH = 177
+
+
+class RenderService:
+    """\
+    Renders QR codes for HTTP requests, independent of a specific server.
+
+    :param int cache_size: Maximum size of the cached documents in bytes.
+            ``0`` disables the cache.
+    :param int max_age: Value of the ``max-age`` directive of the
+            ``Cache-Control`` header in seconds.
+    :param int max_size: Maximum width of an image in pixels. Requests are
+            rejected if the largest QR code (version 40) would exceed this
+            width with the requested scale and border.
+    """
+    def __init__(self, cache_size=_DEFAULT_CACHE_SIZE, max_age=_DEFAULT_MAX_AGE, max_size=_DEFAULT_MAX_SIZE):
+        if cache_size < 0:
+            raise ValueError(f'Invalid cache size "{cache_size}". Must not be negative')
+        if max_age < 0:
+            raise ValueError(f'Invalid max age "{max_age}". Must not be negative')
+        if max_size < 1:
+            raise ValueError(f'Invalid max size "{max_size}". Must be greater than zero')
+        self.cache_size = cache_size
+        self.max_age = max_age
+        self.max_size = max_size
+        self._parser = cli.make_parser()
+        # Report invalid parameters as ValueError instead of terminating the process
+        self._parser.error = cli._raise_value_error
+        self._cache = OrderedDict()  # Least recently used entries first
+        self._cache_bytes = 0
+        self._lock = threading.Lock()
+        self._requests = self._hits = self._misses = self._not_modified = self._errors = 0
+        self._render_time = 0.
+
+    def handle(self, method, target, if_none_match=None):
+        """\
+        Processes a request.
+
+        :param str method: The HTTP method.
+        :param str target: The request target, i.e. ``/qr.png?data=Penny+Lane``.
+        :param if_none_match: Value of the ``If-None-Match`` header or ``None``.
+        :return: A tuple ``(status, headers, body)``, headers is a list of
+                ``(name, value)`` tuples.
+        :rtype: tuple
+        """
+        with self._lock:
+            self._requests += 1
+        if method not in ('GET', 'HEAD'):
+            return self._error(405, 'Method not allowed', [('Allow', 'GET, HEAD')])
+        url = urlsplit(target)
+        if url.path == '/metrics':
+            return self._response(method, 200, 'application/json',
+                                  json.dumps(self.metrics()).encode('ascii'), [('Cache-Control', 'no-store')])
+        kind = url.path[4:] if url.path.startswith('/qr.') else None
+        content_type = _CONTENT_TYPES.get(kind)
+        if content_type is None:
+            return self._error(404, 'Not found')
+        try:
+            etag, render = self._prepare(kind, url.query)
+        except ValueError as ex:
+            return self._error(400, str(ex))
+        headers = [('ETag', etag), ('Cache-Control', f'public, max-age={self.max_age}')]
+        if if_none_match is not None and _etag_matches(if_none_match, etag):
+            with self._lock:
+                self._not_modified += 1
+            return 304, headers, b''
+        with self._lock:
+            body = self._cache.get(etag)
+            if body is not None:
+                self._cache.move_to_end(etag)
+                self._hits += 1
+        if body is None:
+            start = time.perf_counter()
+            try:
+                body = render()
+            except ValueError as ex:  # i.e. DataOverflowError
+                return self._error(400, str(ex))
+            self._store(etag, body, time.perf_counter() - start)
+        return self._response(method, 200, content_type, body, headers)
+
+    def metrics(self):
+        """\
+        Returns the number of requests, cache hits and misses and the render
+        latency.
+
+        :rtype: dict
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'requests': self._requests,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / lookups if lookups else 0.,
+                'not_modified': self._not_modified,
+                'errors': self._errors,
+                'render_seconds_total': self._render_time,
+                'render_seconds_avg': self._render_time / self._misses if self._misses else 0.,
+                'cache_entries': len(self._cache),
+                'cache_bytes': self._cache_bytes,
+            }
+
+    def _prepare(self, kind, query):
+        """\
+        Validates the parameters and returns the ETag and a function which
+        renders the QR code.
+        """
+        params = dict(parse_qsl(query, keep_blank_values=True))
+        content = params.pop('data', None)
+        if content is None:
+            raise ValueError('The parameter "data" is required')
+        parser = self._parser
+        config = cli._parse(parser, [*cli._options_to_args(parser, params, _UNSUPPORTED_OPTIONS), '--', content])
+        save_kw = cli.build_config(cli._AttrDict(config), filename=f'qr.{kind}')
+        border = save_kw.get('border')
+        width = (_MAX_SYMBOL_WIDTH + 2 * (border if border is not None else 4)) * save_kw.get('scale', 1)
+        if width > self.max_size:
+            raise ValueError(f'The image may exceed the maximum size of {self.max_size} pixels. '
+                             f'Reduce "scale" or "border"')
+        make_kw = sorted((name, config[name]) for name in _MAKE_OPTIONS)
+        key = repr((segno.__version__, kind, content, make_kw, sorted(save_kw.items())))
+        etag = f'"{hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]}"'
+        if kind in _TIMESTAMPED_KINDS:
+            etag = 'W/' + etag
+
+        def render():
+            return cli.make_code(config).save(None, kind=kind, **save_kw)
+
+        return etag, render
+
+    def _store(self, etag, body, render_time):
+        with self._lock:
+            self._misses += 1
+            self._render_time += render_time
+            if len(body) > self.cache_size or etag in self._cache:
+                return
+            self._cache[etag] = body
+            self._cache_bytes += len(body)
+            while self._cache_bytes > self.cache_size:
+                self._cache_bytes -= len(self._cache.popitem(last=False)[1])
+
+    def _error(self, status, message, headers=()):
+        with self._lock:
+            self._errors += 1
+        body = message.encode('utf-8')
+        return status, [('Content-Type', 'text/plain; charset=utf-8'),
+                        ('Content-Length', str(len(body))), *headers], body
+
+    @staticmethod
+    def _response(method, status, content_type, body, headers):
+        return status, [*headers, ('Content-Type', content_type), ('Content-Length', str(len(body)))], \
+            body if method != 'HEAD' else b''
+
+
+def _etag_matches(if_none_match, etag):
+    """\
+    Returns if the value of the ``If-None-Match`` header matches the ETag
+    (weak comparison).
+    """
+    if if_none_match.strip() == '*':
+        return True
+    if etag.startswith('W/'):
+        etag = etag[2:]
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag.startswith('W/'):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def app(cache_size=_DEFAULT_CACHE_SIZE, max_age=_DEFAULT_MAX_AGE, max_size=_DEFAULT_MAX_SIZE):
+    """\
+    Returns an ASGI application which renders QR codes.
+
+    The QR codes are rendered in the default executor of the event loop.
+    The :py:class:`RenderService` is available as ``service`` attribute of
+    the application.
+
+    See :py:class:`RenderService` for a description of the parameters.
+    """
+    service = RenderService(cache_size=cache_size, max_age=max_age, max_size=max_size)
+
+    async def application(scope, receive, send):
+        if scope['type'] == 'lifespan':
+            while True:
+                message = await receive()
+                if message['type'] == 'lifespan.startup':
+                    await send({'type': 'lifespan.startup.complete'})
+                elif message['type'] == 'lifespan.shutdown':
+                    await send({'type': 'lifespan.shutdown.complete'})
+                    return
+        if scope['type'] != 'http':
+            return
+        target = scope['path']
+        if scope.get('query_string'):
+            target += '?' + scope['query_string'].decode('latin-1')
+        if_none_match = None
+        for name, value in scope.get('headers', ()):
+            if name.lower() == b'if-none-match':
+                if_none_match = value.decode('latin-1')
+        status, headers, body = await asyncio.get_running_loop() \
+            .run_in_executor(None, service.handle, scope['method'], target, if_none_match)
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': [(name.lower().encode('latin-1'), value.encode('latin-1'))
+                                for name, value in headers]})
+        await send({'type': 'http.response.body', 'body': body})
+
+    application.service = service
+    return application
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    server_version = f'Segno/{segno.__version__}'
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        status, headers, body = self.server.service.handle(self.command, self.path,
+                                                           self.headers.get('If-None-Match'))
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.do_GET()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, service):
+        super().__init__(address, _RequestHandler)
+        self.service = service
+
+
+def make_server(host='127.0.0.1', port=8000, cache_size=_DEFAULT_CACHE_SIZE, max_age=_DEFAULT_MAX_AGE,
+                max_size=_DEFAULT_MAX_SIZE):
+    """\
+    Returns a :py:class:`http.server.ThreadingHTTPServer` which renders
+    QR codes. The server is bound to the address but does not handle
+    requests until ``serve_forever()`` is called.
+
+    The :py:class:`RenderService` is available as ``service`` attribute of
+    the server.
+
+    :param str host: The host name or IP address.
+    :param int port: The port. ``0`` selects an arbitrary unused port.
+
+    See :py:class:`RenderService` for a description of the other parameters.
+    """
+    return _Server((host, port), RenderService(cache_size=cache_size, max_age=max_age, max_size=max_size))
+
+
+def serve(host='127.0.0.1', port=8000, cache_size=_DEFAULT_CACHE_SIZE, max_age=_DEFAULT_MAX_AGE,
+          max_size=_DEFAULT_MAX_SIZE):
+    """\
+    Starts a server which renders QR codes until the process is interrupted.
+
+    See :py:func:`make_server` for a description of the parameters.
+    """
+    with make_server(host, port, cache_size=cache_size, max_age=max_age, max_size=max_size) as server:
+        host, port = server.server_address[:2]
+        sys.stderr.write(f'Serving QR codes on http://{host}:{port}/qr.png?data=Segno\n')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def main(args=sys.argv[1:]):
+    parser = argparse.ArgumentParser(prog='segno.web', description='HTTP server which renders QR codes')
+    parser.add_argument('--host', help='Host name or IP address (default: 127.0.0.1)', default='127.0.0.1')
+    parser.add_argument('--port', help='Port (default: 8000)', default=8000, type=int)
+    parser.add_argument('--cache-size', help='Maximum size of the in-memory cache in bytes',
+                        default=_DEFAULT_CACHE_SIZE, type=int)
+    parser.add_argument('--max-age', help='Value of the "max-age" directive of the Cache-Control header',
+                        default=_DEFAULT_MAX_AGE, type=int)
+    parser.add_argument('--max-size', help='Maximum width of an image in pixels (default: 8192)',
+                        default=_DEFAULT_MAX_SIZE, type=int)
+    parsed_args = parser.parse_args(args)
+    try:
+        serve(parsed_args.host, parsed_args.port, cache_size=parsed_args.cache_size, max_age=parsed_args.max_age,
+              max_size=parsed_args.max_size)
+    except ValueError as ex:
+        parser.error(str(ex))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
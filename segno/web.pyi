@@ -0,0 +1,31 @@
+from http.server import ThreadingHTTPServer
+from typing import Any, Awaitable, Callable
+
+
+class RenderService:
+    cache_size: int
+    max_age: int
+    max_size: int
+
+    def __init__(self, cache_size: int = ..., max_age: int = ..., max_size: int = ...) -> None: ...
+
+    def handle(self, method: str, target: str,
+               if_none_match: str | None = None) -> tuple[int, list[tuple[str, str]], bytes]: ...
+
+    def metrics(self) -> dict[str, int | float]: ...
+
+
+def app(cache_size: int = ..., max_age: int = ..., max_size: int = ...) \
+        -> Callable[[dict[str, Any], Callable[[], Awaitable[dict[str, Any]]],
+                     Callable[[dict[str, Any]], Awaitable[None]]], Awaitable[None]]: ...
+
+
+def make_server(host: str = '127.0.0.1', port: int = 8000, cache_size: int = ...,
+                max_age: int = ..., max_size: int = ...) -> ThreadingHTTPServer: ...
+
+
+def serve(host: str = '127.0.0.1', port: int = 8000, cache_size: int = ..., max_age: int = ...,
+          max_size: int = ...) -> None: ...
+
+
+def main(args: list[str] = ...) -> int: ...
@@ -0,0 +1,181 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Long-running process which creates QR codes on behalf of other programs.
+
+The process reads requests from stdin and writes the responses to stdout,
+each request and each response is a JSON object on a single line (JSON
+Lines). The process is started once and serves any number of requests, the
+next request may be sent before the response of the previous request was
+received. The responses are written in the order of the requests.
+
+Usage::
+
+    $ segno --serve-stdio [--jobs N] [--cache DIR]
+    $ python -m segno.worker [--jobs N] [--cache DIR]
+
+Request:
+
+.. code-block:: json
+
+    {"id": 42, "content": "Penny Lane", "kind": "png", "error": "h", "scale": 4}
+
+The field ``content`` is mandatory. ``kind`` indicates the serialization
+format (default: "png"). The fields ``error``, ``version``, ``mode``,
+``mask``, ``encoding``, ``eci``, ``micro`` and ``boost_error`` are passed to
+:py:func:`segno.make`, all other fields (except ``id``) are passed to
+:py:meth:`segno.QRCode.save`.
+
+Response:
+
+.. code-block:: json
+
+    {"id": 42, "kind": "png", "data": "iVBORw0KGgoAAAANSUhEUgAAAGQAAABkAQAAAAB..."}
+
+``data`` is the Base64 encoded document. If the request could not be
+processed, the response provides an ``error`` field with a description of
+the error instead of ``data``. The ``id`` of the request is returned as it
+is (``null`` if the request did not provide an ``id``).
+"""
+import os
+import sys
+import json
+import queue
+import base64
+import argparse
+import threading
+from concurrent.futures import ProcessPoolExecutor
+import segno
+from .cache import RenderCache
+
+__all__ = ('serve', 'handle_request')
+
+# Keywords of segno.make, all other keywords are passed to QRCode.save
+_MAKE_KEYWORDS = frozenset(('error', 'version', 'mode', 'mask', 'encoding', 'eci', 'micro', 'boost_error'))
+# Cache of the current (worker) process, see _init_process
+_cache = None
+
+
+def handle_request(line, cache=None):
+    """\
+    Processes a request and returns the response.
+
+    :param str line: The request, a JSON object.
+    :param cache: Optional :py:class:`segno.cache.RenderCache`.
+    :rtype: str
+    :return: The response, a JSON object without a trailing line break.
+    """
+    ident = None
+    try:
+        request = json.loads(line)
+        if not isinstance(request, dict):
+            raise ValueError('Expected a JSON object')
+        ident = request.pop('id', None)
+        try:
+            content = request.pop('content')
+        except KeyError:
+            raise ValueError('The request provides no "content"')
+        kind = request.pop('kind', 'png')
+        make_kw, save_kw = {}, {}
+        for name, value in request.items():
+            if isinstance(value, list):  # Colors, i.e. [255, 0, 0]
+                value = tuple(value)
+            (make_kw if name in _MAKE_KEYWORDS else save_kw)[name] = value
+        if cache is not None:
+            data = cache.save(cache.make(content, **make_kw), None, kind=kind, **save_kw)
+        else:
+            data = segno.make(content, **make_kw).save(None, kind=kind, **save_kw)
+        response = {'id': ident, 'kind': kind, 'data': base64.b64encode(data).decode('ascii')}
+    except Exception as ex:
+        response = {'id': ident, 'error': str(ex) or ex.__class__.__name__}
+    return json.dumps(response)
+
+
+def serve(requests=None, responses=None, jobs=1, cache=None):
+    """\
+    Reads requests until the input is exhausted and writes the responses.
+
+    Each response is flushed immediately.
+
+    :param requests: Iterable of requests (one JSON object per line).
+            If ``None`` (default), the requests are read from stdin.
+    :param responses: Text stream which receives the responses. If ``None``
+            (default), the responses are written to stdout.
+    :param int jobs: Number of worker processes. If ``1`` (default), the
+            requests are processed by the current process.
+    :param str cache: Optional directory of a :py:class:`segno.cache.RenderCache`.
+    """
+    if jobs < 1:
+        raise ValueError(f'Invalid number of jobs "{jobs}". Must be greater than zero')
+    requests = sys.stdin if requests is None else requests
+    responses = sys.stdout if responses is None else responses
+    lines = (line for line in requests if line.strip())
+    if jobs == 1:
+        cache = RenderCache(cache) if cache is not None else None
+        for line in lines:
+            _write_response(responses, handle_request(line, cache))
+        return
+    # The responses are written by a separate thread as soon as they are
+    # available, the bounded queue limits the number of pending requests
+    pending = queue.Queue(maxsize=jobs * 4)
+
+    def write_responses():
+        while True:
+            future = pending.get()
+            if future is None:
+                break
+            try:
+                response = future.result()
+            except Exception as ex:  # i.e. a terminated worker process
+                response = json.dumps({'id': None, 'error': str(ex) or ex.__class__.__name__})
+            _write_response(responses, response)
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_process, initargs=(cache,)) as executor:
+        writer = threading.Thread(target=write_responses, daemon=True)
+        writer.start()
+        try:
+            for line in lines:
+                pending.put(executor.submit(_handle_request, line))
+        finally:
+            pending.put(None)
+            writer.join()
+
+
+def _write_response(out, response):
+    out.write(response + '\n')
+    out.flush()
+
+
+def _init_process(cache):
+    global _cache
+    _cache = RenderCache(cache) if cache is not None else None
+
+
+def _handle_request(line):
+    return handle_request(line, _cache)
+
+
+def main(args=sys.argv[1:]):
+    parser = argparse.ArgumentParser(prog='segno.worker',
+                                     description='Creates QR codes, reads JSON Lines requests from stdin '
+                                                 'and writes the responses to stdout')
+    parser.add_argument('--jobs', '-j', help='Number of worker processes (default: 1). '
+                                             '0 uses a worker process per CPU',
+                        default=1, type=int)
+    parser.add_argument('--cache', help='Directory of a persistent cache')
+    parsed_args = parser.parse_args(args)
+    if parsed_args.jobs < 0:
+        parser.error('argument --jobs/-j: must not be negative')
+    try:
+        serve(jobs=parsed_args.jobs or os.cpu_count() or 1, cache=parsed_args.cache)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,12 @@
+from .cache import RenderCache
+from typing import Iterable, TextIO
+
+
+def handle_request(line: str, cache: RenderCache | None = None) -> str: ...
+
+
+def serve(requests: Iterable[str] | None = None, responses: TextIO | None = None,
+          jobs: int = 1, cache: str | None = None) -> None: ...
+
+
+def main(args: list[str] = ...) -> int: ...
@@ -17,32 +17,44 @@ bytearrays).
 import io
 import re
 import zlib
+import math
 import codecs
-import base64
 import gzip
+import hashlib
+import tarfile
+import zipfile
 from xml.sax.saxutils import quoteattr, escape
 from struct import pack
-from itertools import chain, repeat
+from binascii import b2a_base64
+from itertools import chain, repeat, count, islice
 import functools
+import inspect
+import contextvars
 from functools import partial
-from functools import reduce
 from operator import itemgetter
 from contextlib import contextmanager
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from types import MappingProxyType
 import time
 from . import consts
 from .utils import matrix_to_lines, get_symbol_size, get_border, \
-    check_valid_scale, check_valid_border, matrix_iter, matrix_iter_verbose
-from itertools import zip_longest
-from urllib.parse import quote
+    check_valid_scale, check_valid_border, matrix_iter, \
+    matrix_iter_module_codes, matrix_to_outlines, MODULE_CODE_TO_TYPE
+from itertools import zip_longest, groupby
 
 __all__ = ('writable', 'write_svg', 'write_png', 'write_eps', 'write_pdf',
-           'write_txt', 'write_pbm', 'write_pam', 'write_ppm', 'write_xpm',
-           'write_xbm', 'write_tex', 'write_terminal')
+           'write_pdf_pages', 'write_txt', 'write_pbm', 'write_pam',
+           'write_ppm', 'write_xpm', 'write_xbm', 'write_tiff', 'write_tiff_pages',
+           'write_zpl', 'write_zpl_labels', 'write_escpos', 'write_tex',
+           'write_terminal')
 
 # Standard creator name
 CREATOR = 'Segno <https://pypi.org/project/segno/>'
 
+# Minimum size of the chunks written by serializers which create the document
+# incrementally
+_CHUNK_SIZE = 8192
+
 
 @contextmanager
 def writable(file_or_path, mode, encoding=None):
@@ -74,6 +86,68 @@ def writable(file_or_path, mode, encoding=None):
             f.close()
 
 
+class _TextWriter:
+    """\
+    Adapter which decodes the written bytes and writes them to a text stream.
+    """
+    def __init__(self, stream, encoding):
+        self._write = stream.write
+        self._encoding = encoding
+
+    def write(self, b):
+        self._write(b.decode(self._encoding))
+        return len(b)
+
+
+@contextmanager
+def _byte_writer(file_or_path, mode, encoding=None):
+    """\
+    Returns a file-like object which accepts bytes.
+
+    The serializers create bytes and write them in large chunks through this
+    object. Filenames are always opened in binary mode. Streams are treated
+    like :py:func:`writable` would treat them:
+
+    * ``'wb'``: The bytes are written as they are.
+    * ``'wt'``: The bytes are decoded (UTF-8) and written as strings unless
+      the stream is known to be binary.
+    * ``'wt'`` with an `encoding`: The bytes are written as they are unless
+      the stream is a text stream (it provides an ``encoding``), these
+      streams receive the bytes decoded with the provided `encoding`.
+
+    :param file_or_path: Either a file-like object or a filename.
+    :param str mode: ``'wb'`` for binary documents, ``'wt'`` for text documents.
+    :param str encoding: Encoding of the bytes of an encoded text document.
+    :raises: :py:exc:`TypeError` if a binary document should be written to a
+            text stream.
+    """
+    try:
+        file_or_path.write
+    except AttributeError:
+        with open(file_or_path, 'wb') as f:
+            yield f
+        return
+    if mode == 'wb':
+        if isinstance(file_or_path, io.TextIOBase):
+            raise TypeError(f'Cannot write a binary document to the text stream {file_or_path!r}')
+        yield file_or_path
+    elif encoding is None:
+        yield file_or_path if _is_binary_stream(file_or_path) \
+            else _TextWriter(file_or_path, 'utf-8')
+    elif hasattr(file_or_path, 'encoding'):
+        yield _TextWriter(file_or_path, encoding)
+    else:
+        yield file_or_path
+
+
+def _is_binary_stream(stream):
+    """\
+    Returns if the provided stream is known to accept bytes.
+    """
+    return isinstance(stream, (io.RawIOBase, io.BufferedIOBase)) \
+        or 'b' in getattr(stream, 'mode', '')
+
+
 def colorful(dark, light):
     """\
     Decorator to inject a module type -> color mapping into the decorated function.
@@ -94,10 +168,32 @@ def colorful(dark, light):
                                 timing_light=timing_light, separator=separator,
                                 dark_module=dark_module, quiet_zone=quiet_zone)
             return f(matrix, matrix_size, out, cm, **kw)
+        # Used by Renderer to create the colormap in advance
+        wrapper.default_colors = {'dark': dark, 'light': light}
         return wrapper
     return decorate
 
 
+# Keywords of the functions decorated with :py:func:`colorful`
+_COLORMAP_KEYWORDS = ('dark', 'light', 'finder_dark', 'finder_light', 'data_dark',
+                      'data_light', 'version_dark', 'version_light', 'format_dark',
+                      'format_light', 'alignment_dark', 'alignment_light', 'timing_dark',
+                      'timing_light', 'separator', 'dark_module', 'quiet_zone')
+
+
+def _module_code_table(mapping):
+    """\
+    Returns a translation table for :py:meth:`bytes.translate` which maps
+    module codes (see :py:func:`segno.utils.matrix_iter_module_codes`) to the
+    values of the provided module type -> value mapping.
+
+    :param dict mapping: Module type -> integer (0 .. 255) mapping. Module types
+            which are not part of the mapping are translated to ``0``.
+    :rtype: bytes
+    """
+    return bytes([mapping.get(mt, 0) for mt in MODULE_CODE_TO_TYPE])
+
+
 def _valid_width_height_and_border(matrix_size, scale, border):
     """"\
     Validates the scale and border and returns the width, height and the border.
@@ -116,7 +212,7 @@ def _valid_width_height_and_border(matrix_size, scale, border):
 def write_svg(matrix, matrix_size, out, colormap, scale=1, border=None, xmldecl=True,
               svgns=True, title=None, desc=None, svgid=None, svgclass='segno',
               lineclass='qrline', omitsize=False, unit=None, encoding='utf-8',
-              svgversion=None, nl=True, draw_transparent=False):
+              svgversion=None, nl=True, draw_transparent=False, outline=False):
     """\
     Serializes the QR code as SVG document.
 
@@ -153,91 +249,182 @@ def write_svg(matrix, matrix_size, out, colormap, scale=1, border=None, xmldecl=
             (default: ``True``)
     :param bool draw_transparent: Indicates if transparent SVG paths should be
             added to the graphic (default: ``False``)
+    :param bool outline: Indicates if the modules should be drawn as filled
+            outlines instead of lines (default: ``False``)
+    """
+    omit_encoding = encoding is None
+    if omit_encoding:
+        encoding = 'utf-8'
+    chunks = _iter_svg(matrix, matrix_size, colormap, scale=scale, border=border,
+                       xmldecl=xmldecl, svgns=svgns, title=title, desc=desc,
+                       svgid=svgid, svgclass=svgclass, lineclass=lineclass,
+                       omitsize=omitsize, unit=unit,
+                       encoding=encoding if not omit_encoding else None,
+                       svgversion=svgversion, nl=nl,
+                       draw_transparent=draw_transparent, outline=outline)
+    with _byte_writer(out, 'wt', encoding) as f:
+        write = f.write
+        for chunk in chunks:
+            write(chunk.encode(encoding))
+
+
+def _iter_svg(matrix, matrix_size, colormap, scale=1, border=None, xmldecl=True,
+              svgns=True, title=None, desc=None, svgid=None, svgclass='segno',
+              lineclass='qrline', omitsize=False, unit=None, encoding='utf-8',
+              svgversion=None, nl=True, draw_transparent=False, outline=False):
+    """\
+    Validates the arguments and returns an iterator over the chunks (strings)
+    of the SVG document.
+
+    The arguments are validated and the path data of all paths is created
+    immediately since the paths are sorted by length. Only the joining of
+    the path data into chunks happens while the iterator is consumed, the
+    document as a whole is never created in memory.
+    See :py:func:`write_svg` for a description of the parameters. If
+    `encoding` is ``None``, the XML declaration won't have an encoding
+    attribute.
     """
     def svg_color(clr):
         return _color_to_webcolor(clr, allow_css3_colors=allow_css3_colors) if clr is not None else None
 
     def matrix_to_lines_verbose():
+        colors = list(set(colormap.values()))
+        table = _module_code_table({mt: colors.index(clr) for mt, clr in colormap.items()})
         j = -.5  # stroke width / 2
-        invalid_color = -1
-        for row in matrix_iter_verbose(matrix, matrix_size, scale=1, border=border):
-            last_color = invalid_color
-            x1, x2 = 0, 0
+        for codes in _module_codes(matrix, matrix_size, border):
+            x1 = 0
             j += 1
-            for c in (colormap[mt] for mt in row):
-                if last_color != invalid_color and last_color != c:
-                    yield last_color, (x1, x2, j)
-                    x1 = x2
-                x2 += 1
-                last_color = c
-            yield last_color, (x1, x2, j)
+            for color_idx, run in groupby(codes.translate(table)):
+                x2 = x1 + sum(1 for _ in run)
+                yield colors[color_idx], (x1, x2, j)
+                x1 = x2
+
+    def color_attrs(attr, color):
+        clr = svg_color(color)
+        if clr is None:
+            return ''
+        opacity = None
+        if isinstance(clr, tuple):
+            clr, opacity = clr
+        res = f' {attr}={quoteattr(clr)}'
+        if opacity is not None:
+            res += f' {attr}-opacity={quoteattr(str(opacity))}'
+        return res
+
+    def path_segments(coord):
+        moveto = 'M'
+        for x, y, length in coord:
+            yield f'{moveto}{x} {int(y) if int(y) == y else y}h{length}'
+            moveto = 'm'
+
+    def outline_segments(polygons):
+        moveto = 'M'
+        x, y = 0, 0
+        for polygon in polygons:
+            x1, y1 = polygon[0]
+            res = [f'{moveto}{x1 - x} {y1 - y}']
+            x, y = x1, y1
+            for i, (x2, y2) in enumerate(polygon[1:]):
+                res.append(f'h{x2 - x1}' if not i % 2 else f'v{y2 - y1}')
+                x1, y1 = x2, y2
+            res.append('z')
+            # Closing the path moves the current point back to the start of the polygon
+            yield ''.join(res)
+            moveto = 'm'
+
+    def multicolor_outlines():
+        codes = list(_module_codes(matrix, matrix_size, border))
+        colors = list(set(colormap.values()))
+        color_index = {mt: colors.index(clr) for mt, clr in colormap.items()}
+        table = _module_code_table(color_index)
+        # Keep the order of the colors stable: Order of appearance
+        for color_idx in dict.fromkeys(chain.from_iterable(row.translate(table) for row in codes)):
+            mask = _module_code_table({mt: int(idx == color_idx) for mt, idx in color_index.items()})
+            yield colors[color_idx], matrix_to_outlines([row.translate(mask) for row in codes])
+
+    def svg_footer():
+        return '{}</svg>{}'.format('</g>' if need_svg_group else '', '\n' if nl else '')
+
+    def iter_document(paths):
+        yield _svg_header(xmldecl, encoding, svgns, svgversion, omitsize, width, height,
+                          unit, svgid, svgclass, title, desc,
+                          scale_info if need_svg_group else None)
+        for _, path in paths:
+            yield from _chunked(path)
+        yield svg_footer()
 
     width, height, border = _valid_width_height_and_border(matrix_size, scale, border)
     unit = unit or ''
     if unit and omitsize:
         raise ValueError(f'The unit "{unit}" has no effect if the size '
                          '(width and height) is omitted.')
-    omit_encoding = encoding is None
-    if omit_encoding:
-        encoding = 'utf-8'
     allow_css3_colors = svgversion is not None and svgversion >= 2.0
     is_multicolor = len(set(colormap.values())) > 2
-    need_background = not is_multicolor and colormap[consts.TYPE_QUIET_ZONE] is not None and not draw_transparent
+    bg_color = colormap[consts.TYPE_QUIET_ZONE]
+    need_background = not is_multicolor and bg_color is not None and not draw_transparent
     need_svg_group = scale != 1 and (need_background or is_multicolor)
-    if is_multicolor:
-        miter = matrix_to_lines_verbose()
+    if outline:
+        if is_multicolor:
+            shapes = dict(multicolor_outlines())
+        else:
+            polygons = _matrix_to_outlines(matrix, border, border)
+            shapes = {colormap[consts.TYPE_DATA_DARK]: polygons} if polygons else {}
     else:
-        x, y = border, border + .5
-        dark = colormap[consts.TYPE_DATA_DARK]
-        miter = ((dark, (x1, x2, y1)) for (x1, y1), (x2, y2) in matrix_to_lines(matrix, x, y))
-    xy = defaultdict(lambda: (0, 0))
-    coordinates = defaultdict(list)
-    for clr, (x1, x2, y1) in miter:
-        x, y = xy[clr]
-        coordinates[clr].append((x1 - x, y1 - y, x2 - x1))
-        xy[clr] = x2, y1
+        if is_multicolor:
+            miter = matrix_to_lines_verbose()
+        else:
+            x, y = border, border + .5
+            dark = colormap[consts.TYPE_DATA_DARK]
+            miter = ((dark, (x1, x2, y1)) for (x1, y1), (x2, y2) in _matrix_to_lines(matrix, x, y))
+        xy = defaultdict(lambda: (0, 0))
+        shapes = defaultdict(list)
+        for clr, (x1, x2, y1) in miter:
+            x, y = xy[clr]
+            shapes[clr].append((x1 - x, y1 - y, x2 - x1))
+            xy[clr] = x2, y1
     if need_background:
-        # Additional path for the background, will be modified after
-        # the SVG paths have been generated
-        coordinates[colormap[consts.TYPE_QUIET_ZONE]] = [(0, 0, width // scale)]
+        # The background is drawn by its own path (see below)
+        shapes.pop(bg_color, None)
     if not draw_transparent:
-        try:
-            del coordinates[None]
-        except KeyError:
-            pass
-    paths = {}
+        shapes.pop(None, None)
     scale_info = f' transform="scale({scale})"' if scale != 1 else ''
     p = '<path{}{}'.format(scale_info if not need_svg_group else '',
                            '' if not lineclass else f' class={quoteattr(lineclass)}')
-    for color, coord in coordinates.items():
-        path = p
-        clr = svg_color(color)
-        if clr is not None:
-            opacity = None
-            if isinstance(clr, tuple):
-                clr, opacity = clr
-            path += f' stroke={quoteattr(clr)}'
-            if opacity is not None:
-                path += f' stroke-opacity={quoteattr(str(opacity))}'
-        path += ' d="'
-        path += ''.join('{moveto}{x} {y}h{l}'.format(moveto=('m' if i > 0 else 'M'),
-                                                     x=x, l=length,
-                                                     y=(int(y) if int(y) == y else y))
-                        for i, (x, y, length) in enumerate(coord))
-        path += '"/>'
-        paths[color] = path
+    color_attr, segments = ('stroke', path_segments) if not outline else ('fill', outline_segments)
+    paths = []
+    for color, shape in shapes.items():
+        # A transparent outline must not be filled with the default color (black)
+        attrs = color_attrs(color_attr, color) if color is not None or not outline else ' fill="none"'
+        path = [p + attrs + ' d="']
+        path.extend(segments(shape))
+        path.append('"/>')
+        paths.append((sum(map(len, path)), path))
     if need_background:
-        # This code is necessary since the path was generated by the loop above
-        # but the background path is special: It has no stroke-color but a fill-color.
-        # The fill-color needs to be closed. Further, it has no class attribute.
-        k = colormap[consts.TYPE_QUIET_ZONE]
-        paths[k] = re.sub(r'\sclass="[^"]+"', '',
-                          paths[k].replace('stroke', 'fill')
-                                  .replace('"/>', f'v{height // scale}h-{width // scale}z"/>'))
+        # The background path has no stroke color but a fill color and no class attribute
+        w, h = width // scale, height // scale
+        path = ['<path{} d="M0 0h{}v{}h-{}z"/>'.format(color_attrs('fill', bg_color), w, h, w)]
+        paths.append((len(path[0]), path))
+    # Shortest path first
+    paths.sort(key=itemgetter(0))
+    return iter_document(paths)
+
+
+@functools.lru_cache(maxsize=32)
+def _svg_header(xmldecl, encoding, svgns, svgversion, omitsize, width, height,
+                unit, svgid, svgclass, title, desc, group_attrs):
+    """\
+    Returns the start of a SVG document up to the first path.
+
+    The header depends on the options and the size of the image only, it is
+    cached since usually many QR codes are serialized with the same options.
+    See :py:func:`write_svg` for a description of the parameters. If
+    `group_attrs` is not ``None``, a group element with these attributes is
+    opened.
+    """
     svg = ''
     if xmldecl:
         svg += '<?xml version="1.0"'
-        if not omit_encoding:
+        if encoding is not None:
             svg += f' encoding={quoteattr(encoding)}'
         svg += '?>\n'
     svg += '<svg'
@@ -258,27 +445,104 @@ def write_svg(matrix, matrix_size, out, colormap, scale=1, border=None, xmldecl=
         svg += f'<title>{escape(title)}</title>'
     if desc is not None:
         svg += f'<desc>{escape(desc)}</desc>'
-    if need_svg_group:
-        svg += f'<g{scale_info}>'
-    svg += ''.join(sorted(paths.values(), key=len))
-    if need_svg_group:
-        svg += '</g>'
-    svg += '</svg>'
-    if nl:
-        svg += '\n'
-    with writable(out, 'wt', encoding=encoding) as f:
-        f.write(svg)
+    if group_attrs is not None:
+        svg += f'<g{group_attrs}>'
+    return svg
+
+
+def _chunked(iterable, size=_CHUNK_SIZE):
+    """\
+    Joins the strings (or bytes) provided by `iterable` into chunks of at
+    least `size` items (the last chunk may be shorter).
+
+    :param iterable: An iterable of strings or bytes.
+    :param int size: The minimum chunk size.
+    """
+    buff = []
+    length = 0
+    for s in iterable:
+        buff.append(s)
+        length += len(s)
+        if length >= size:
+            yield s[:0].join(buff)
+            buff = []
+            length = 0
+    if buff:
+        yield buff[0][:0].join(buff)
 
 
 _replace_quotes = partial(re.compile(br'(=)"([^"]+)"').sub, br"\1'\2'")
 
 
+def _make_percent_encoding_table(safe):
+    """\
+    Returns a translation table for :py:meth:`str.translate` which maps each
+    code point of a Latin-1 decoded byte string to its percent encoded
+    representation (like :py:func:`urllib.parse.quote`).
+
+    :param bytes safe: Characters which should not be encoded aside from
+            ASCII letters, digits and ``_.-~``.
+    """
+    safe = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-~' + safe
+    return tuple(chr(i) if i in safe else f'%{i:02X}' for i in range(256))
+
+
+_PERCENT_ENCODE = _make_percent_encoding_table(b'')
+_PERCENT_ENCODE_MINIMAL = _make_percent_encoding_table(b" :/='")
+
+
+@functools.lru_cache(maxsize=16)
+def _data_uri_prefix(mime_type, charset=None, base64=True):
+    """\
+    Returns the start of a data URI up to (and including) the comma.
+    """
+    return 'data:{}{}{},'.format(mime_type, f';charset={charset}' if charset else '',
+                                 ';base64' if base64 else '')
+
+
+class _DataURIWriter:
+    """\
+    File-like object which collects the written bytes as payload of a data URI.
+
+    In base64 mode, the bytes are encoded as soon as they arrive and only the
+    encoded data is kept. Otherwise, the payload is percent encoded by
+    :py:meth:`getvalue`.
+    """
+    def __init__(self, prefix, base64=True, encode_minimal=False):
+        self._prefix = prefix
+        self._parts = []
+        self._pending = b''
+        self._base64 = base64
+        self._table = _PERCENT_ENCODE if not encode_minimal else _PERCENT_ENCODE_MINIMAL
+
+    def write(self, b):
+        if self._base64:
+            data = self._pending + b if self._pending else bytes(b)
+            cut = len(data) - len(data) % 3
+            self._parts.append(b2a_base64(data[:cut], newline=False))
+            self._pending = data[cut:]
+        else:
+            self._parts.append(b)
+        return len(b)
+
+    def getvalue(self):
+        """\
+        Returns the data URI.
+
+        :rtype: str
+        """
+        data = b''.join(self._parts)
+        if self._base64:
+            return self._prefix + (data + b2a_base64(self._pending, newline=False)).decode('ascii')
+        return self._prefix + _replace_quotes(data).decode('latin-1').translate(self._table)
+
+
 def as_svg_data_uri(matrix, matrix_size, scale=1, border=None,
                     xmldecl=False, svgns=True, title=None,
                     desc=None, svgid=None, svgclass='segno',
                     lineclass='qrline', omitsize=False, unit='',
                     encoding='utf-8', svgversion=None, nl=False,
-                    encode_minimal=False, omit_charset=False, **kw):
+                    encode_minimal=False, omit_charset=False, base64=False, **kw):
     """\
     Converts the matrix to a SVG data URI.
 
@@ -287,24 +551,26 @@ def as_svg_data_uri(matrix, matrix_size, scale=1, border=None,
     ``True`` to enable it).
 
     Aside from the missing ``out`` parameter and the different ``xmldecl``
-    and ``nl`` default values and the additional parameter ``encode_minimal``
-    and ``omit_charset`` this function uses the same parameters as the
-    usual SVG serializer.
+    and ``nl`` default values and the additional parameters ``encode_minimal``,
+    ``omit_charset`` and ``base64`` this function uses the same parameters as
+    the usual SVG serializer.
 
     :param bool encode_minimal: Indicates if the resulting data URI should
                     use minimal percent encoding (disabled by default).
+                    Ignored if ``base64`` is ``True``.
     :param bool omit_charset: Indicates if the ``;charset=...`` should be omitted
                     (disabled by default)
+    :param bool base64: Indicates if the SVG document should be base64 encoded
+                    instead of percent encoded (disabled by default).
     :rtype: str
     """
-    encode = partial(quote, safe=b"") if not encode_minimal else partial(quote, safe=b" :/='")
-    buff = io.BytesIO()
+    prefix = _data_uri_prefix('image/svg+xml', encoding if not omit_charset else None, base64)
+    buff = _DataURIWriter(prefix, base64=base64, encode_minimal=encode_minimal)
     write_svg(matrix, matrix_size, buff, scale=scale, border=border, xmldecl=xmldecl,
               svgns=svgns, title=title, desc=desc, svgclass=svgclass,
               lineclass=lineclass, omitsize=omitsize, encoding=encoding,
               svgid=svgid, unit=unit, svgversion=svgversion, nl=nl, **kw)
-    return f'data:image/svg+xml{(";charset=" + encoding if not omit_charset else "")},' \
-           + encode(_replace_quotes(buff.getvalue()))
+    return buff.getvalue()
 
 
 def write_svg_debug(matrix, matrix_size, out, scale=15, border=None,
@@ -342,9 +608,10 @@ def write_svg_debug(matrix, matrix_size, out, scale=15, border=None,
         clr_mapping.update(colormap)
     width, height, border = _valid_width_height_and_border(matrix_size, scale, border)
     matrix_width, matrix_height = matrix_size
-    with writable(out, 'wt', encoding='utf-8') as f:
+    buff = []
+    write = buff.append
+    with _byte_writer(out, 'wt', 'utf-8') as f:
         legend = []
-        write = f.write
         write('<?xml version="1.0" encoding="utf-8"?>\n')
         write(f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}">')
         write('<style type="text/css"><![CDATA[ text { font-size: 1px; '
@@ -363,9 +630,11 @@ def write_svg_debug(matrix, matrix_size, out, scale=15, border=None,
         for x, y, val in legend:
             write(f'<text x="{x + .2}" y="{y + .9}">{val}</text>')
         write('</g></svg>\n')
+        f.write(''.join(buff).encode('utf-8'))
 
 
-def write_eps(matrix, matrix_size, out, scale=1, border=None, dark='#000', light=None):
+def write_eps(matrix, matrix_size, out, scale=1, border=None, dark='#000', light=None,
+              outline=False):
     """\
     Serializes the QR code as EPS document.
 
@@ -383,6 +652,8 @@ def write_eps(matrix, matrix_size, out, scale=1, border=None, dark='#000', light
             "red") or in hexadecimal format (``#RGB`` or ``#RRGGBB``).
     :param light: Optional background color (default: ``None`` = no
             background color). See `color` for valid values.
+    :param bool outline: Indicates if the modules should be drawn as filled
+            outlines instead of lines (default: ``False``)
     """
     import textwrap
 
@@ -412,8 +683,9 @@ def write_eps(matrix, matrix_size, out, scale=1, border=None, dark='#000', light
     width, height, border = _valid_width_height_and_border(matrix_size, scale, border)
     stroke_color_is_black = _color_is_black(dark)
     stroke_color = dark if stroke_color_is_black else rgb_to_floats(dark)
-    with writable(out, 'wt') as f:
-        writeline = partial(write_line, f.write)
+    buff = []
+    with _byte_writer(out, 'wt') as f:
+        writeline = partial(write_line, buff.append)
         writeline('%!PS-Adobe-3.0 EPSF-3.0')
         writeline(f'%%Creator: {CREATOR}')
         writeline(f'%%CreationDate: {time.strftime("%Y-%m-%d %H:%M:%S")}')
@@ -422,6 +694,8 @@ def write_eps(matrix, matrix_size, out, scale=1, border=None, dark='#000', light
         # Write the shortcuts
         writeline('/m { rmoveto } bind def')
         writeline('/l { rlineto } bind def')
+        if outline:
+            writeline('/z { closepath } bind def')
         if light is not None:
             writeline('{0:f} {1:f} {2:f} setrgbcolor clippath fill'.format(*rgb_to_floats(light)))  # noqa UP030
             if stroke_color_is_black:
@@ -433,23 +707,45 @@ def write_eps(matrix, matrix_size, out, scale=1, border=None, dark='#000', light
         if scale != 1:
             writeline(f'{scale} {scale} scale')
         writeline('newpath')
-        # Current pen position y-axis
-        # Note: 0, 0 = lower left corner in PS coordinate system
-        y = get_symbol_size(matrix_size, scale=1, border=0)[1] + border - .5  # .5 = linewidth / 2
-        line_iter = matrix_to_lines(matrix, border, y, incby=-1)
-        # EPS supports absolute coordinates as well, but relative coordinates
-        # are more compact and IMO nicer; so the 1st coordinate is absolute, all
-        # other coordinates are relative
-        (x1, y1), (x2, y2) = next(line_iter)
-        coord = [f'{x1} {y1} moveto {x2 - x1} 0 l']
-        append_coord = coord.append
-        x = x2
-        for (x1, y1), (x2, y2) in line_iter:
-            append_coord(f' {x1 - x} {int(y1 - y)} m {x2 - x1} 0 l')
-            x, y = x2, y2
-        writeline(''.join(coord))
-        writeline('stroke')
+        if not outline:
+            # Current pen position y-axis
+            # Note: 0, 0 = lower left corner in PS coordinate system
+            y = get_symbol_size(matrix_size, scale=1, border=0)[1] + border - .5  # .5 = linewidth / 2
+            line_iter = _matrix_to_lines(matrix, border, y, incby=-1)
+            # EPS supports absolute coordinates as well, but relative coordinates
+            # are more compact and IMO nicer; so the 1st coordinate is absolute, all
+            # other coordinates are relative
+            (x1, y1), (x2, y2) = next(line_iter)
+            coord = [f'{x1} {y1} moveto {x2 - x1} 0 l']
+            append_coord = coord.append
+            x = x2
+            for (x1, y1), (x2, y2) in line_iter:
+                append_coord(f' {x1 - x} {int(y1 - y)} m {x2 - x1} 0 l')
+                x, y = x2, y2
+            writeline(''.join(coord))
+            writeline('stroke')
+        else:
+            # The outlines use a y-axis which points downwards, the y values
+            # are negated. The 1st coordinate is absolute, all other coordinates
+            # are relative (closing a path moves the pen back to the start
+            # of the polygon)
+            x, y = 0, get_symbol_size(matrix_size, scale=1, border=border)[1]
+            moveto = 'moveto'
+            coord = []
+            append_coord = coord.append
+            for polygon in _matrix_to_outlines(matrix, border, border):
+                x1, y1 = polygon[0]
+                append_coord(f'{x1 - x} {y - y1} {moveto}')
+                x, y = x1, y1
+                for i, (x2, y2) in enumerate(polygon[1:]):
+                    append_coord(f'{x2 - x1} 0 l' if not i % 2 else f'0 {y1 - y2} l')
+                    x1, y1 = x2, y2
+                append_coord('z')
+                moveto = 'm'
+            writeline(' '.join(coord))
+            writeline('fill')
         writeline('%%EOF')
+        f.write(''.join(buff).encode('ascii'))
 
 
 def as_png_data_uri(matrix, matrix_size, scale=1, border=None, compresslevel=9, **kw):
@@ -460,9 +756,85 @@ def as_png_data_uri(matrix, matrix_size, scale=1, border=None, compresslevel=9,
 
     :rtype: str
     """
-    buff = io.BytesIO()
+    buff = _DataURIWriter(_data_uri_prefix('image/png'))
     write_png(matrix, matrix_size, buff, scale=scale, border=border, compresslevel=compresslevel, **kw)
-    return f'data:image/png;base64,{base64.b64encode(buff.getvalue()).decode("ascii")}'
+    return buff.getvalue()
+
+
+def as_pil_image(matrix, matrix_size, scale=1, border=None, dark='#000', light='#fff'):
+    """\
+    Converts the provided matrix into a Pillow image.
+
+    Requires `Pillow <https://pypi.org/project/pillow/>`_.
+
+    The image mode depends on the colors: Black and white QR codes are returned
+    as bilevel image (mode "1"), QR codes with two opaque shades of gray as
+    greyscale image (mode "L") and all other QR codes as palette image
+    (mode "P").
+
+    :param matrix: The matrix to convert.
+    :param tuple(int, int) matrix_size: Tuple of width and height of the matrix.
+    :param int scale: Indicates the size of a single module (default: 1 which
+            corresponds to 1 x 1 pixel per module).
+    :param int border: Integer indicating the size of the quiet zone.
+            If set to ``None`` (default), the recommended border size
+            will be used (``4`` for QR Codes, ``2`` for Micro QR Codes).
+    :param dark: Color of the dark modules (default: black). ``None``
+            indicates transparent dark modules.
+    :param light: Color of the light modules (default: white). ``None``
+            indicates transparent light modules.
+    :rtype: PIL.Image.Image
+    """
+    from PIL import Image
+    scale = int(scale)
+    width, height, border = _valid_width_height_and_border(matrix_size, scale, border)
+    if dark is None and light is None:
+        raise ValueError('Either the dark or the light color must be provided')
+    transparent = (0, 0, 0, 0)
+    dark = _color_to_rgba(dark, alpha_float=False) if dark is not None else transparent
+    light = _color_to_rgba(light, alpha_float=False) if light is not None else transparent
+    rows = _matrix_rows(matrix, matrix_size, scale, border)
+    size = width, height
+    if dark[3] == light[3] == 255:
+        if dark == (0, 0, 0, 255) and light == (255, 255, 255, 255):
+            # Mode "1" uses 0 for black and 1 for white, rows are padded to bytes
+            return Image.frombytes('1', size, b''.join([_pack_row(row.translate(_INVERT_BITS)) * scale
+                                                        for row in rows]))
+        if dark[0] == dark[1] == dark[2] and light[0] == light[1] == light[2]:
+            table = bytes.maketrans(b'\x00\x01', bytes([light[0], dark[0]]))
+            return Image.frombytes('L', size, b''.join([row.translate(table) * scale for row in rows]))
+    img = Image.frombytes('P', size, b''.join([row * scale for row in rows]))
+    img.putpalette(bytes(light + dark), 'RGBA')
+    return img
+
+
+def as_array(matrix, matrix_size, scale=1, border=None):
+    """\
+    Converts the provided matrix into a two-dimensional NumPy array.
+
+    Requires `NumPy <https://pypi.org/project/numpy/>`_.
+
+    Each item of the array represents a pixel, ``1`` indicates a dark module,
+    ``0`` a light module.
+
+    :param matrix: The matrix to convert.
+    :param tuple(int, int) matrix_size: Tuple of width and height of the matrix.
+    :param int scale: Indicates the size of a single module (default: 1 which
+            corresponds to 1 x 1 pixel per module).
+    :param int border: Integer indicating the size of the quiet zone.
+            If set to ``None`` (default), the recommended border size
+            will be used (``4`` for QR Codes, ``2`` for Micro QR Codes).
+    :rtype: numpy.ndarray
+    """
+    import numpy as np
+    scale = int(scale)
+    _, _, border = _valid_width_height_and_border(matrix_size, scale, border)
+    width, height = matrix_size
+    arr = np.frombuffer(b''.join(matrix), dtype=np.uint8).reshape(height, width)
+    arr = np.pad(arr, border)
+    if scale > 1:
+        arr = arr.repeat(scale, axis=0).repeat(scale, axis=1)
+    return arr
 
 
 @colorful(dark='#000', light='#fff')
@@ -496,34 +868,35 @@ def write_png(matrix, matrix_size, out, colormap, scale=1, border=None, compress
             See `color` for valid color values. ``None`` is accepted as valid
             color value as well (becomes transparent).
     """
+    _write_png_image(matrix, matrix_size, out, _png_palette(colormap), scale=scale,
+                     border=border, compresslevel=compresslevel, dpi=dpi)
 
-    def png_color(clr):
-        return _color_to_rgb_or_rgba(clr, alpha_float=False) if clr is not None else transparent
 
-    def chunk(name, data):
-        """\
-        Returns a PNG chunk with checksum.
-        """
-        chunk_head = name + data
-        return pack(b'>I', len(data)) + chunk_head + pack(b'>I', zlib.crc32(chunk_head))
+def _png_chunk(name, data):
+    """\
+    Returns a PNG chunk with checksum.
+    """
+    chunk_head = name + data
+    return pack(b'>I', len(data)) + chunk_head + pack(b'>I', zlib.crc32(chunk_head))
 
-    def scanline(row, filter_type=b'\0'):
-        """\
-        Returns a single scanline.
-        """
-        return bytearray(chain(filter_type,
-                               # See _pack_bits_into_byte, same code, but the bit depth is taken
-                               # into account
-                               (reduce(lambda x, y: (x << png_bit_depth) + y, e)
-                                for e in zip_longest(*[iter(row)] * (8 // png_bit_depth), fillvalue=0x0))))
 
-    scale = int(scale)
-    width, height, border = _valid_width_height_and_border(matrix_size, scale, border)
-    if dpi:
-        dpi = int(dpi)
-        if dpi < 0:
-            raise ValueError('DPI value must not be negative')
-        dpi = int(dpi // 0.0254)
+def _png_palette(colormap):
+    """\
+    Returns the color settings of a PNG image for the provided colormap.
+
+    The result depends on the colormap only and can be reused for all images
+    with the same colors (see :py:class:`Renderer`).
+
+    :param dict colormap: Module type -> color mapping.
+    :rtype: tuple
+    :return: Tuple (color type, bit depth, translation table, quiet zone index,
+            palette chunks). The translation table maps either the values of
+            the matrix (two colors) or the module codes (more than two colors,
+            see :py:func:`segno.utils.matrix_iter_module_codes`) to palette
+            indexes. The palette chunks contain the PLTE and tRNS chunks (if any).
+    """
+    def png_color(clr):
+        return _color_to_rgb_or_rgba(clr, alpha_float=False) if clr is not None else transparent
 
     black = (0, 0, 0)
     white = (255, 255, 255)
@@ -561,64 +934,208 @@ def write_png(matrix, matrix_size, out, colormap, scale=1, border=None, compress
             palette = [black, transparent]
         png_trans_idx = palette.index(transparent)
     if number_of_colors > 2:
-        # Need the more expensive matrix iterator
-        miter = matrix_iter_verbose(matrix, matrix_size, scale=1, border=0)
+        # Need the module codes which indicate the module types
         color_index = {module_type: palette.index(clr) for module_type, clr in clr_map.items()}
+        table = _module_code_table(color_index)
     else:
-        # Just two colors, use the cheap iterator which returns 0x0 or 0x1
-        miter = iter(matrix)
+        # Just two colors, use the matrix which provides 0x0 or 0x1
         # The code to create the image requires that TYPE_QUIET_ZONE is available
         color_index = {qz_idx: palette.index(clr_map[qz_idx])}
-        color_index.update({0: color_index[qz_idx],
-                            1: palette.index(clr_map[dark_idx])})
-    miter = ((color_index[b] for b in r) for r in miter)
-    horizontal_border = b''
-    vertical_border = b''
-    if border > 0:
-        # Calculate horizontal and vertical border
-        qz_value = color_index[qz_idx]
-        horizontal_border = scanline(repeat(qz_value, width)) * border * scale
-        vertical_border = [qz_value] * border * scale
-    # <https://www.w3.org/TR/PNG/#9Filters>
-    # This variable holds the "Up" filter which indicates that this scanline
-    # is equal to the above scanline (since it is filled with null bytes)
-    same_as_above = b''
-    if scale > 1:
-        # 2 == PNG Filter "Up"  <https://www.w3.org/TR/PNG/#9-table91>
-        same_as_above = scanline(repeat(0x0, width), filter_type=b'\2') * (scale - 1)
-        miter = (chain(*(repeat(b, scale) for b in row)) for row in miter)
-    idat = bytearray(horizontal_border)
-    for row in miter:
-        # Chain precalculated left border with row and right border
-        idat += scanline(chain(vertical_border, row, vertical_border))
-        idat += same_as_above  # This is b'' if no scaling factor was provided
-    idat += horizontal_border
-    with writable(out, 'wb') as f:
-        write = f.write
-        write(b'\211PNG\r\n\032\n')  # Magic number
-        # Header:
-        # width, height, bitdepth, colortype, compression meth., filter, interlance
-        write(chunk(b'IHDR', pack(b'>2I5B', width, height, png_bit_depth, png_color_type, 0, 0, 0)))
-        if dpi:
-            write(chunk(b'pHYs', pack(b'>LLB', dpi, dpi, 1)))
-        if not is_greyscale:
-            write(chunk(b'PLTE', b''.join(pack(b'>3B', *clr[:3]) for clr in palette)))
-            # <https://www.w3.org/TR/PNG/#11tRNS>
-            if len(palette[0]) > 3:  # Color with alpha channel is the first entry in the palette
-                write(chunk(b'tRNS', b''.join(pack(b'>B', clr[3]) for clr in palette if len(clr) > 3)))
-            elif is_transparent:
-                write(chunk(b'tRNS', pack(b'>B', png_trans_idx)))
+        table = bytes([color_index[qz_idx], palette.index(clr_map[dark_idx])]) + bytes(254)
+    chunks = b''
+    if not is_greyscale:
+        chunks += _png_chunk(b'PLTE', b''.join(pack(b'>3B', *clr[:3]) for clr in palette))
+        # <https://www.w3.org/TR/PNG/#11tRNS>
+        if len(palette[0]) > 3:  # Color with alpha channel is the first entry in the palette
+            chunks += _png_chunk(b'tRNS', b''.join(pack(b'>B', clr[3]) for clr in palette if len(clr) > 3))
         elif is_transparent:
-            # Grayscale with Transparency
-            # <https://www.w3.org/TR/PNG/#11tRNS>
-            # 2 bytes for color type == 0 (greyscale)
-            write(chunk(b'tRNS', pack(b'>1H', png_trans_idx)))
-        write(chunk(b'IDAT', zlib.compress(idat, compresslevel)))
-        write(chunk(b'IEND', b''))
+            chunks += _png_chunk(b'tRNS', pack(b'>B', png_trans_idx))
+    elif is_transparent:
+        # Grayscale with Transparency
+        # <https://www.w3.org/TR/PNG/#11tRNS>
+        # 2 bytes for color type == 0 (greyscale)
+        chunks += _png_chunk(b'tRNS', pack(b'>1H', png_trans_idx))
+    return png_color_type, png_bit_depth, table, color_index[qz_idx], chunks
+
+
+def _write_png_image(matrix, matrix_size, out, png_palette, scale=1, border=None, compresslevel=9, dpi=None):
+    """\
+    Writes the PNG image with the provided color settings.
+
+    See :py:func:`write_png` for a description of the parameters and
+    :py:func:`_png_palette` for the color settings.
+    """
+    chunks = _iter_png_image(matrix, matrix_size, png_palette, scale=scale, border=border,
+                             compresslevel=compresslevel, dpi=dpi)
+    with _byte_writer(out, 'wb') as f:
+        f.write(b''.join(chunks))
+
+
+def _iter_png_image(matrix, matrix_size, png_palette, scale=1, border=None, compresslevel=9,
+                    dpi=None, chunk_size=None):
+    """\
+    Validates the arguments and returns an iterator over the chunks (bytes)
+    of the PNG image.
+
+    The arguments are validated immediately, the image data is created and
+    compressed lazily. See :py:func:`write_png` for a description of the
+    parameters.
+
+    :param int chunk_size: If ``None`` (default), the image data is
+            compressed at once and stored in a single IDAT chunk. Otherwise,
+            the scanlines are compressed incrementally and an IDAT chunk is
+            emitted as soon as at least `chunk_size` compressed bytes are
+            available.
+    """
+    def scanline(row):
+        """\
+        Returns a single scanline (filter type "None") of the provided palette
+        indexes.
+        """
+        bits = b''.join([pixels[idx] for idx in row])
+        pad = -len(bits) % 8
+        return b'\0' + int(bits + b'0' * pad, 2).to_bytes((len(bits) + pad) // 8, 'big')
+
+    def iter_image_data():
+        yield horizontal_border
+        for row in miter:
+            yield scanline(vertical_border + row.translate(table) + vertical_border) + same_as_above
+        yield horizontal_border
+
+    scale = int(scale)
+    width, height, border = _valid_width_height_and_border(matrix_size, scale, border)
+    if dpi:
+        dpi = int(dpi)
+        if dpi < 0:
+            raise ValueError('DPI value must not be negative')
+        dpi = int(dpi // 0.0254)
+    png_color_type, png_bit_depth, table, qz_value, palette_chunks = png_palette
+    # Bits of each palette index as ASCII string, repeated "scale" times
+    pixels = [f'{i:0{png_bit_depth}b}'.encode('ascii') * scale for i in range(1 << png_bit_depth)]
+    if png_bit_depth > 1:
+        # More than two colors, need the module codes which indicate the module types
+        miter = _module_codes(matrix, matrix_size, border=0)
+    else:
+        # Just two colors, use the matrix which provides 0x0 or 0x1
+        miter = iter(matrix)
+    vertical_border = bytes([qz_value]) * border
+    # <https://www.w3.org/TR/PNG/#9Filters>
+    # The "Up" filter (2) indicates that the scanline is equal to the above
+    # scanline (since it is filled with null bytes)
+    same_as_above = (b'\2' + bytes((width * png_bit_depth + 7) // 8)) * (scale - 1)
+    horizontal_border = scanline(bytes([qz_value]) * (matrix_size[0] + 2 * border)) * border * scale
+    return _iter_png(width, height, png_color_type, png_bit_depth, palette_chunks, iter_image_data(),
+                     compresslevel=compresslevel, dpi=dpi, chunk_size=chunk_size)
+
+
+def _iter_png(width, height, color_type, bit_depth, palette_chunks, image_data, compresslevel=9,
+              dpi=None, chunk_size=None):
+    """\
+    Returns an iterator over the chunks (bytes) of a PNG image.
+
+    :param int width: Image width in pixels.
+    :param int height: Image height in pixels.
+    :param int color_type: PNG color type.
+    :param int bit_depth: PNG bit depth.
+    :param bytes palette_chunks: The PLTE and tRNS chunks (if any).
+    :param image_data: Iterable of bytes which provides the filtered
+            scanlines, see :py:func:`_iter_png_image` for `chunk_size`.
+    :param int compresslevel: The compression level.
+    :param int dpi: Resolution in pixels per meter or ``None``.
+    """
+    yield b''.join([b'\211PNG\r\n\032\n',  # Magic number
+                    # Header:
+                    # width, height, bitdepth, colortype, compression meth., filter, interlance
+                    _png_chunk(b'IHDR', pack(b'>2I5B', width, height, bit_depth, color_type, 0, 0, 0)),
+                    _png_chunk(b'pHYs', pack(b'>LLB', dpi, dpi, 1)) if dpi else b'',
+                    palette_chunks])
+    if chunk_size is None:
+        yield _png_chunk(b'IDAT', zlib.compress(b''.join(image_data), compresslevel))
+    else:
+        compressor = zlib.compressobj(compresslevel)
+        buff = []
+        length = 0
+        for data in image_data:
+            data = compressor.compress(data)
+            if data:
+                buff.append(data)
+                length += len(data)
+                if length >= chunk_size:
+                    yield _png_chunk(b'IDAT', b''.join(buff))
+                    buff = []
+                    length = 0
+        buff.append(compressor.flush())
+        yield _png_chunk(b'IDAT', b''.join(buff))
+    yield _png_chunk(b'IEND', b'')
+
+
+def _to_pdf_color(clr):
+    """\
+    Converts the provided color into an acceptable format for PDF's
+    "DeviceRGB" color space.
+    """
+    def to_float(c):
+        if isinstance(c, float):
+            if not 0.0 <= c <= 1.0:
+                raise ValueError(f'Invalid color "{c}". Not in range 0 .. 1')
+            return c
+        return 1 / 255.0 * c if c != 1 else c
+    return tuple([to_float(i) for i in _color_to_rgb(clr)])
+
+
+def _pdf_creation_date():
+    """\
+    Returns the current time as PDF date string.
+    """
+    return f"{time.strftime('%Y%m%d%H%M%S')}{(time.timezone // 3600):+03d}'{(abs(time.timezone) % 60):02d}'"
+
+
+def _pdf_symbol_cmds(matrix, matrix_size, border, outline):
+    """\
+    Returns the PDF operators which paint the dark modules of the provided
+    matrix.
+
+    The symbol is drawn in module units, the lower left corner of the quiet
+    zone is at ``0, 0``. The caller is responsible to set the colors.
+
+    :param matrix: The matrix to serialize.
+    :param tuple(int, int) matrix_size: Tuple of width and height of the matrix.
+    :param int border: Size of the quiet zone.
+    :param bool outline: Indicates if the modules should be drawn as filled
+            outlines instead of lines.
+    :rtype: list[str]
+    """
+    cmds = []
+    append_cmd = cmds.append
+    if not outline:
+        # Current pen position y-axis
+        # Note: 0, 0 = lower left corner in PDF coordinate system
+        y = get_symbol_size(matrix_size, scale=1, border=0)[1] + border - .5
+        # Set the origin in the upper left corner
+        append_cmd(f'1 0 0 1 {border} {y} cm')
+        miter = _matrix_to_lines(matrix, 0, 0, incby=-1)
+        # PDF supports absolute coordinates, only
+        cmds.extend(f'{x1} {y1} m {x2} {y1} l' for (x1, y1), (x2, y2) in miter)
+        append_cmd('S')
+        return cmds
+    # Set the origin in the upper left corner, the y-axis points downwards
+    y = get_symbol_size(matrix_size, scale=1, border=0)[1] + border
+    append_cmd(f'1 0 0 -1 {border} {y} cm')
+    for polygon in _matrix_to_outlines(matrix):
+        x1, y1 = polygon[0]
+        if len(polygon) == 4:  # Rectangle
+            x2, y2 = polygon[2]
+            append_cmd(f'{x1} {y1} {x2 - x1} {y2 - y1} re')
+            continue
+        append_cmd(f'{x1} {y1} m')
+        cmds.extend(f'{x} {y} l' for x, y in polygon[1:])
+        append_cmd('h')
+    append_cmd('f')
+    return cmds
 
 
 def write_pdf(matrix, matrix_size, out, scale=1, border=None, dark='#000',
-              light=None, compresslevel=9):
+              light=None, compresslevel=9, outline=False):
     """\
     Serializes the QR code as PDF document.
 
@@ -639,71 +1156,440 @@ def write_pdf(matrix, matrix_size, out, scale=1, border=None, dark='#000',
             (default: 9). 1 is fastest and produces the least
             compression, 9 is slowest and produces the most.
             0 is no compression.
+    :param bool outline: Indicates if the modules should be drawn as filled
+            outlines instead of lines (default: ``False``)
     """
+    chunks = _iter_pdf(matrix, matrix_size, scale=scale, border=border, dark=dark,
+                       light=light, compresslevel=compresslevel, outline=outline)
+    with _byte_writer(out, 'wb') as f:
+        f.write(b''.join(chunks))
 
-    def write_string(writemeth, s):
-        writemeth(s.encode('ascii'))
 
-    def to_pdf_color(clr):
-        """\
-        Converts the provided color into an acceptable format for PDF's
-        "DeviceRGB" color space.
-        """
-        def to_float(c):
-            if isinstance(c, float):
-                if not 0.0 <= c <= 1.0:
-                    raise ValueError(f'Invalid color "{c}". Not in range 0 .. 1')
-                return c
-            return 1 / 255.0 * c if c != 1 else c
-        return tuple([to_float(i) for i in _color_to_rgb(clr)])
+def _iter_pdf(matrix, matrix_size, scale=1, border=None, dark='#000', light=None,
+              compresslevel=9, outline=False, chunk_size=None):
+    """\
+    Validates the arguments and returns an iterator over the chunks (bytes)
+    of the PDF document.
+
+    The arguments are validated and the content stream is created
+    immediately, the document is assembled lazily. See :py:func:`write_pdf`
+    for a description of the parameters.
+
+    :param int chunk_size: If not ``None``, the content stream is split
+            into chunks of `chunk_size` bytes.
+    """
+    def iter_document():
+        header = b'%PDF-1.4\r%\xE2\xE3\xCF\xD3\r\n'
+        yield header
+        pos = len(header)
+        object_pos = []
+        for obj in objects:
+            object_pos.append(pos)
+            yield obj
+            pos += len(obj)
+        if chunk_size is None:
+            yield graphic
+        else:
+            for i in range(0, len(graphic), chunk_size):
+                yield graphic[i:i + chunk_size]
+        pos += len(graphic)
+        s = b'\r\nendstream\r\nendobj\r\n'
+        yield s
+        pos += len(s)
+        object_pos.append(pos)
+        s = ('{0} 0 obj <</CreationDate(D:{1})/Producer({2})/Creator({2})\r\n>>\r\nendofbj\r\n'
+             .format(len(object_pos), creation_date, CREATOR)).encode('ascii')
+        yield s
+        pos += len(s)
+        object_pos.append(pos)
+        trailer = [f'xref\r\n0 {len(object_pos) + 1}\r\n0000000000 65535 f\r\n']
+        trailer.extend(f'{p:010d} {0:05d} n\r\n' for p in object_pos)
+        trailer.append(f'trailer <</Size {len(object_pos) + 1}/Root 1 0 R/Info 5 0 R>>\r\n')
+        trailer.append(f'startxref\r\n{pos}\r\n%%EOF\r\n')
+        yield ''.join(trailer).encode('ascii')
 
     width, height, border = _valid_width_height_and_border(matrix_size, scale, border)
-    creation_date = f"{time.strftime('%Y%m%d%H%M%S')}{(time.timezone // 3600):+03d}'{(abs(time.timezone) % 60):02d}'"
+    creation_date = _pdf_creation_date()
     cmds = []
     append_cmd = cmds.append
     if scale > 1:
         append_cmd(f'{scale} 0 0 {scale} 0 0 cm')
     if light is not None:
         # If the background color is defined, a rect is drawn in the background
-        append_cmd('{} {} {} rg'.format(*to_pdf_color(light)))
+        append_cmd('{} {} {} rg'.format(*_to_pdf_color(light)))
         append_cmd(f'0 0 {width} {height} re')
         append_cmd('f q')
-    # Set the stroke color only iff it is not black (default)
-    if not _color_is_black(dark):
-        append_cmd('{} {} {} RG'.format(*to_pdf_color(dark)))
-    # Current pen position y-axis
-    # Note: 0, 0 = lower left corner in PDF coordinate system
-    y = get_symbol_size(matrix_size, scale=1, border=0)[1] + border - .5
-    # Set the origin in the upper left corner
-    append_cmd(f'1 0 0 1 {border} {y} cm')
-    miter = matrix_to_lines(matrix, 0, 0, incby=-1)
-    # PDF supports absolute coordinates, only
-    cmds.extend(f'{x1} {y1} m {x2} {y1} l' for (x1, y1), (x2, y2) in miter)
-    append_cmd('S')
+    if not outline:
+        # Set the stroke color only iff it is not black (default)
+        if not _color_is_black(dark):
+            append_cmd('{} {} {} RG'.format(*_to_pdf_color(dark)))
+    # Set the fill color iff it is not black or if the background color
+    # has changed the fill color
+    elif not _color_is_black(dark) or light is not None:
+        append_cmd('{} {} {} rg'.format(*_to_pdf_color(dark)))
+    cmds.extend(_pdf_symbol_cmds(matrix, matrix_size, border, outline))
     graphic = zlib.compress((' '.join(cmds)).encode('ascii'), compresslevel)
-    with writable(out, 'wb') as f:
+    objects = [f'{num} 0 {obj}'.encode('ascii') for num, obj in enumerate((
+        'obj <</Type /Catalog /Pages 2 0 R>>\r\nendobj\r\n',
+        'obj <</Type /Pages /Kids [3 0 R] /Count 1>>\r\nendobj\r\n',
+        f'obj <</Type /Page /Parent 2 0 R /MediaBox [0 0 {width} {height}] /Contents 4 0 R>>\r\nendobj\r\n',
+        f'obj <</Length {len(graphic)} /Filter /FlateDecode>>\r\nstream\r\n'), start=1)]
+    return iter_document()
+
+
+def write_pdf_pages(matrices, out, scale=1, border=None, dark='#000',
+                    light=None, compresslevel=9, outline=False, cols=1, rows=1,
+                    gap=0):
+    """\
+    Serializes several QR codes into one PDF document.
+
+    Each page contains a grid of ``cols`` x ``rows`` symbols (default: one
+    symbol per page). The symbols are written as Form XObjects which are
+    shared by all pages, identical symbols are written only once.
+
+    The document is written incrementally, only the object positions and the
+    references to the pages and symbols are kept in memory.
+
+    :param matrices: Iterable of matrices.
+    :param out: Filename or a file-like object supporting to write bytes.
+    :param scale: Indicates the size of a single module (default: 1 which
+            corresponds to 1 x 1 pixel per module).
+    :param int border: Integer indicating the size of the quiet zone.
+            If set to ``None`` (default), the recommended border size
+            will be used (``4`` for QR Codes, ``2`` for Micro QR Codes).
+    :param dark: Color of the modules (default: black). The
+            color can be provided as ``(R, G, B)`` tuple, as web color name
+            (like "red") or in hexadecimal format (``#RGB`` or ``#RRGGBB``).
+    :param light: Optional background color of the symbols (default: ``None``
+            = no background color). See `color` for valid values.
+    :param int compresslevel: Integer indicating the compression level
+            (default: 9). 1 is fastest and produces the least
+            compression, 9 is slowest and produces the most.
+            0 is no compression.
+    :param bool outline: Indicates if the modules should be drawn as filled
+            outlines instead of lines (default: ``False``)
+    :param int cols: Number of symbols per row (default: 1).
+    :param int rows: Number of rows per page (default: 1).
+    :param gap: Space between the symbols (default: 0). The gap is not
+            scaled.
+    """
+
+    def write_object(num, dictionary, stream=None):
+        nonlocal position
+        object_pos[num] = position
+        data = f'{num} 0 obj {dictionary}\r\n'.encode('ascii')
+        if stream is not None:
+            data += b'stream\r\n' + stream + b'\r\nendstream\r\n'
+        data += b'endobj\r\n'
+        write(data)
+        position += len(data)
+
+    def symbol_object(matrix):
+        matrix_size = len(matrix[0]), len(matrix)
+        symbol_border = get_border(matrix_size, border)
+        width, height = get_symbol_size(matrix_size, 1, symbol_border)
+        key = matrix_size, hashlib.blake2b(b''.join(matrix), digest_size=16).digest()
+        name = xobjects.get(key)
+        if name is None:
+            name = f'S{len(xobjects) + 1}'
+            xobjects[key] = name
+            num = next(object_num)
+            xobject_nums.append(num)
+            graphic = zlib.compress(' '.join(_pdf_symbol_cmds(matrix, matrix_size,
+                                                              symbol_border, outline))
+                                    .encode('ascii'), compresslevel)
+            write_object(num, f'<</Type /XObject /Subtype /Form /BBox [0 0 {width} {height}]'
+                              f' /Matrix [{scale} 0 0 {scale} 0 0]'
+                              f' /Length {len(graphic)} /Filter /FlateDecode>>', graphic)
+        return name, width * scale, height * scale
+
+    check_valid_scale(scale)
+    check_valid_border(border)
+    if int(cols) != cols or cols < 1 or int(rows) != rows or rows < 1:
+        raise ValueError(f'Invalid grid "{cols} x {rows}". Columns and rows must be positive integers')
+    if gap < 0:
+        raise ValueError(f'Invalid gap "{gap}". Must not be negative')
+    matrices = iter(matrices)
+    first = next(matrices, None)
+    if first is None:
+        raise ValueError('At least one matrix is required')
+    matrices = chain((first,), matrices)
+    per_page = cols * rows
+    paint_cmds = []
+    if not outline and not _color_is_black(dark):
+        paint_cmds.append('{} {} {} RG'.format(*_to_pdf_color(dark)))
+    elif outline and (not _color_is_black(dark) or light is not None):
+        paint_cmds.append('{} {} {} rg'.format(*_to_pdf_color(dark)))
+    light_color = _to_pdf_color(light) if light is not None else None
+    # 1: Catalog, 2: Pages (written last), 3: Resources (written last), 4: Info
+    object_num = count(5)
+    object_pos = {}
+    xobjects = {}
+    xobject_nums = []
+    page_nums = []
+    with _byte_writer(out, 'wb') as f:
         write = f.write
-        writestr = partial(write_string, write)
-        object_pos = []
-        write(b'%PDF-1.4\r%\xE2\xE3\xCF\xD3\r\n')
-        for obj in ('obj <</Type /Catalog /Pages 2 0 R>>\r\nendobj\r\n',
-                    'obj <</Type /Pages /Kids [3 0 R] /Count 1>>\r\nendobj\r\n',
-                    f'obj <</Type /Page /Parent 2 0 R /MediaBox [0 0 {width} {height}] /Contents 4 0 R>>\r\nendobj\r\n',
-                    f'obj <</Length {len(graphic)} /Filter /FlateDecode>>\r\nstream\r\n'):
-            object_pos.append(f.tell())
-            writestr(f'{len(object_pos)} 0 {obj}')
-        write(graphic)
-        write(b'\r\nendstream\r\nendobj\r\n')
-        object_pos.append(f.tell())
-        writestr('{0} 0 obj <</CreationDate(D:{1})/Producer({2})/Creator({2})\r\n>>\r\nendofbj\r\n'
-                 .format(len(object_pos), creation_date, CREATOR))
-        object_pos.append(f.tell())
-        xref_location = f.tell()
-        writestr(f'xref\r\n0 {len(object_pos) + 1}\r\n0000000000 65535 f\r\n')
-        for pos in object_pos:
-            writestr(f'{pos:010d} {0:05d} n\r\n')
-        writestr(f'trailer <</Size {len(object_pos) + 1}/Root 1 0 R/Info 5 0 R>>\r\n')
-        writestr(f'startxref\r\n{xref_location}\r\n%%EOF\r\n')
+        header = b'%PDF-1.4\r%\xE2\xE3\xCF\xD3\r\n'
+        write(header)
+        position = len(header)
+        write_object(1, '<</Type /Catalog /Pages 2 0 R>>')
+        write_object(4, f'<</CreationDate(D:{_pdf_creation_date()})/Producer({CREATOR})/Creator({CREATOR})>>')
+        while True:
+            symbols = [symbol_object(matrix) for matrix in islice(matrices, per_page)]
+            if not symbols:
+                break
+            cell_width = max(w for _, w, _ in symbols)
+            cell_height = max(h for _, _, h in symbols)
+            page_width = cols * cell_width + (cols - 1) * gap
+            page_height = rows * cell_height + (rows - 1) * gap
+            positions = []
+            for i, (_, width, height) in enumerate(symbols):
+                row, col = divmod(i, cols)
+                # 0, 0 = lower left corner, the first symbol is placed top left
+                positions.append((col * (cell_width + gap),
+                                  page_height - row * (cell_height + gap) - height))
+            cmds = []
+            if light_color is not None:
+                cmds.append('{} {} {} rg'.format(*light_color))
+                cmds.extend(f'{x} {y} {w} {h} re' for (x, y), (_, w, h) in zip(positions, symbols))
+                cmds.append('f')
+            cmds.extend(paint_cmds)
+            cmds.extend(f'q 1 0 0 1 {x} {y} cm /{name} Do Q' for (x, y), (name, _, _) in zip(positions, symbols))
+            graphic = zlib.compress(' '.join(cmds).encode('ascii'), compresslevel)
+            contents_num = next(object_num)
+            write_object(contents_num, f'<</Length {len(graphic)} /Filter /FlateDecode>>', graphic)
+            page_num = next(object_num)
+            page_nums.append(page_num)
+            write_object(page_num, f'<</Type /Page /Parent 2 0 R /MediaBox [0 0 {page_width} {page_height}]'
+                                   f' /Resources 3 0 R /Contents {contents_num} 0 R>>')
+        kids = ' '.join(f'{num} 0 R' for num in page_nums)
+        write_object(2, f'<</Type /Pages /Kids [{kids}] /Count {len(page_nums)}>>')
+        refs = ' '.join(f'/S{i} {num} 0 R' for i, num in enumerate(xobject_nums, start=1))
+        write_object(3, f'<</XObject <<{refs}>>>>')
+        size = len(object_pos) + 1
+        xref = [f'xref\r\n0 {size}\r\n0000000000 65535 f\r\n']
+        xref.extend(f'{object_pos[num]:010d} {0:05d} n\r\n' for num in range(1, size))
+        xref.append(f'trailer <</Size {size}/Root 1 0 R/Info 4 0 R>>\r\n')
+        xref.append(f'startxref\r\n{position}\r\n%%EOF\r\n')
+        write(''.join(xref).encode('ascii'))
+
+
+_RUN_PATTERN = re.compile(b'\x00+|\x01+')
+_BITS_TO_ASCII = bytes.maketrans(b'\x00\x01', b'01')
+_ASCII_TO_BITS = bytes.maketrans(b'01', b'\x00\x01')
+_INVERT_BITS = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+_REVERSE_BITS = bytes([int(f'{i:08b}'[::-1], 2) for i in range(256)])
+_HEX_BYTES = tuple(f'0x{i:02x}' for i in range(256))
+
+
+# Derived representations of matrices, see geometry_cache()
+_GEOMETRY_CACHE = contextvars.ContextVar('segno_geometry_cache', default=None)
+
+
+@contextmanager
+def geometry_cache():
+    """\
+    Context manager which caches the representations of matrices which are
+    derived by the serializers (runs of dark modules, outlines, rows including
+    the border, packed rows, and module codes).
+
+    While the cache is active, serializing a matrix into several formats
+    computes these representations only once. The matrices must not be
+    modified while the cache is active.
+
+    Usage::
+
+        with geometry_cache():
+            save(matrix, matrix_size, 'qrcode.png')
+            save(matrix, matrix_size, 'qrcode.svg')
+    """
+    token = _GEOMETRY_CACHE.set({})
+    try:
+        yield
+    finally:
+        _GEOMETRY_CACHE.reset(token)
+
+
+def _geometry(func):
+    """\
+    Decorator which caches the result of `func` if a geometry cache is active.
+
+    The first argument of `func` must be the matrix, the result must not be
+    modified by the callers.
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(matrix, *args, **kw):
+        cache = _GEOMETRY_CACHE.get()
+        if cache is None:
+            return func(matrix, *args, **kw)
+        bound = signature.bind(matrix, *args, **kw)
+        bound.apply_defaults()
+        key = func, id(matrix), tuple(bound.arguments.values())[1:]
+        entry = cache.get(key)
+        # Compare the matrix as well, the id may be reused by another matrix
+        if entry is None or entry[0] is not matrix:
+            entry = cache[key] = matrix, func(matrix, *args, **kw)
+        return entry[1]
+    return wrapper
+
+
+_DARK_PATTERN = re.compile(b'[^\x00]+')
+
+
+@_geometry
+def _dark_runs(matrix):
+    """\
+    Returns the runs of dark modules, one list of (start, end) tuples per row.
+    """
+    return [[m.span() for m in _DARK_PATTERN.finditer(row)] for row in matrix]
+
+
+def _matrix_to_lines(matrix, x, y, incby=1):
+    """\
+    Same as :py:func:`segno.utils.matrix_to_lines` but uses the geometry cache
+    if it is active.
+    """
+    if _GEOMETRY_CACHE.get() is None:
+        return matrix_to_lines(matrix, x, y, incby)
+
+    def lines(row_y):
+        for runs in _dark_runs(matrix):
+            row_y += incby
+            for x1, x2 in runs:
+                yield (x + x1, row_y), (x + x2, row_y)
+
+    return lines(y - incby)
+
+
+@_geometry
+def _outlines(matrix):
+    return matrix_to_outlines(matrix)
+
+
+def _matrix_to_outlines(matrix, x=0, y=0):
+    """\
+    Same as :py:func:`segno.utils.matrix_to_outlines` but uses the geometry
+    cache if it is active.
+    """
+    if _GEOMETRY_CACHE.get() is None:
+        return matrix_to_outlines(matrix, x, y)
+    polygons = _outlines(matrix)
+    if x or y:
+        return [[(cx + x, cy + y) for cx, cy in corners] for corners in polygons]
+    return polygons
+
+
+@_geometry
+def _module_codes(matrix, matrix_size, border=None):
+    """\
+    Returns the module codes of the matrix as tuple of bytes, see
+    :py:func:`segno.utils.matrix_iter_module_codes`.
+    """
+    return tuple(matrix_iter_module_codes(matrix, matrix_size, border))
+
+
+@_geometry
+def _matrix_rows(matrix, matrix_size, scale=1, border=None):
+    """\
+    Returns the rows of the matrix, including the border, as list of bytes.
+
+    The rows are scaled horizontally, but not vertically.
+
+    :param matrix: The matrix.
+    :param tuple(int, int) matrix_size: Tuple of width and height of the matrix.
+    :param int scale: The scaling factor (default: ``1``).
+    :param int border: The border size or ``None`` to specify the
+            default quiet zone (4 for QR Codes, 2 for Micro QR Codes).
+    :rtype: list[bytes]
+    """
+    check_valid_border(border)
+    scale = int(scale)
+    check_valid_scale(scale)
+    border = get_border(matrix_size, border)
+    width = matrix_size[0]
+    quiet_zone = bytes(border * scale)
+    border_row = bytes((width + 2 * border) * scale)
+    if scale == 1:
+        rows = [quiet_zone + row + quiet_zone for row in matrix]
+    else:
+        modules = (bytes(scale), b'\x01' * scale)
+        rows = [quiet_zone + _expand_row(row, modules) + quiet_zone for row in matrix]
+    return [border_row] * border + rows + [border_row] * border
+
+
+@_geometry
+def _packed_rows(matrix, matrix_size, scale=1, border=None):
+    """\
+    Returns the rows of the matrix (see :py:func:`_matrix_rows`) packed into
+    bits (see :py:func:`_pack_row`).
+
+    :rtype: list[bytes]
+    """
+    return [_pack_row(row) for row in _matrix_rows(matrix, matrix_size, scale, border)]
+
+
+def _pack_row(row):
+    """\
+    Packs the modules of a row into bits, eight modules per byte.
+
+    The first module is the most significant bit, the last byte is padded
+    with zeros.
+
+    :param bytes row: The row, one module (``0`` or ``1``) per byte.
+    :rtype: bytes
+    """
+    padding = -len(row) % 8
+    return int(row.translate(_BITS_TO_ASCII) + b'0' * padding, 2) \
+        .to_bytes((len(row) + padding) // 8, 'big')
+
+
+def _pack_matrix(matrix):
+    """\
+    Packs the matrix into bits, see :py:func:`_pack_row`. Each row is padded
+    to a full byte.
+
+    :param matrix: The matrix.
+    :rtype: bytes
+    """
+    padding = bytes(-len(matrix[0]) % 8)
+    bits = b''.join([row + padding for row in matrix]).translate(_BITS_TO_ASCII)
+    return int(bits, 2).to_bytes(len(bits) // 8, 'big')
+
+
+def _unpack_matrix(data, width, height):
+    """\
+    Inverse of :py:func:`_pack_matrix`.
+
+    :param data: Bytes-like object of exactly ``_packed_matrix_size(width, height)``
+            bytes.
+    :param int width: Number of modules per row.
+    :param int height: Number of rows.
+    :rtype: tuple of :py:class:`bytearray` instances.
+    """
+    row_bits = width + -width % 8
+    size = row_bits * height
+    bits = f'{int.from_bytes(data, "big"):0{size}b}'.encode('ascii').translate(_ASCII_TO_BITS)
+    return tuple(bytearray(bits[i:i + width]) for i in range(0, size, row_bits))
+
+
+def _packed_matrix_size(width, height):
+    """\
+    Returns the number of bytes of a matrix packed by :py:func:`_pack_matrix`.
+    """
+    return (width + 7) // 8 * height
+
+
+def _expand_row(row, pixels):
+    """\
+    Replaces each byte of the row by the pixel bytes at that index.
+
+    :param bytes row: The row, one byte per module.
+    :param pixels: Sequence of bytes, indexed by the module values.
+    :rtype: bytes
+    """
+    return b''.join([pixels[b] for b in row])
 
 
 def write_txt(matrix, matrix_size, out, border=None, dark='1', light='0'):
@@ -719,13 +1605,10 @@ def write_txt(matrix, matrix_size, out, border=None, dark='1', light='0'):
     :param dark: Character to use for the black modules (default: '1')
     :param light: Character to use for the white modules (default: '0')
     """
-    row_iter = matrix_iter(matrix, matrix_size, scale=1, border=border)
-    colours = (str(light), str(dark))
-    with writable(out, 'wt') as f:
-        write = f.write
-        for row in row_iter:
-            write(''.join(colours[i] for i in row))
-            write('\n')
+    table = {0x0: str(light), 0x1: str(dark)}
+    rows = _matrix_rows(matrix, matrix_size, scale=1, border=border)
+    with _byte_writer(out, 'wt') as f:
+        f.write(''.join([row.decode('latin-1').translate(table) + '\n' for row in rows]).encode('utf-8'))
 
 
 def write_pbm(matrix, matrix_size, out, scale=1, border=None, plain=False):
@@ -744,27 +1627,17 @@ def write_pbm(matrix, matrix_size, out, scale=1, border=None, plain=False):
     :param bool plain: Indicates if a P1 (ASCII encoding) image should be
             created (default: False). By default a (binary) P4 image is created.
     """
-    def pack_row(iterable):
-        """\
-        Packs eight bits into one byte.
-        """
-        return (reduce(lambda x, y: (x << 1) + y, e)
-                for e in zip_longest(*[iter(iterable)] * 8, fillvalue=0x0))
-
     width, height, border = _valid_width_height_and_border(matrix_size, scale, border)
-    row_iter = matrix_iter(matrix, matrix_size, scale, border)
-    with writable(out, 'wb') as f:
-        write = f.write
-        write(f'{("P4" if not plain else "P1")}\n'
-              f'# Created by {CREATOR}\n'
-              f'{width} {height}\n'.encode('ascii'))
-        if not plain:
-            for row in row_iter:
-                write(bytearray(pack_row(row)))
-        else:
-            for row in row_iter:
-                write(b''.join(str(i).encode('ascii') for i in row))
-                write(b'\n')
+    scale = int(scale)
+    if not plain:
+        rows = _packed_rows(matrix, matrix_size, scale, border)
+    else:
+        rows = [row.translate(_BITS_TO_ASCII) + b'\n' for row in _matrix_rows(matrix, matrix_size, scale, border)]
+    with _byte_writer(out, 'wb') as f:
+        f.write(f'{("P4" if not plain else "P1")}\n'
+                f'# Created by {CREATOR}\n'
+                f'{width} {height}\n'.encode('ascii'))
+        f.write(b''.join([row * scale for row in rows]))
 
 
 def write_pam(matrix, matrix_size, out, scale=1, border=None, dark='#000', light='#fff'):
@@ -787,19 +1660,9 @@ def write_pam(matrix, matrix_size, out, scale=1, border=None, dark='#000', light
             See `color` for valid values. In addition, ``None`` is
             accepted which indicates a transparent background.
     """
-    def invert_row_bits(row):
-        """\
-        Inverts the row bits 0 -> 1, 1 -> 0
-        """
-        return bytearray([b ^ 0x1 for b in row])
-
-    def row_to_color_values(row, colours):
-        return b''.join(colours[b] for b in row)
-
     if not dark:
         raise ValueError(f'Invalid stroke color "{dark}"')
     width, height, border = _valid_width_height_and_border(matrix_size, scale, border)
-    row_iter = matrix_iter(matrix, matrix_size, scale, border)
     depth, maxval, tuple_type = 1, 1, 'BLACKANDWHITE'
     transparency = False
     stroke_color = _color_to_rgb_or_rgba(dark, alpha_float=False)
@@ -824,8 +1687,14 @@ def write_pam(matrix, matrix_size, out, scale=1, border=None, dark='#000', light
         depth = 3 if not transparency else 4
         fmt = f'>{depth}B'.encode('ascii')
         colours = (pack(fmt, *bg_color), pack(fmt, *stroke_color))
-    row_filter = invert_row_bits if colours is None else partial(row_to_color_values, colours=colours)
-    with writable(out, 'wb') as f:
+    scale = int(scale)
+    if colours is None:
+        # Inverts the bits 0 -> 1, 1 -> 0
+        rows = [row.translate(_INVERT_BITS) for row in _matrix_rows(matrix, matrix_size, scale, border)]
+    else:
+        colours = [colour * scale for colour in colours]
+        rows = [_expand_row(row, colours) for row in _matrix_rows(matrix, matrix_size, 1, border)]
+    with _byte_writer(out, 'wb') as f:
         write = f.write
         write('P7\n'
               f'# Created by {CREATOR}\n'
@@ -835,8 +1704,7 @@ def write_pam(matrix, matrix_size, out, scale=1, border=None, dark='#000', light
               f'MAXVAL {maxval}\n'
               f'TUPLTYPE {tuple_type}\n'
               'ENDHDR\n'.encode('ascii'))
-        for row in row_iter:
-            write(row_filter(row))
+        write(b''.join([row * scale for row in rows]))
 
 
 @colorful(dark='#000', light='#fff')
@@ -858,14 +1726,19 @@ def write_ppm(matrix, matrix_size, out, colormap, scale=1, border=None):
     width, height, border = _valid_width_height_and_border(matrix_size, scale, border)
     if None in colormap.values():
         raise ValueError('Transparency is not supported')
+    pixels = []
+    color_index = {}
     for mt, clr in colormap.items():
-        colormap[mt] = _color_to_rgb(clr)
-    row_iter = matrix_iter_verbose(matrix, matrix_size, scale, border)
-    with writable(out, 'wb') as f:
-        write = f.write
-        write(f'P6 # Created by {CREATOR}\n{width} {height} 255\n'.encode('ascii'))
-        for row in row_iter:
-            write(b''.join(pack(b'>3B', *colormap[mt]) for mt in row))
+        pixel = pack(b'>3B', *_color_to_rgb(clr)) * scale
+        if pixel not in pixels:
+            pixels.append(pixel)
+        color_index[mt] = pixels.index(pixel)
+    table = _module_code_table(color_index)
+    rows = [_expand_row(row.translate(table), pixels) * scale
+            for row in _module_codes(matrix, matrix_size, border)]
+    with _byte_writer(out, 'wb') as f:
+        f.write(f'P6 # Created by {CREATOR}\n{width} {height} 255\n'.encode('ascii'))
+        f.write(b''.join(rows))
 
 
 def write_xpm(matrix, matrix_size, out, scale=1, border=None, dark='#000',
@@ -891,20 +1764,21 @@ def write_xpm(matrix, matrix_size, out, scale=1, border=None, dark='#000',
             Default: "img".
     """
     width, height, border = _valid_width_height_and_border(matrix_size, scale, border)
-    row_iter = matrix_iter(matrix, matrix_size, scale, border)
     stroke_color = color_to_rgb_hex(dark) if dark is not None else 'None'
     bg_color = color_to_rgb_hex(light) if light is not None else 'None'
-    with writable(out, 'wt') as f:
-        write = f.write
-        write('/* XPM */\n'
-              f'static char *{name}[] = {{\n'
-              f'"{width} {height} 2 1",\n'
-              f'"  c {bg_color}",\n'
-              f'"X c {stroke_color}",\n')
-        for i, row in enumerate(row_iter):
-            write(''.join(chain(['"'], (" " if not b else "X" for b in row),
-                                [f'"{("," if i < height - 1 else "")}\n'])))
-        write('};\n')
+    table = bytes.maketrans(b'\x00\x01', b' X')
+    scale = int(scale)
+    lines = []
+    for row in _matrix_rows(matrix, matrix_size, scale=scale, border=border):
+        lines.extend(repeat(f'"{row.translate(table).decode("ascii")}"', scale))
+    with _byte_writer(out, 'wt') as f:
+        f.write(('/* XPM */\n'
+                 f'static char *{name}[] = {{\n'
+                 f'"{width} {height} 2 1",\n'
+                 f'"  c {bg_color}",\n'
+                 f'"X c {stroke_color}",\n'
+                 + ',\n'.join(lines)
+                 + '\n};\n').encode('utf-8'))
 
 
 def write_xbm(matrix, matrix_size, out, scale=1, border=None, name='img'):
@@ -924,23 +1798,597 @@ def write_xbm(matrix, matrix_size, out, scale=1, border=None, name='img'):
                  ```#define <prefix>_width``` ```static unsigned char <prefix>_bits[]```
     """
     width, height, border = _valid_width_height_and_border(matrix_size, scale, border)
-    row_iter = matrix_iter(matrix, matrix_size, scale, border)
-    with writable(out, 'wt') as f:
+    scale = int(scale)
+    lines = []
+    for packed in _packed_rows(matrix, matrix_size, scale, border):
+        # Reverse bits since XBM uses little endian
+        packed = packed.translate(_REVERSE_BITS)
+        lines.extend(repeat('    ' + ', '.join([_HEX_BYTES[b] for b in packed]), scale))
+    with _byte_writer(out, 'wt') as f:
+        f.write((f'#define {name}_width {width}\n'
+                 f'#define {name}_height {height}\n'
+                 f'static unsigned char {name}_bits[] = {{\n'
+                 + ',\n'.join(lines)
+                 + '\n};\n').encode('utf-8'))
+
+
+# Modified Huffman codes (ITU-T T.4), index: run length
+_G4_WHITE_TERMINATING = (
+    '00110101', '000111', '0111', '1000', '1011', '1100', '1110', '1111',
+    '10011', '10100', '00111', '01000', '001000', '000011', '110100', '110101',
+    '101010', '101011', '0100111', '0001100', '0001000', '0010111', '0000011', '0000100',
+    '0101000', '0101011', '0010011', '0100100', '0011000', '00000010', '00000011', '00011010',
+    '00011011', '00010010', '00010011', '00010100', '00010101', '00010110', '00010111', '00101000',
+    '00101001', '00101010', '00101011', '00101100', '00101101', '00000100', '00000101', '00001010',
+    '00001011', '01010010', '01010011', '01010100', '01010101', '00100100', '00100101', '01011000',
+    '01011001', '01011010', '01011011', '01001010', '01001011', '00110010', '00110011', '00110100',
+)
+_G4_BLACK_TERMINATING = (
+    '0000110111', '010', '11', '10', '011', '0011', '0010', '00011',
+    '000101', '000100', '0000100', '0000101', '0000111', '00000100', '00000111', '000011000',
+    '0000010111', '0000011000', '0000001000', '00001100111', '00001101000', '00001101100',
+    '00000110111', '00000101000', '00000010111', '00000011000', '000011001010', '000011001011',
+    '000011001100', '000011001101', '000001101000', '000001101001', '000001101010', '000001101011',
+    '000011010010', '000011010011', '000011010100', '000011010101', '000011010110', '000011010111',
+    '000001101100', '000001101101', '000011011010', '000011011011', '000001010100', '000001010101',
+    '000001010110', '000001010111', '000001100100', '000001100101', '000001010010', '000001010011',
+    '000000100100', '000000110111', '000000111000', '000000100111', '000000101000', '000001011000',
+    '000001011001', '000000101011', '000000101100', '000001011010', '000001100110', '000001100111',
+)
+# Index: run length // 64 - 1, 64 .. 1728
+_G4_WHITE_MAKEUP = (
+    '11011', '10010', '010111', '0110111', '00110110', '00110111', '01100100', '01100101',
+    '01101000', '01100111', '011001100', '011001101', '011010010', '011010011', '011010100',
+    '011010101', '011010110', '011010111', '011011000', '011011001', '011011010', '011011011',
+    '010011000', '010011001', '010011010', '011000', '010011011',
+)
+_G4_BLACK_MAKEUP = (
+    '0000001111', '000011001000', '000011001001', '000001011011', '000000110011', '000000110100',
+    '000000110101', '0000001101100', '0000001101101', '0000001001010', '0000001001011',
+    '0000001001100', '0000001001101', '0000001110010', '0000001110011', '0000001110100',
+    '0000001110101', '0000001110110', '0000001110111', '0000001010010', '0000001010011',
+    '0000001010100', '0000001010101', '0000001011010', '0000001011011', '0000001100100',
+    '0000001100101',
+)
+# Make-up codes shared by white and black runs, index: run length // 64 - 28, 1792 .. 2560
+_G4_EXTENDED_MAKEUP = (
+    '00000001000', '00000001100', '00000001101', '000000010010', '000000010011', '000000010100',
+    '000000010101', '000000010110', '000000010111', '000000011100', '000000011101', '000000011110',
+    '000000011111',
+)
+# Vertical mode codes, key: a1 - b1
+_G4_VERTICAL = {0: '1', 1: '011', 2: '000011', 3: '0000011', -1: '010', -2: '000010', -3: '0000010'}
+
+
+def _g4_run(run, color):
+    """\
+    Returns the Modified Huffman code of a run.
+
+    :param int run: The run length.
+    :param int color: ``0`` (white) or ``1`` (black)
+    :rtype: str
+    """
+    codes = []
+    while run >= 2624:
+        codes.append(_G4_EXTENDED_MAKEUP[-1])
+        run -= 2560
+    if run >= 1792:
+        codes.append(_G4_EXTENDED_MAKEUP[run // 64 - 28])
+    elif run >= 64:
+        codes.append((_G4_BLACK_MAKEUP if color else _G4_WHITE_MAKEUP)[run // 64 - 1])
+    codes.append((_G4_BLACK_TERMINATING if color else _G4_WHITE_TERMINATING)[run % 64])
+    return ''.join(codes)
+
+
+def _g4_encode(lines, width):
+    """\
+    Encodes the lines according to ITU-T T.6 (CCITT Group 4).
+
+    Each line is provided as list of changing elements, the positions where
+    the color changes. Each line starts with a white pixel, the first
+    changing element is a change from white to black.
+
+    :param lines: Iterable of lists of changing elements.
+    :param int width: The width of the image.
+    :rtype: bytes
+    """
+    bits = []
+    append = bits.append
+    ref = []  # Imaginary white line above the first line
+    end = [width] * 3
+    for changes in lines:
+        if changes == ref:
+            # All changing elements are coded in vertical mode V0, incl. the
+            # end of the line
+            append('1' * (len(changes) + 1))
+            continue
+        cur = changes + end
+        refx = ref + end
+        a0, color, i, j = -1, 0, 0, 0
+        while a0 < width:
+            while cur[i] <= a0:
+                i += 1
+            a1 = cur[i]
+            while j and refx[j - 1] > a0:
+                j -= 1
+            # b1 must have the opposite color of a0: Even changing elements
+            # change to black, odd changing elements change to white
+            while refx[j] <= a0 or j & 1 != color:
+                j += 1
+            b1, b2 = refx[j], refx[j + 1]
+            if b2 < a1:  # Pass mode
+                append('0001')
+                a0 = b2
+            elif -3 <= a1 - b1 <= 3:  # Vertical mode
+                append(_G4_VERTICAL[a1 - b1])
+                a0 = a1
+                color ^= 1
+            else:  # Horizontal mode
+                a2 = cur[i + 1]
+                append('001')
+                append(_g4_run(a1 - max(a0, 0), color))
+                append(_g4_run(a2 - a1, color ^ 1))
+                a0 = a2
+        ref = changes
+    append('000000000001' * 2)  # End of facsimile block
+    bits = ''.join(bits)
+    bits += '0' * (-len(bits) % 8)
+    return int(bits, 2).to_bytes(len(bits) // 8, 'big')
+
+
+def _changing_elements(row):
+    """\
+    Returns the changing elements of a row, the start of each run of equal
+    pixels, except a leading run of white pixels.
+
+    :param bytes row: The row, one pixel (``0`` or ``1``) per byte.
+    :rtype: list[int]
+    """
+    return [m.start() for m in _RUN_PATTERN.finditer(row) if m.start() or row[0]]
+
+
+def _tiff_page(lines, width, height, position, next_page, dpi=None):
+    """\
+    Returns a TIFF page (IFD, additional values and the G4 compressed strip).
+
+    :param lines: Iterable of lists of changing elements, one list per line,
+            see :py:func:`_changing_elements`.
+    :param int width: Image width in pixels.
+    :param int height: Image height in pixels.
+    :param int position: The position of the page within the document.
+    :param bool next_page: Indicates if another page follows.
+    :param int dpi: The (validated) DPI value or ``None``.
+    :rtype: bytes
+    """
+    strip = _g4_encode(lines, width)
+    entries = [(256, 4, width),  # ImageWidth
+               (257, 4, height),  # ImageLength
+               (258, 3, 1),  # BitsPerSample
+               (259, 3, 4),  # Compression: CCITT Group 4
+               (262, 3, 0),  # PhotometricInterpretation: WhiteIsZero
+               (273, 4, 0),  # StripOffsets, set below
+               (277, 3, 1),  # SamplesPerPixel
+               (278, 4, height),  # RowsPerStrip
+               (279, 4, len(strip)),  # StripByteCounts
+               ]
+    extra = []
+    extra_pos = position + 2 + 12 * (len(entries) + (3 if dpi else 0) + 2) + 4
+    if dpi:
+        resolution = pack('<II', dpi, 1)
+        entries.append((282, 5, extra_pos))  # XResolution
+        entries.append((283, 5, extra_pos + 8))  # YResolution
+        extra.extend((resolution, resolution))
+        extra_pos += 16
+    entries.append((293, 4, 0))  # T6Options
+    if dpi:
+        entries.append((296, 3, 2))  # ResolutionUnit: inch
+    software = CREATOR.encode('ascii') + b'\0'
+    software += b'\0' * (len(software) % 2)
+    entries.append((305, 2, extra_pos, len(CREATOR) + 1))  # Software
+    extra.append(software)
+    strip_pos = extra_pos + len(software)
+    entries[5] = (273, 4, strip_pos)
+    strip += b'\0' * (len(strip) % 2)
+    next_ifd = strip_pos + len(strip) if next_page else 0
+    ifd = [pack('<H', len(entries))]
+    for tag, typ, value, *value_count in entries:
+        if typ == 3:
+            ifd.append(pack('<HHIHH', tag, typ, 1, value, 0))
+        else:
+            ifd.append(pack('<HHII', tag, typ, value_count[0] if value_count else 1, value))
+    ifd.append(pack('<I', next_ifd))
+    return b''.join(chain(ifd, extra, (strip,)))
+
+
+def write_tiff(matrix, matrix_size, out, scale=1, border=None, dpi=None):
+    """\
+    Serializes the QR code as bilevel TIFF image with CCITT Group 4
+    compression.
+
+    :param matrix: The matrix to serialize.
+    :param tuple(int, int) matrix_size: Tuple of width and height of the matrix.
+    :param out: Filename or a file-like object supporting to write bytes.
+    :param int scale: Indicates the size of a single module (default: 1 which
+            corresponds to 1 x 1 pixel per module).
+    :param int border: Integer indicating the size of the quiet zone.
+            If set to ``None`` (default), the recommended border size
+            will be used (``4`` for QR Codes, ``2`` for Micro QR Codes).
+    :param int dpi: Optional DPI setting. By default (``None``), the TIFF
+            won't have any resolution information.
+    """
+    _valid_width_height_and_border(matrix_size, scale, border)
+    write_tiff_pages([matrix], out, scale=scale, border=border, dpi=dpi)
+
+
+def write_tiff_pages(matrices, out, scale=1, border=None, dpi=None):
+    """\
+    Serializes several QR codes as multipage TIFF image, one QR code per
+    page.
+
+    See :py:func:`write_tiff` for a description of the parameters. The
+    document is written page by page.
+
+    :param matrices: Iterable of matrices.
+    """
+    def page(matrix, next_page):
+        matrix_size = len(matrix[0]), len(matrix)
+        width, height = get_symbol_size(matrix_size, scale, get_border(matrix_size, border))
+        lines = []
+        for row in _matrix_rows(matrix, matrix_size, 1, border):
+            lines.extend(repeat([pos * scale for pos in _changing_elements(row)], scale))
+        return _tiff_page(lines, width, height, position, next_page, dpi)
+
+    scale = int(scale)
+    check_valid_scale(scale)
+    check_valid_border(border)
+    if dpi:
+        dpi = int(dpi)
+        if dpi < 0:
+            raise ValueError('DPI value must not be negative')
+    matrices = iter(matrices)
+    matrix = next(matrices, None)
+    if matrix is None:
+        raise ValueError('At least one matrix is required')
+    with _byte_writer(out, 'wb') as f:
+        header = b'II*\0' + pack('<I', 8)
+        f.write(header)
+        position = len(header)
+        while matrix is not None:
+            next_matrix = next(matrices, None)
+            data = page(matrix, next_matrix is not None)
+            f.write(data)
+            position += len(data)
+            matrix = next_matrix
+
+
+Tile = namedtuple('Tile', 'x y width height')
+"""\
+Position and size of a symbol (including the quiet zone) within a sheet in
+pixels, see :py:func:`write_sheet`.
+"""
+
+
+def write_sheet(matrices, out, kind=None, cols=None, gap=0, scale=1, border=None, **kw):
+    """\
+    Serializes several QR codes into one raster image (contact sheet).
+
+    The symbols are placed into a grid of ``cols`` columns. Each cell has the
+    size of the largest symbol, smaller symbols are placed into the upper left
+    corner of their cell. The matrices are collected first since the size of
+    the image depends on all symbols. The image is created row by row of
+    symbols, the scanlines are passed to a single encoder, so the
+    uncompressed image is never kept in memory. TIFF keeps the compressed
+    image in memory until it is written since the image directory refers to
+    the size of the compressed data.
+
+    :param matrices: Iterable of matrices.
+    :param out: Filename or a file-like object supporting to write bytes.
+    :param str kind: "png", "pbm", or "tiff". If ``None`` (default), the
+            format is determined by the filename extension.
+    :param int cols: Number of symbols per row. If ``None`` (default), the
+            symbols are arranged in a (nearly) square grid.
+    :param int gap: Space between the symbols in pixels (default: 0).
+            The gap is not scaled.
+    :param int scale: Indicates the size of a single module (default: 1 which
+            corresponds to 1 x 1 pixel per module).
+    :param int border: Integer indicating the size of the quiet zone.
+            If set to ``None`` (default), the recommended border size
+            will be used (``4`` for QR Codes, ``2`` for Micro QR Codes).
+    :param kw: PNG supports ``dark``, ``light``, ``compresslevel`` and
+            ``dpi``, TIFF supports ``dpi``. See :py:func:`write_png` and
+            :py:func:`write_tiff`.
+    :rtype: list[Tile]
+    :return: The position and size of each symbol in the order of
+            `matrices`. The origin is the upper left corner of the image.
+    """
+    if kind is None:
+        fname = getattr(out, 'name', out)
+        kind = fname[fname.rfind('.') + 1:]
+    try:
+        writer = _SHEET_WRITERS[kind.lower()]
+    except KeyError:
+        raise ValueError(f'Unsupported format "{kind}" for a sheet')
+    scale = int(scale)
+    check_valid_scale(scale)
+    check_valid_border(border)
+    matrices = list(matrices)  # The size of the image depends on all symbols
+    if not matrices:
+        raise ValueError('At least one matrix is required')
+    if cols is None:
+        cols = math.ceil(math.sqrt(len(matrices)))
+    if int(cols) != cols or cols < 1:
+        raise ValueError(f'Invalid number of columns "{cols}". Must be a positive integer')
+    if int(gap) != gap or gap < 0:
+        raise ValueError(f'Invalid gap "{gap}". Must be a non-negative integer')
+    cols, gap = int(cols), int(gap)
+    sizes = []
+    for matrix in matrices:
+        matrix_size = len(matrix[0]), len(matrix)
+        sizes.append(get_symbol_size(matrix_size, scale, get_border(matrix_size, border)))
+    cell_width = max(w for w, _ in sizes)
+    cell_height = max(h for _, h in sizes)
+    rows = -(-len(matrices) // cols)
+    width = cols * cell_width + (cols - 1) * gap
+    height = rows * cell_height + (rows - 1) * gap
+    tiles = []
+    for i, (w, h) in enumerate(sizes):
+        row, col = divmod(i, cols)
+        tiles.append(Tile(col * (cell_width + gap), row * (cell_height + gap), w, h))
+    lines = _sheet_lines(matrices, cols, scale, border, gap, cell_width, cell_height, width)
+    writer(lines, width, height, out, **kw)
+    return tiles
+
+
+def _sheet_lines(matrices, cols, scale, border, gap, cell_width, cell_height, width):
+    """\
+    Returns an iterator over the lines of a sheet (see :py:func:`write_sheet`).
+
+    Each item is a tuple of the line (one pixel (``0`` or ``1``) per byte) and
+    the number of times the line is repeated vertically.
+    """
+    blank_cell = bytes(cell_width)
+    separator = bytes(gap)
+    for start in range(0, len(matrices), cols):
+        if start and gap:
+            yield bytes(width), gap
+        symbols = [_matrix_rows(matrix, (len(matrix[0]), len(matrix)), scale, border)
+                   for matrix in matrices[start:start + cols]]
+        for i in range(cell_height // scale):
+            line = separator.join([rows[i].ljust(cell_width, b'\0') if i < len(rows) else blank_cell
+                                   for rows in symbols])
+            yield line.ljust(width, b'\0'), scale
+
+
+def _write_sheet_png(lines, width, height, out, dark='#000', light='#fff', compresslevel=9, dpi=None):
+    """\
+    Writes the lines of a sheet as PNG image, see :py:func:`write_sheet`.
+    """
+    def image_data():
+        for line, times in lines:
+            yield b'\0' + _pack_row(line.translate(table)) + same_as_above * (times - 1)
+
+    if dpi:
+        dpi = int(dpi)
+        if dpi < 0:
+            raise ValueError('DPI value must not be negative')
+        dpi = int(dpi // 0.0254)
+    png_color_type, png_bit_depth, table, _, palette_chunks = _png_palette({consts.TYPE_FINDER_PATTERN_DARK: dark,
+                                                                            consts.TYPE_QUIET_ZONE: light})
+    # The "Up" filter (2) repeats the scanline above, see _iter_png_image
+    same_as_above = b'\2' + bytes((width + 7) // 8)
+    chunks = _iter_png(width, height, png_color_type, png_bit_depth, palette_chunks, image_data(),
+                       compresslevel=compresslevel, dpi=dpi, chunk_size=_CHUNK_SIZE)
+    with _byte_writer(out, 'wb') as f:
+        for chunk in chunks:
+            f.write(chunk)
+
+
+def _write_sheet_pbm(lines, width, height, out):
+    """\
+    Writes the lines of a sheet as PBM image, see :py:func:`write_sheet`.
+    """
+    with _byte_writer(out, 'wb') as f:
+        f.write(f'P4\n# Created by {CREATOR}\n{width} {height}\n'.encode('ascii'))
+        for chunk in _chunked(_pack_row(line) * times for line, times in lines):
+            f.write(chunk)
+
+
+def _write_sheet_tiff(lines, width, height, out, dpi=None):
+    """\
+    Writes the lines of a sheet as TIFF image, see :py:func:`write_sheet`.
+    """
+    if dpi:
+        dpi = int(dpi)
+        if dpi < 0:
+            raise ValueError('DPI value must not be negative')
+    changes = (elements for line, times in lines
+               for elements in repeat(_changing_elements(line), times))
+    header = b'II*\0' + pack('<I', 8)
+    page = _tiff_page(changes, width, height, len(header), False, dpi)
+    with _byte_writer(out, 'wb') as f:
+        f.write(header + page)
+
+
+_SHEET_WRITERS = {
+    'png': _write_sheet_png,
+    'pbm': _write_sheet_pbm,
+    'tiff': _write_sheet_tiff,
+    'tif': _write_sheet_tiff,
+}
+
+
+_HEX_RUN_PATTERN = re.compile('(.)\\1*')
+
+
+def _zpl_repeat_count(count):
+    """\
+    Returns the ZPL repeat count characters for the provided count.
+
+    ``G`` .. ``Y`` represent 1 .. 19, ``g`` .. ``z`` represent 20 .. 400,
+    the values are added up.
+    """
+    codes = 'z' * (count // 400)
+    count %= 400
+    if count >= 20:
+        codes += chr(ord('f') + count // 20)
+        count %= 20
+    if count:
+        codes += chr(ord('F') + count)
+    return codes
+
+
+def _zpl_row(hex_row):
+    """\
+    Returns the row in ZPL's compressed ASCII hexadecimal format.
+
+    :param str hex_row: The row as hexadecimal string.
+    :rtype: str
+    """
+    suffix = ''
+    stripped = hex_row.rstrip('0')
+    if len(stripped) < len(hex_row):
+        suffix = ','  # Fills the rest of the row with zeros
+    else:
+        stripped = hex_row.rstrip('F')
+        if len(stripped) < len(hex_row):
+            suffix = '!'  # Fills the rest of the row with ones
+    runs = [(_zpl_repeat_count(m.end() - m.start()) if m.end() - m.start() > 1 else '') + m.group(1)
+            for m in _HEX_RUN_PATTERN.finditer(stripped)]
+    return ''.join(runs) + suffix
+
+
+def _zpl_label(matrix, scale, border, x, y):
+    """\
+    Returns a ZPL label with a compressed graphic field.
+    """
+    matrix_size = len(matrix[0]), len(matrix)
+    width, height = get_symbol_size(matrix_size, scale, get_border(matrix_size, border))
+    bytes_per_row = (width + 7) // 8
+    lines = []
+    prev_row = None
+    # Vertical scaling: A colon repeats the previous row
+    repeat_row = ':' * scale
+    for row, packed in zip(_matrix_rows(matrix, matrix_size, scale, border),
+                           _packed_rows(matrix, matrix_size, scale, border)):
+        if row == prev_row:
+            lines.append(repeat_row)
+            continue
+        lines.append(_zpl_row(packed.hex().upper()) + repeat_row[1:])
+        prev_row = row
+    total = bytes_per_row * height
+    return (f'^XA\n^FO{x},{y}^GFA,{total},{total},{bytes_per_row},\n'
+            + '\n'.join(lines)
+            + '\n^FS\n^XZ\n')
+
+
+def write_zpl(matrix, matrix_size, out, scale=1, border=None, x=0, y=0):
+    """\
+    Serializes the QR code as ZPL label for Zebra printers.
+
+    The QR code is written as compressed graphic field (``^GFA``).
+
+    :param matrix: The matrix to serialize.
+    :param tuple(int, int) matrix_size: Tuple of width and height of the matrix.
+    :param out: Filename or a file-like object supporting to write bytes.
+    :param int scale: Indicates the size of a single module (default: 1 which
+            corresponds to 1 x 1 dot per module).
+    :param int border: Integer indicating the size of the quiet zone.
+            If set to ``None`` (default), the recommended border size
+            will be used (``4`` for QR Codes, ``2`` for Micro QR Codes).
+    :param int x: Horizontal position of the graphic field on the label in
+            dots (default: 0).
+    :param int y: Vertical position of the graphic field on the label in
+            dots (default: 0).
+    """
+    _valid_width_height_and_border(matrix_size, scale, border)
+    write_zpl_labels([matrix], out, scale=scale, border=border, x=x, y=y)
+
+
+def write_zpl_labels(matrices, out, scale=1, border=None, x=0, y=0):
+    """\
+    Serializes several QR codes as ZPL print job, one QR code per label.
+
+    See :py:func:`write_zpl` for a description of the parameters. The labels
+    are written one by one.
+
+    :param matrices: Iterable of matrices.
+    """
+    scale = int(scale)
+    check_valid_scale(scale)
+    check_valid_border(border)
+    with _byte_writer(out, 'wt') as f:
         write = f.write
-        write(f'#define {name}_width {width}\n'
-              f'#define {name}_height {height}\n'
-              f'static unsigned char {name}_bits[] = {{\n')
-        for i, row in enumerate(row_iter, start=1):
-            iter_ = zip_longest(*[iter(row)] * 8, fillvalue=0x0)
-            # Reverse bits since XBM uses little endian
-            bits = [f'0x{reduce(lambda x, y: (x << 1) + y, bits[::-1]):02x}' for bits in iter_]
-            write('    ')
-            write(', '.join(bits))
-            write(',\n' if i < height else '\n')
-        write('};\n')
+        for matrix in matrices:
+            write(_zpl_label(matrix, scale, border, x, y).encode('ascii'))
+
+
+# Many printers limit the height of a single raster bit image
+_ESCPOS_MAX_RASTER_ROWS = 1024
 
 
-def write_tex(matrix, matrix_size, out, scale=1, border=None, dark='black', unit='pt', url=None):
+def write_escpos(matrix, matrix_size, out, scale=1, border=None, head_width=None,
+                 column=False):
+    """\
+    Serializes the QR code as ESC/POS bit image for receipt printers.
+
+    By default, the QR code is written as raster bit image (``GS v 0``).
+
+    :param matrix: The matrix to serialize.
+    :param tuple(int, int) matrix_size: Tuple of width and height of the matrix.
+    :param out: Filename or a file-like object supporting to write bytes.
+    :param int scale: Indicates the size of a single module (default: 1 which
+            corresponds to 1 x 1 dot per module).
+    :param int border: Integer indicating the size of the quiet zone.
+            If set to ``None`` (default), the recommended border size
+            will be used (``4`` for QR Codes, ``2`` for Micro QR Codes).
+    :param int head_width: Optional width of the print head in dots (i.e.
+            ``384`` or ``576``). If provided, the QR code is centered.
+    :param bool column: Indicates if the 24-dot column format (``ESC *``)
+            should be used instead of the raster format (default: ``False``).
+    """
+    scale = int(scale)
+    width, height, border = _valid_width_height_and_border(matrix_size, scale, border)
+    padding = b''
+    if head_width is not None:
+        if head_width < width:
+            raise ValueError(f'The QR code ({width} dots) does not fit into '
+                             f'the print head width ({head_width} dots)')
+        padding = bytes((head_width - width) // 2)
+        width += len(padding)
+    rows = []
+    for row in _matrix_rows(matrix, matrix_size, scale, border):
+        rows.extend(repeat(padding + row, scale))
+    data = []
+    if not column:
+        bytes_per_row = (width + 7) // 8
+        for i in range(0, height, _ESCPOS_MAX_RASTER_ROWS):
+            band = rows[i:i + _ESCPOS_MAX_RASTER_ROWS]
+            data.append(b'\x1dv0\x00' + pack('<HH', bytes_per_row, len(band)))
+            data.extend(_pack_row(row) for row in band)
+    else:
+        data.append(b'\x1b3\x18')  # Line spacing: 24 dots
+        empty_row = bytes(width)
+        for i in range(0, height, 24):
+            band = rows[i:i + 24]
+            band += [empty_row] * (24 - len(band))
+            # Each column consists of three bytes, the MSB is the topmost dot
+            columns = bytearray(width * 3)
+            for k in range(3):
+                dots = 0
+                for bit, row in enumerate(band[k * 8:k * 8 + 8]):
+                    # Dots are either 0 or 1, no carry to neighboring bytes
+                    dots |= int.from_bytes(row, 'big') << (7 - bit)
+                columns[k::3] = dots.to_bytes(width, 'big')
+            data.append(b'\x1b*\x21' + pack('<H', width))
+            data.append(bytes(columns))
+            data.append(b'\n')
+        data.append(b'\x1b2')  # Default line spacing
+    with _byte_writer(out, 'wb') as f:
+        f.write(b''.join(data))
+
+
+def write_tex(matrix, matrix_size, out, scale=1, border=None, dark='black', unit='pt', url=None,
+              outline=False):
     """\
     Serializes the matrix as LaTeX PGF picture.
 
@@ -961,6 +2409,8 @@ def write_tex(matrix, matrix_size, out, scale=1, border=None, dark='black', unit
     :param unit: Unit of the drawing (default: ``pt``)
     :param url: Optional URL where the QR code should point to. Requires the
             "hyperref" package. Default: ``None``.
+    :param bool outline: Indicates if the modules should be drawn as filled
+            outlines instead of lines (default: ``False``)
     """
     def point(x, y):
         return f'\\pgfqpoint{{{x}{unit}}}{{{y}{unit}}}'
@@ -969,23 +2419,35 @@ def write_tex(matrix, matrix_size, out, scale=1, border=None, dark='black', unit
     check_valid_border(border)
     border = get_border(matrix_size, border)
     end_marker = ''
-    with writable(out, 'wt') as f:
-        write = f.write
+    buff = []
+    write = buff.append
+    with _byte_writer(out, 'wt') as f:
         write(f'% Creator:  {CREATOR}\n')
         write(f'% Date:     {time.strftime("%Y-%m-%dT%H:%M:%S")}\n')
         if url:
             write(f'\\href{{{url}}}{{')
             end_marker = '}'
         write('\\begin{pgfpicture}\n')
-        write(f'  \\pgfsetlinewidth{{{scale}{unit}}}\n')
+        if not outline:
+            write(f'  \\pgfsetlinewidth{{{scale}{unit}}}\n')
         if dark and dark != 'black':
             write(f'  \\color{{{dark}}}\n')
-        x, y = border, -border
-        for (x1, y1), (x2, y2) in matrix_to_lines(matrix, x, y, incby=-1):
-            write(f'  \\pgfpathmoveto{{{point(x1 * scale, y1 * scale)}}}\n')
-            write(f'  \\pgfpathlineto{{{point(x2 * scale, y2 * scale)}}}\n')
-        write('  \\pgfusepath{stroke}\n')
+        if not outline:
+            x, y = border, -border
+            for (x1, y1), (x2, y2) in _matrix_to_lines(matrix, x, y, incby=-1):
+                write(f'  \\pgfpathmoveto{{{point(x1 * scale, y1 * scale)}}}\n')
+                write(f'  \\pgfpathlineto{{{point(x2 * scale, y2 * scale)}}}\n')
+            write('  \\pgfusepath{stroke}\n')
+        else:
+            for polygon in _matrix_to_outlines(matrix, border, border):
+                x, y = polygon[0]
+                write(f'  \\pgfpathmoveto{{{point(x * scale, -y * scale)}}}\n')
+                for x, y in polygon[1:]:
+                    write(f'  \\pgfpathlineto{{{point(x * scale, -y * scale)}}}\n')
+                write('  \\pgfpathclose\n')
+            write('  \\pgfusepath{fill}\n')
         write(f'\\end{{pgfpicture}}{end_marker}\n')
+        f.write(''.join(buff).encode('utf-8'))
 
 
 def write_terminal(matrix, matrix_size, out, border=None):
@@ -999,27 +2461,14 @@ def write_terminal(matrix, matrix_size, out, border=None):
             If set to ``None`` (default), the recommended border size
             will be used (``4`` for QR Codes, ``2`` for Micro QR Codes).
     """
-    with writable(out, 'wt') as f:
-        write = f.write
-        colours = [f'\033[{i}m' for i in (7, 49)]
-        for row in matrix_iter(matrix, matrix_size, scale=1, border=border):
-            prev_bit = -1
-            cnt = 0
-            for bit in row:
-                if bit == prev_bit:
-                    cnt += 1
-                else:
-                    if cnt:
-                        write(colours[prev_bit])
-                        write('  ' * cnt)
-                        write('\033[0m')  # reset color
-                    prev_bit = bit
-                    cnt = 1
-            if cnt:
-                write(colours[prev_bit])
-                write('  ' * cnt)
-                write('\033[0m')  # reset color
-            write('\n')
+    rows = _matrix_rows(matrix, matrix_size, scale=1, border=border)
+    # Precomputed run strings: runs[bit][length] -> color, modules, reset color
+    runs = [[f'\033[{i}m{"  " * cnt}\033[0m' for cnt in range(len(rows[0]) + 1)]
+            for i in (7, 49)]
+    find_runs = _RUN_PATTERN.findall
+    with _byte_writer(out, 'wt') as f:
+        f.write(''.join([''.join([runs[run[0]][len(run)] for run in find_runs(row)]) + '\n'
+                         for row in rows]).encode('ascii'))
 
 
 def write_terminal_win(matrix, matrix_size, border=None):  # pragma: no cover
@@ -1076,17 +2525,43 @@ def write_terminal_compact(matrix, matrix_size, out, border=None):
             If set to ``None`` (default), the recommended border size
             will be used (``4`` for QR Codes, ``2`` for Micro QR Codes).
     """
-    blocks = {(1, 1): ' ',
-              (0, 1): '\u2580',  # Upper half block
-              (1, 0): '\u2584',  # Lower half block
-              (0, 0): '\u2588',  # Full block
+    # Key: top module << 1 | bottom module
+    blocks = {0b11: ' ',
+              0b01: '\u2580',  # Upper half block
+              0b10: '\u2584',  # Lower half block
+              0b00: '\u2588',  # Full block
               }
-    it = [matrix_iter(matrix, matrix_size, scale=1, border=border)] * 2
-    with writable(out, 'wt') as f:
-        write = f.write
-        for top_row, bottom_row in zip_longest(*it, fillvalue=repeat(1)):
-            write(''.join(blocks[pair] for pair in zip(top_row, bottom_row)))
-            write('\n')
+    rows = _matrix_rows(matrix, matrix_size, scale=1, border=border)
+    row_len = len(rows[0])
+    it = [iter(rows)] * 2
+    lines = []
+    for top_row, bottom_row in zip_longest(*it, fillvalue=b'\x01' * row_len):
+        # Modules are either 0 or 1, the combined value fits into one byte
+        pairs = (int.from_bytes(top_row, 'big') << 1 | int.from_bytes(bottom_row, 'big')).to_bytes(row_len, 'big')
+        lines.append(pairs.decode('latin-1').translate(blocks))
+    with _byte_writer(out, 'wt') as f:
+        f.write(('\n'.join(lines) + '\n').encode('utf-8'))
+
+
+def _cache_str_colors(func):
+    """\
+    Decorator which caches the results of a color function for colors
+    provided as strings (i.e. ``darkblue`` or ``#ff0000``).
+
+    Colors provided as tuples are not cached since tuples which compare equal
+    may contain different types, i.e. ``(0, 0, 0, 1)`` and ``(0, 0, 0, 1.0)``
+    represent different alpha values. Errors are never cached.
+    """
+    cached_func = functools.lru_cache(maxsize=256)(func)
+
+    @functools.wraps(func)
+    def wrapper(color, *args, **kw):
+        if type(color) is str:
+            return cached_func(color, *args, **kw)
+        return func(color, *args, **kw)
+    wrapper.cache_clear = cached_func.cache_clear
+    wrapper.cache_info = cached_func.cache_info
+    return wrapper
 
 
 def _color_to_rgb_or_rgba(color, alpha_float=True):
@@ -1110,6 +2585,7 @@ def _color_to_rgb_or_rgba(color, alpha_float=True):
     return rgba
 
 
+@_cache_str_colors
 def _color_to_webcolor(color, allow_css3_colors=True, optimize=True):
     """\
     Returns either a hexadecimal code or a color name.
@@ -1209,6 +2685,7 @@ def _color_to_rgb(color):
     return rgb
 
 
+@_cache_str_colors
 def _color_to_rgba(color, alpha_float=True):
     """\
     Returns a (R, G, B, A) tuple.
@@ -1514,20 +2991,59 @@ def _make_colormap(matrix_width, matrix_height, dark, light,
     :param separator: Color of the separator.
     :param dark_module: Color of the dark module.
     :param quiet_zone: Color of the quiet zone / border.
-    :rtype: dict
+    :rtype: types.MappingProxyType
+    :return: A read-only mapping. Colormaps are cached per symbol size class
+            and color combination, the same mapping may be returned for
+            subsequent calls.
     """
     unsupported = ()
     is_square = matrix_width == matrix_height
     if not is_square:  # rMQR
-        unsupported = [consts.TYPE_DARKMODULE, consts.TYPE_VERSION_DARK, consts.TYPE_VERSION_LIGHT]
+        unsupported = (consts.TYPE_DARKMODULE, consts.TYPE_VERSION_DARK, consts.TYPE_VERSION_LIGHT)
         if matrix_width < 43:  # rMQR R11x27, R13x27, …
-            unsupported.extend((consts.TYPE_ALIGNMENT_PATTERN_DARK, consts.TYPE_ALIGNMENT_PATTERN_LIGHT))
+            unsupported += (consts.TYPE_ALIGNMENT_PATTERN_DARK, consts.TYPE_ALIGNMENT_PATTERN_LIGHT)
     elif matrix_width < 45:  # QR Code version 7
-        unsupported = [consts.TYPE_VERSION_DARK, consts.TYPE_VERSION_LIGHT]
+        unsupported = (consts.TYPE_VERSION_DARK, consts.TYPE_VERSION_LIGHT)
         if matrix_width < 21:  # Lesser than QR Code version 1 => Micro QR code
-            unsupported.extend([consts.TYPE_DARKMODULE,
-                                consts.TYPE_ALIGNMENT_PATTERN_DARK,
-                                consts.TYPE_ALIGNMENT_PATTERN_LIGHT])
+            unsupported += (consts.TYPE_DARKMODULE,
+                            consts.TYPE_ALIGNMENT_PATTERN_DARK,
+                            consts.TYPE_ALIGNMENT_PATTERN_LIGHT)
+    colors = (dark, light, finder_dark, finder_light, data_dark, data_light,
+              version_dark, version_light, format_dark, format_light,
+              alignment_dark, alignment_light, timing_dark, timing_light,
+              separator, dark_module, quiet_zone)
+    if all(map(_is_cacheable_color, colors)):
+        return _cached_colormap(unsupported, colors)
+    return _colormap(unsupported, colors)
+
+
+def _is_cacheable_color(color):
+    """\
+    Returns if the provided color (or ``None`` / ``False``) can be used as part
+    of a cache key.
+
+    Tuples are accepted if they consist of integers only since tuples which
+    compare equal may represent different colors, i.e. ``(0, 0, 0, 1)`` and
+    ``(0, 0, 0, 1.0)``.
+    """
+    if color is None or color is False or type(color) is str:
+        return True
+    return type(color) is tuple and all(type(c) is int for c in color)
+
+
+def _colormap(unsupported, colors):
+    """\
+    Returns a read-only module type -> color mapping.
+
+    :param tuple unsupported: Module types which are not part of the symbol.
+    :param tuple colors: The colors in the order of the keywords of
+            :py:func:`_make_colormap`.
+    :rtype: types.MappingProxyType
+    """
+    (dark, light, finder_dark, finder_light, data_dark, data_light,
+     version_dark, version_light, format_dark, format_light,
+     alignment_dark, alignment_light, timing_dark, timing_light,
+     separator, dark_module, quiet_zone) = colors
     mt2color = {
         consts.TYPE_FINDER_PATTERN_DARK: finder_dark if finder_dark is not False else dark,
         consts.TYPE_FINDER_PATTERN_LIGHT: finder_light if finder_light is not False else light,
@@ -1545,7 +3061,12 @@ def _make_colormap(matrix_width, matrix_height, dark, light,
         consts.TYPE_DARKMODULE: dark_module if dark_module is not False else dark,
         consts.TYPE_QUIET_ZONE: quiet_zone if quiet_zone is not False else light,
     }
-    return {mt: val for mt, val in mt2color.items() if mt not in unsupported}
+    return MappingProxyType({mt: val for mt, val in mt2color.items() if mt not in unsupported})
+
+
+# The number of symbol size classes is small (see _make_colormap), the cache
+# size limits the number of different color combinations.
+_cached_colormap = functools.lru_cache(maxsize=128)(_colormap)
 
 
 _VALID_SERIALIZERS = {
@@ -1561,9 +3082,64 @@ _VALID_SERIALIZERS = {
     'tex': write_tex,
     'xbm': write_xbm,
     'xpm': write_xpm,
+    'tiff': write_tiff,
+    'tif': write_tiff,
+    'zpl': write_zpl,
+    'escpos': write_escpos,
+}
+
+
+# Text formats, written with mode 'wt' (see _byte_writer)
+_TEXT_KINDS = frozenset(('svg', 'eps', 'txt', 'ans', 'tex', 'xbm', 'xpm', 'zpl'))
+
+_MULTIPAGE_SERIALIZERS = {
+    'pdf': write_pdf_pages,
+    'tiff': write_tiff_pages,
+    'tif': write_tiff_pages,
+    'zpl': write_zpl_labels,
 }
 
 
+def _save_to_bytes(save_func, kind, *args, **kw):
+    """\
+    Calls the provided save function with an in-memory stream and returns
+    the serialized document.
+    """
+    if kind is None:
+        raise ValueError('The serialization format ("kind") is required if "out" is None')
+    buff = io.BytesIO()
+    save_func(*args, buff, kind=kind, **kw)
+    return buff.getvalue()
+
+
+def save_multipage(matrices, out, kind=None, **kw):
+    """\
+    Serializes several matrices into one document.
+
+    :param matrices: Iterable of matrices.
+    :param out: A filename or a writable file-like object. If ``None``,
+            the document is returned as :py:class:`bytes`.
+    :param kind: If the desired output format cannot be extracted from
+            the filename, this parameter can be used to indicate the
+            serialization format (i.e. "pdf" or "tiff")
+    :param kw: Any of the supported keywords by the specific serialization
+            method.
+    :rtype: bytes or None
+    """
+    if out is None:
+        return _save_to_bytes(save_multipage, kind, matrices, **kw)
+    if kind is None:
+        fname = getattr(out, 'name', out)
+        ext = fname[fname.rfind('.') + 1:].lower()
+    else:
+        ext = kind.lower()
+    try:
+        serializer = _MULTIPAGE_SERIALIZERS[ext]
+    except KeyError:
+        raise ValueError(f'Unsupported format "{ext}" for multiple QR codes')
+    serializer(matrices, out, **kw)
+
+
 def save(matrix, matrix_size, out, kind=None, **kw):
     """\
     Serializes the matrix in any of the supported formats.
@@ -1574,13 +3150,17 @@ def save(matrix, matrix_size, out, kind=None, **kw):
             ``name`` attribute. If a stream like :py:class:`io.ByteIO` or
             :py:class:`io.StringIO` object without a ``name`` attribute is
             provided, use the `kind` parameter to specify the serialization
-            format.
+            format. If ``None``, the document is returned as
+            :py:class:`bytes` (requires the `kind` parameter).
     :param kind: If the desired output format cannot be extracted from
             the filename, this parameter can be used to indicate the
             serialization format (i.e. "svg" to enforce SVG output)
     :param kw: Any of the supported keywords by the specific serialization
             method.
+    :rtype: bytes or None
     """
+    if out is None:
+        return _save_to_bytes(save, kind, matrix, matrix_size, **kw)
     is_stream = False
     if kind is None:
         try:
@@ -1601,3 +3181,263 @@ def save(matrix, matrix_size, out, kind=None, **kw):
             serializer(matrix, matrix_size, f, **kw)
     else:
         serializer(matrix, matrix_size, out, **kw)
+
+
+def iter_bytes(matrix, matrix_size, kind, chunk_size=_CHUNK_SIZE, **kw):
+    """\
+    Serializes the matrix and returns an iterator over the chunks (bytes) of
+    the document.
+
+    PNG images are created incrementally, the PNG image data is split into
+    several IDAT chunks. The path data of SVG documents is created at once,
+    the document is joined into chunks while the iterator is consumed. The content stream of
+    PDF documents is created at once but the document is returned in chunks.
+    All other formats are serialized into memory and returned in chunks of
+    `chunk_size` bytes.
+
+    The arguments are validated immediately, invalid options raise an error
+    before the iterator is returned.
+
+    :param matrix: The matrix to serialize.
+    :param tuple(int, int) matrix_size: Tuple of width and height of the matrix.
+    :param str kind: The serialization format, i.e. "png" or "svg".
+    :param int chunk_size: The approximate size of the chunks in bytes.
+    :param kw: Any of the supported keywords by the specific serializer.
+    :rtype: iterator over bytes
+    """
+    if chunk_size < 1:
+        raise ValueError(f'Invalid chunk size "{chunk_size}", must be greater than zero')
+    ext = kind.lower()
+    if ext == 'png':
+        png_palette = _png_palette(_colormap_from_keywords(write_png, matrix_size, kw))
+        return _iter_png_image(matrix, matrix_size, png_palette, chunk_size=chunk_size, **kw)
+    if ext == 'svg':
+        colormap = _colormap_from_keywords(write_svg, matrix_size, kw)
+        encoding = kw.get('encoding', 'utf-8') or 'utf-8'
+        chunks = _iter_svg(matrix, matrix_size, colormap, **kw)
+        return _chunked((chunk.encode(encoding) for chunk in chunks), chunk_size)
+    if ext == 'pdf':
+        return _iter_pdf(matrix, matrix_size, chunk_size=chunk_size, **kw)
+    data = save(matrix, matrix_size, None, kind=kind, **kw)
+    return (data[i:i + chunk_size] for i in range(0, len(data), chunk_size))
+
+
+def aiter_bytes(matrix, matrix_size, kind, chunk_size=_CHUNK_SIZE, **kw):
+    """\
+    Asynchronous counterpart of :py:func:`iter_bytes`.
+
+    The arguments are validated immediately, the chunks are created while
+    the asynchronous iterator is consumed.
+
+    :rtype: asynchronous iterator over bytes
+    """
+    return _async_iter(iter_bytes(matrix, matrix_size, kind, chunk_size, **kw))
+
+
+async def _async_iter(iterable):
+    """\
+    Returns an asynchronous iterator over the items of `iterable`.
+    """
+    for item in iterable:
+        yield item
+
+
+def _colormap_from_keywords(serializer, matrix_size, kw):
+    """\
+    Removes the color keywords of a serializer decorated with
+    :py:func:`colorful` from `kw` and returns the colormap.
+    """
+    colors = dict(serializer.default_colors)
+    for name in _COLORMAP_KEYWORDS:
+        if name in kw:
+            colors[name] = kw.pop(name)
+    return _make_colormap(*matrix_size, **colors)
+
+
+class Renderer:
+    """\
+    Serializes QR codes into one format with a fixed set of options.
+
+    The options are validated when the renderer is created. Settings which
+    do not depend on the content of a QR code (i.e. the colormap or the
+    palette of PNG images) are computed once per symbol size and reused for
+    all QR codes of that size.
+
+    A renderer does not change its options and can be shared across threads.
+
+    :param str kind: The serialization format, i.e. "png" or "svg".
+    :param kw: Any of the supported keywords by the specific serializer.
+    """
+    def __init__(self, kind, **kw):
+        kind = kind.lower()
+        self._is_svgz = kind == 'svgz'
+        try:
+            serializer = _VALID_SERIALIZERS[kind if not self._is_svgz else 'svg']
+        except KeyError:
+            raise ValueError(f'Unknown serialization format "{kind}"')
+        self.kind = kind
+        self._compresslevel = kw.pop('compresslevel', 9) if self._is_svgz else None
+        self._prepare = None
+        self._settings = {}
+        default_colors = getattr(serializer, 'default_colors', None)
+        if default_colors is not None:
+            color_kw = dict(default_colors)
+            for name in _COLORMAP_KEYWORDS:
+                if name in kw:
+                    color_kw[name] = kw.pop(name)
+            make_colormap = partial(_make_colormap, **color_kw)
+            if serializer is write_png:
+                serializer = _write_png_image
+                self._prepare = lambda matrix_size: _png_palette(make_colormap(*matrix_size))
+            else:
+                serializer = serializer.__wrapped__
+                self._prepare = lambda matrix_size: make_colormap(*matrix_size)
+        self._serializer = partial(serializer, **kw)
+        # Validate all options with a version 1 symbol
+        self.render((bytearray(21),) * 21, io.BytesIO())
+
+    def render(self, qrcode, out=None):
+        """\
+        Serializes the provided QR code.
+
+        :param qrcode: A :py:class:`segno.QRCode` instance or a matrix.
+        :param out: A filename or a writable file-like object. If ``None``,
+                the serialized QR code is returned as :py:class:`bytes`.
+        :rtype: bytes or None
+        """
+        if out is None:
+            buff = io.BytesIO()
+            self.render(qrcode, buff)
+            return buff.getvalue()
+        matrix = getattr(qrcode, 'matrix', qrcode)
+        matrix_size = len(matrix[0]), len(matrix)
+        args = [matrix, matrix_size, out]
+        if self._prepare is not None:
+            settings = self._settings.get(matrix_size)
+            if settings is None:
+                settings = self._settings.setdefault(matrix_size, self._prepare(matrix_size))
+            args.append(settings)
+        if self._is_svgz:
+            with gzip.open(out, 'wb', compresslevel=self._compresslevel) as f:
+                args[2] = f
+                self._serializer(*args)
+        else:
+            self._serializer(*args)
+
+
+# Archive format -> compression of tarfile (None = ZIP)
+_ARCHIVE_FORMATS = {
+    'zip': None,
+    'tar': '',
+    'tar.gz': 'gz',
+    'tgz': 'gz',
+    'tar.bz2': 'bz2',
+    'tar.xz': 'xz',
+}
+
+# Formats which are compressed already and stored uncompressed in ZIP archives
+_COMPRESSED_KINDS = frozenset(('png', 'svgz'))
+
+
+class ArchiveWriter:
+    """\
+    Writes QR codes as members of a ZIP or TAR archive.
+
+    Each QR code is serialized directly into the archive when it is added,
+    no temporary files are created and the memory usage does not depend on
+    the number of members.
+
+    .. code-block:: python
+
+        >>> import segno
+        >>> with segno.ArchiveWriter('tickets.zip') as archive:
+        ...     for i in range(1000):
+        ...         archive.add(segno.make(f'Ticket {i}'), f'ticket-{i}.png', scale=4)
+
+    ZIP members are written while they are serialized. The size of TAR
+    members must be known in advance, they are serialized into memory first.
+
+    :param out: A filename or a writable file-like object which accepts
+            bytes. The file-like object does not need to be seekable.
+    :param str kind: The archive format: "zip", "tar", "tar.gz" (or "tgz"),
+            "tar.bz2", or "tar.xz". If ``None`` (default), the format is
+            determined by the filename extension.
+    :param bool compress: Indicates if the members of a ZIP archive should be
+            compressed (default: ``True``). Formats which are compressed
+            already (PNG and SVGZ) are always stored uncompressed. The
+            compression of TAR archives depends on `kind`.
+    """
+    def __init__(self, out, kind=None, compress=True):
+        if kind is None:
+            fname = getattr(out, 'name', out)
+            if not isinstance(fname, str):
+                raise ValueError('The archive format ("kind") is required for streams without a name')
+            fname = fname.lower()
+            kind = next((fmt for fmt in _ARCHIVE_FORMATS if fname.endswith('.' + fmt)), fname)
+        kind = kind.lower()
+        try:
+            compression = _ARCHIVE_FORMATS[kind]
+        except KeyError:
+            raise ValueError(f'Unsupported archive format "{kind}"')
+        self.kind = kind
+        self._compress = compress
+        is_filename = isinstance(out, str)
+        if compression is None:
+            self._archive = zipfile.ZipFile(out, 'w')
+            self._add = self._add_zip
+        else:
+            self._archive = tarfile.open(out if is_filename else None, f'w|{compression}',
+                                         fileobj=None if is_filename else out)
+            self._add = self._add_tar
+
+    def add(self, qrcode, name, kind=None, **kw):
+        """\
+        Serializes the QR code and adds it as member to the archive.
+
+        :param qrcode: A :py:class:`segno.QRCode` instance or a matrix.
+        :param str name: The name of the member.
+        :param str kind: The serialization format. If ``None`` (default),
+                the format is determined by the extension of `name`.
+        :param kw: Any of the supported keywords by the specific serializer.
+        """
+        if self._archive is None:
+            raise ValueError('The archive is closed')
+        if kind is None:
+            kind = name[name.rfind('.') + 1:]
+        kind = kind.lower()
+        matrix = getattr(qrcode, 'matrix', qrcode)
+        # Validates the options before the member is created
+        chunks = iter_bytes(matrix, (len(matrix[0]), len(matrix)), kind, **kw)
+        self._add(name, kind, chunks)
+
+    def _add_zip(self, name, kind, chunks):
+        info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        info.external_attr = 0o644 << 16
+        if self._compress and kind not in _COMPRESSED_KINDS:
+            info.compress_type = zipfile.ZIP_DEFLATED
+        with self._archive.open(info, 'w') as f:
+            for chunk in chunks:
+                f.write(chunk)
+
+    def _add_tar(self, name, kind, chunks):
+        data = b''.join(chunks)
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(time.time())
+        info.mode = 0o644
+        self._archive.addfile(info, io.BytesIO(data))
+
+    def close(self):
+        """\
+        Finishes the archive. A file-like object provided as `out` is not
+        closed.
+        """
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,148 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Tests against segno.ArchiveWriter.
+"""
+import io
+import os
+import gzip
+import tarfile
+import zipfile
+import tempfile
+import pytest
+import segno
+
+
+class _Unseekable(io.RawIOBase):
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data.extend(b)
+        return len(b)
+
+
+def _codes():
+    return [segno.make(f'Track {i}') for i in range(5)]
+
+
+def test_zip():
+    codes = _codes()
+    out = io.BytesIO()
+    with segno.ArchiveWriter(out, kind='zip') as archive:
+        for i, qr in enumerate(codes):
+            archive.add(qr, f'track-{i}.png', scale=2)
+            archive.add(qr, f'track-{i}.svg', dark='darkblue')
+    assert 'zip' == archive.kind
+    with zipfile.ZipFile(io.BytesIO(out.getvalue())) as zf:
+        assert zf.testzip() is None
+        assert 2 * len(codes) == len(zf.namelist())
+        for i, qr in enumerate(codes):
+            assert qr.save(None, kind='png', scale=2) == zf.read(f'track-{i}.png')
+            assert qr.save(None, kind='svg', dark='darkblue') == zf.read(f'track-{i}.svg')
+        # PNG is compressed already
+        assert zipfile.ZIP_STORED == zf.getinfo('track-0.png').compress_type
+        assert zipfile.ZIP_DEFLATED == zf.getinfo('track-0.svg').compress_type
+
+
+def test_zip_stored():
+    out = io.BytesIO()
+    with segno.ArchiveWriter(out, kind='zip', compress=False) as archive:
+        archive.add(segno.make('Track'), 'track.svg')
+    with zipfile.ZipFile(io.BytesIO(out.getvalue())) as zf:
+        assert zipfile.ZIP_STORED == zf.getinfo('track.svg').compress_type
+
+
+def test_zip_unseekable():
+    qr = segno.make('Track')
+    out = _Unseekable()
+    with segno.ArchiveWriter(out, kind='zip') as archive:
+        archive.add(qr, 'track.eps')
+        archive.add(qr, 'track.pdf')
+    with zipfile.ZipFile(io.BytesIO(bytes(out.data))) as zf:
+        assert zf.testzip() is None
+        assert qr.save(None, kind='eps') == zf.read('track.eps')
+        assert zf.read('track.pdf').startswith(b'%PDF')
+
+
+@pytest.mark.parametrize('kind', ['tar', 'tar.gz', 'tgz', 'tar.bz2', 'tar.xz'])
+def test_tar(kind):
+    codes = _codes()
+    out = _Unseekable()
+    with segno.ArchiveWriter(out, kind=kind) as archive:
+        for i, qr in enumerate(codes):
+            archive.add(qr, f'track-{i}.txt')
+    with tarfile.open(fileobj=io.BytesIO(bytes(out.data))) as tf:
+        assert [f'track-{i}.txt' for i in range(len(codes))] == tf.getnames()
+        for i, qr in enumerate(codes):
+            assert qr.save(None, kind='txt') == tf.extractfile(f'track-{i}.txt').read()
+
+
+@pytest.mark.parametrize('ext', ['zip', 'tar', 'tar.gz', 'tgz', 'TAR.BZ2', 'tar.xz'])
+def test_filename(ext):
+    qr = segno.make('Track')
+    with tempfile.NamedTemporaryFile('wb', suffix='.' + ext, delete=False) as f:
+        fn = f.name
+    archive = segno.ArchiveWriter(fn)
+    archive.add(qr, 'track', kind='PNG')
+    archive.close()
+    archive.close()
+    assert ext.lower() == archive.kind
+    if ext == 'zip':
+        with zipfile.ZipFile(fn) as zf:
+            data = zf.read('track')
+    else:
+        with tarfile.open(fn) as tf:
+            data = tf.extractfile('track').read()
+    os.unlink(fn)
+    assert qr.save(None, kind='png') == data
+
+
+def test_svgz():
+    qr = segno.make('Track')
+    out = io.BytesIO()
+    with segno.ArchiveWriter(out, kind='zip') as archive:
+        archive.add(qr, 'track.svgz')
+    with zipfile.ZipFile(io.BytesIO(out.getvalue())) as zf:
+        assert qr.save(None, kind='svg') == gzip.decompress(zf.read('track.svgz'))
+        assert zipfile.ZIP_STORED == zf.getinfo('track.svgz').compress_type
+
+
+def test_invalid_options():
+    out = io.BytesIO()
+    with segno.ArchiveWriter(out, kind='zip') as archive:
+        with pytest.raises(ValueError):
+            archive.add(segno.make('Track'), 'track.png', scale=0)
+        with pytest.raises(ValueError):
+            archive.add(segno.make('Track'), 'track.unknown')
+    with zipfile.ZipFile(io.BytesIO(out.getvalue())) as zf:
+        assert [] == zf.namelist()
+
+
+@pytest.mark.parametrize('kind', ['rar', 'gz'])
+def test_unsupported_format(kind):
+    with pytest.raises(ValueError):
+        segno.ArchiveWriter(io.BytesIO(), kind=kind)
+
+
+def test_stream_without_kind():
+    with pytest.raises(ValueError):
+        segno.ArchiveWriter(io.BytesIO())
+
+
+def test_closed():
+    archive = segno.ArchiveWriter(io.BytesIO(), kind='zip')
+    archive.close()
+    with pytest.raises(ValueError):
+        archive.add(segno.make('Track'), 'track.png')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,170 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Tests against the segno.cache module.
+"""
+import io
+import os
+import decimal
+import time
+import shutil
+import tempfile
+import pytest
+import segno
+from segno.cache import RenderCache, CacheStats
+
+
+@pytest.fixture
+def cache_dir():
+    directory = tempfile.mkdtemp()
+    yield os.path.join(directory, 'cache')
+    shutil.rmtree(directory)
+
+
+def _files(directory):
+    return sorted(os.path.join(path, name) for path, _, names in os.walk(directory) for name in names)
+
+
+def test_make(cache_dir):
+    cache = RenderCache(cache_dir)
+    qr = cache.make('Yellow Submarine', error='h', micro=False)
+    assert segno.make('Yellow Submarine', error='h', micro=False) == qr
+    assert CacheStats(0, 1) == cache.stats()
+    cached = cache.make('Yellow Submarine', micro=False, error='h')
+    assert CacheStats(1, 1) == cache.stats()
+    assert qr == cached
+    assert (qr.version, qr.error, qr.mask, qr.mode) == (cached.version, cached.error, cached.mask, cached.mode)
+
+
+@pytest.mark.parametrize('content, kw', [(1, {}), ('1', {'error': 'm'}), (b'1', {}), ('1', {'micro': False})])
+def test_make_different_keys(cache_dir, content, kw):
+    cache = RenderCache(cache_dir)
+    cache.make('1')
+    qr = cache.make(content, **kw)
+    assert CacheStats(0, 2) == cache.stats()
+    assert segno.make(content, **kw) == qr
+
+
+def test_make_shared(cache_dir):
+    RenderCache(cache_dir).make('Yellow Submarine')
+    cache = RenderCache(cache_dir)
+    cache.make('Yellow Submarine')
+    assert CacheStats(1, 0) == cache.stats()
+
+
+def test_make_error(cache_dir):
+    cache = RenderCache(cache_dir)
+    with pytest.raises(segno.DataOverflowError):
+        cache.make('Yellow Submarine', version=1, error='h')
+    assert [] == _files(cache_dir)
+
+
+@pytest.mark.parametrize('kind, kw', [('png', {'scale': 3, 'dark': 'darkblue'}),
+                                      ('svg', {'light': (255, 255, 0)}),
+                                      ('svgz', {}),
+                                      ('txt', {}),
+                                      ('eps', {'border': 0})])
+def test_save(cache_dir, kind, kw):
+    cache = RenderCache(cache_dir)
+    qr = segno.make('Yellow Submarine')
+    expected = qr.save(None, kind=kind, **kw)
+    data = cache.save(qr, None, kind=kind, **kw)
+    if kind != 'svgz':  # Contains a timestamp
+        assert expected == data
+    assert data == cache.save(qr, None, kind=kind.upper(), **kw)
+    assert CacheStats(1, 1) == cache.stats()
+
+
+def test_save_filename(cache_dir):
+    cache = RenderCache(cache_dir)
+    qr = segno.make('Yellow Submarine')
+    fn = os.path.join(os.path.dirname(cache_dir), 'test.png')
+    for _ in range(2):
+        cache.save(qr, fn, scale=2)
+        with open(fn, 'rb') as f:
+            assert qr.save(None, kind='png', scale=2) == f.read()
+    assert CacheStats(1, 1) == cache.stats()
+
+
+def test_save_text_stream(cache_dir):
+    cache = RenderCache(cache_dir)
+    qr = segno.make('Yellow Submarine')
+    for _ in range(2):
+        out = io.StringIO()
+        cache.save(qr, out, kind='svg')
+        assert qr.save(None, kind='svg').decode('utf-8') == out.getvalue()
+    assert CacheStats(1, 1) == cache.stats()
+
+
+def test_save_uncacheable(cache_dir):
+    cache = RenderCache(cache_dir)
+    qr = segno.make('Yellow Submarine')
+    for _ in range(2):
+        cache.save(qr, None, kind='svg', scale=decimal.Decimal('2.5'))
+    assert CacheStats(0, 2) == cache.stats()
+    assert [] == _files(cache_dir)
+
+
+def test_save_no_kind(cache_dir):
+    with pytest.raises(ValueError):
+        RenderCache(cache_dir).save(segno.make('Yellow Submarine'), None)
+
+
+def test_save_invalid_options(cache_dir):
+    cache = RenderCache(cache_dir)
+    with pytest.raises(ValueError):
+        cache.save(segno.make('Yellow Submarine'), None, kind='png', scale=0)
+    assert [] == _files(cache_dir)
+
+
+def test_eviction(cache_dir):
+    qr = segno.make('Yellow Submarine')
+    cache = RenderCache(cache_dir, max_size=5000)
+    past = time.time() - 100
+    files = []
+    for scale in range(1, 6):
+        cache.save(qr, None, kind='txt', border=scale)
+        fn, = set(_files(cache_dir)) - set(files)
+        # Ensure distinct modification times
+        os.utime(fn, (past + scale, past + scale))
+        files.append(fn)
+    assert sum(os.path.getsize(fn) for fn in files) <= 5000
+    # A cache hit marks the entry as recently used
+    cache.save(qr, None, kind='txt', border=1)
+    cache.save(qr, None, kind='txt', border=10)
+    remaining = _files(cache_dir)
+    assert sum(os.path.getsize(fn) for fn in remaining) <= 5000 * .9
+    assert files[0] in remaining
+    assert files[1] not in remaining
+    assert CacheStats(1, 6) == cache.stats()
+
+
+def test_clear(cache_dir):
+    cache = RenderCache(cache_dir)
+    cache.make('Yellow Submarine')
+    cache.clear()
+    assert [] == _files(cache_dir)
+    cache.make('Yellow Submarine')
+    assert CacheStats(0, 2) == cache.stats()
+
+
+def test_ignore_incomplete_entries(cache_dir):
+    cache = RenderCache(cache_dir)
+    os.makedirs(os.path.join(cache_dir, 'ab'))
+    with open(os.path.join(cache_dir, 'ab', '.tmp-123'), 'wb') as f:
+        f.write(b'incomplete')
+    cache.clear()
+    assert [os.path.join(cache_dir, 'ab', '.tmp-123')] == _files(cache_dir)
+
+
+def test_invalid_size(cache_dir):
+    with pytest.raises(ValueError):
+        RenderCache(cache_dir, max_size=0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -14,6 +14,7 @@ import gzip
 import shutil
 import xml.etree.ElementTree as etree
 import pytest
+import segno
 from segno import cli
 
 
@@ -28,6 +29,14 @@ def test_defaults():
     assert args.encoding is None
     assert not args.micro
     assert args.output is None
+    assert args.cache is None
+    assert args.batch is None
+    assert args.output_pattern is None
+    assert 1 == args.jobs
+    assert not args.serve_stdio
+    assert not args.serve_http
+    assert '127.0.0.1' == args.host
+    assert 8000 == args.port
     assert args.border is None
     assert args.dark is None
     assert args.light is None
@@ -66,6 +75,7 @@ def test_defaults():
     assert args.svgversion is None
     assert args.nl is True
     assert args.draw_transparent is False
+    assert args.outline is False
     # Terminal
     assert args.compact is False
 
@@ -318,6 +328,10 @@ def test_error_code():
                                                  ('xbm', '#define ', 'rt'),
                                                  ('xpm', '/* XPM */', 'rt'),
                                                  ('tex', '% Creator: ', 'rt'),
+                                                 ('tiff', b'II*\0', 'rb'),
+                                                 ('tif', b'II*\0', 'rb'),
+                                                 ('zpl', b'^XA\n', 'rb'),
+                                                 ('escpos', b'\x1dv0\x00', 'rb'),
                                                  ])
 def test_output(arg, ext, expected, mode):
     f = tempfile.NamedTemporaryFile('w', suffix=f'.{ext}',
@@ -333,6 +347,154 @@ def test_output(arg, ext, expected, mode):
         os.unlink(f.name)
 
 
+@pytest.mark.parametrize('ext', ['png', 'svgz', 'txt'])
+def test_cache(ext):
+    directory = tempfile.mkdtemp()
+    cache_dir = os.path.join(directory, 'cache')
+    fn = os.path.join(directory, f'test.{ext}')
+    cli.main(['--cache', cache_dir, '-s=2', '-o', fn, 'test'])
+    with open(fn, 'rb') as f:
+        expected = f.read()
+    os.unlink(fn)
+    # QR code and the output file
+    assert 2 == sum(len(files) for _, _, files in os.walk(cache_dir))
+    cli.main(['--cache', cache_dir, '-s=2', '-o', fn, 'test'])
+    with open(fn, 'rb') as f:
+        data = f.read()
+    assert 2 == sum(len(files) for _, _, files in os.walk(cache_dir))
+    shutil.rmtree(directory)
+    assert expected == data
+
+
+def test_cache_sequence():
+    directory = tempfile.mkdtemp()
+    cache_dir = os.path.join(directory, 'cache')
+    cli.main(['--cache', cache_dir, '--seq', '-v=1', '-e=m', '-o=' + os.path.join(directory, 'test.svg'),
+              'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'])
+    number_of_files = len(os.listdir(directory))
+    cached_files = sum(len(files) for _, _, files in os.walk(cache_dir))
+    shutil.rmtree(directory)
+    assert 5 == number_of_files
+    assert 0 == cached_files
+
+
+def test_content_required():
+    with pytest.raises(SystemExit):
+        cli.parse(['--scale=2'])
+
+
+def test_invalid_jobs():
+    with pytest.raises(SystemExit):
+        cli.parse(['--jobs=-1', 'test'])
+
+
+def _write_batch(directory, name, content):
+    fn = os.path.join(directory, name)
+    with open(fn, 'w', encoding='utf-8', newline='') as f:
+        f.write(content)
+    return fn
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_batch_csv(jobs):
+    directory = tempfile.mkdtemp()
+    fn = _write_batch(directory, 'records.csv', 'id,content,scale,dark\n'
+                                                'a,Hello,2,red\n'
+                                                'b,"World, again",,\n'
+                                                ',Third,3,\n')
+    pattern = os.path.join(directory, 'out', '{id}.svg')
+    assert 0 == cli.main(['--batch', fn, '--output-pattern', pattern, '--dark=blue', f'-j={jobs}'])
+    expected = {'a.svg': segno.make('Hello', micro=False).save(None, kind='svg', scale=2, dark='red'),
+                'b.svg': segno.make('World, again', micro=False).save(None, kind='svg', dark='blue'),
+                '3.svg': segno.make('Third', micro=False).save(None, kind='svg', scale=3, dark='blue')}
+    result = {}
+    for name in os.listdir(os.path.join(directory, 'out')):
+        with open(os.path.join(directory, 'out', name), 'rb') as f:
+            result[name] = f.read()
+    shutil.rmtree(directory)
+    assert expected == result
+
+
+def test_batch_jsonl_stdin(monkeypatch, capsys):
+    directory = tempfile.mkdtemp()
+    monkeypatch.setattr('sys.stdin', io.StringIO('{"content": "Hello", "id": 0}\n'
+                                                 '\n'
+                                                 '{"content": 1234, "micro": true, "error": "m"}\n'))
+    pattern = os.path.join(directory, '{id}-{content}.txt')
+    assert 0 == cli.main(['--batch', '-', '--output-pattern', pattern])
+    with open(os.path.join(directory, '0-Hello.txt'), 'rb') as f:
+        assert segno.make('Hello', micro=False).save(None, kind='txt') == f.read()
+    with open(os.path.join(directory, '2-1234.txt'), 'rb') as f:
+        assert segno.make(1234, micro=True, error='m').save(None, kind='txt') == f.read()
+    shutil.rmtree(directory)
+    out, err = capsys.readouterr()
+    assert '' == out
+    assert 'Created 2 QR codes, 0 errors' in err
+
+
+def test_batch_terminal(monkeypatch, capsys):
+    monkeypatch.setattr('sys.stdin', io.StringIO('content\nHello\nWorld\n'))
+    assert 0 == cli.main(['--batch', '-', '--compact'])
+    out, err = capsys.readouterr()
+    expected = io.StringIO()
+    segno.make('Hello', micro=False).terminal(expected, compact=True)
+    segno.make('World', micro=False).terminal(expected, compact=True)
+    assert expected.getvalue() == out
+
+
+def test_batch_errors(monkeypatch, capsys):
+    directory = tempfile.mkdtemp()
+    monkeypatch.setattr('sys.stdin', io.StringIO('{"content": "Hello", "scale": 0}\n'
+                                                 'no json\n'
+                                                 '["content"]\n'
+                                                 '{"id": "no-content"}\n'
+                                                 '{"content": "Hello", "unknown": 1}\n'
+                                                 '{"content": "Hello", "batch": "x"}\n'
+                                                 '{"content": "Hello", "ver": true, "help": true}\n'
+                                                 '{"content": "Too much data", "version": 1, "error": "h", "id": "big"}\n'
+                                                 '{"content": "Hello", "pattern": "x"}\n'
+                                                 '{"content": "Hello", "id": "ok"}\n'))
+    pattern = os.path.join(directory, '{id}.png')
+    assert 1 == cli.main(['--batch', '-', '--output-pattern', pattern])
+    files = os.listdir(directory)
+    shutil.rmtree(directory)
+    assert ['ok.png'] == files
+    out, err = capsys.readouterr()
+    assert '' == out
+    lines = err.splitlines()
+    assert 10 == len(lines)
+    for recno, line in enumerate(lines[:-1], start=1):
+        assert line.startswith(f'Record {recno} ')
+    assert 'Record 4 (id: no-content): ' in err
+    assert 'Unsupported option "ver"' in lines[6]
+    assert 'Created 1 QR codes, 9 errors' == lines[-1]
+
+
+def test_batch_csv_invalid_record(capsys):
+    directory = tempfile.mkdtemp()
+    fn = _write_batch(directory, 'records.csv', 'content\nHello,World\n')
+    assert 1 == cli.main(['--batch', fn, '--output-pattern', os.path.join(directory, '{id}.png')])
+    shutil.rmtree(directory)
+    out, err = capsys.readouterr()
+    assert 'Record 1 (id: 1): Unexpected number of fields' in err
+
+
+def test_batch_cache():
+    directory = tempfile.mkdtemp()
+    cache_dir = os.path.join(directory, 'cache')
+    fn = _write_batch(directory, 'records.jsonl', '{"content": "Hello", "id": 1}\n{"content": "Hello", "id": 2}\n')
+    assert 0 == cli.main(['--batch', fn, '--cache', cache_dir, '--output-pattern',
+                          os.path.join(directory, '{id}.png')])
+    cached_files = sum(len(files) for _, _, files in os.walk(cache_dir))
+    with open(os.path.join(directory, '1.png'), 'rb') as f:
+        data1 = f.read()
+    with open(os.path.join(directory, '2.png'), 'rb') as f:
+        data2 = f.read()
+    shutil.rmtree(directory)
+    assert 2 == cached_files
+    assert data1 == data2
+
+
 def test_terminal(capsys):
     cli.main(['test'])
     out, err = capsys.readouterr()
@@ -605,6 +767,14 @@ def test_draw_transparent():
     assert 1 == len([p for p in paths if p.attrib.get('stroke') is None])
 
 
+def test_outline():
+    args = cli.parse(['--outline', ''])
+    assert args.outline is True
+    for ext in ('svg', 'svgz', 'pdf', 'eps', 'tex'):
+        assert cli.build_config(args, filename=f'x.{ext}')['outline'] is True
+    assert 'outline' not in cli.build_config(args, filename='x.png')
+
+
 def test_png_svg_command():
     args = cli.parse(['--svgversion=1.1', ''])
     assert args.svgversion == 1.1
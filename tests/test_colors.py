@@ -221,5 +221,24 @@ def test_invert_color(color, expected):
     assert expected == colors._invert_color(color)
 
 
+def test_cached_color():
+    colors._color_to_rgba.cache_clear()
+    assert (0, 0, 139, 1.0) == colors._color_to_rgba('darkblue')
+    assert (0, 0, 139, 1.0) == colors._color_to_rgba('darkblue')
+    assert 1 == colors._color_to_rgba.cache_info().hits
+
+
+def test_cached_color_tuple_alpha():
+    # Equal tuples with different types must not share a result
+    assert (0, 0, 0, 1.0) == colors._color_to_rgba((0, 0, 0, 1.0))
+    assert (0, 0, 0, 0.0) == colors._color_to_rgba((0, 0, 0, 1))
+
+
+def test_cached_color_illegal():
+    for i in range(2):
+        with pytest.raises(ValueError):
+            colors._color_to_rgba('unknown')
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -0,0 +1,83 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Tests against the built-in Pillow and NumPy converters.
+"""
+import pytest
+import segno
+from segno import writers
+
+Image = pytest.importorskip('PIL.Image')
+
+
+def _pixels(img):
+    img = img.convert('RGBA')
+    return [img.getpixel((x, y)) for y in range(img.height) for x in range(img.width)]
+
+
+@pytest.mark.parametrize('dark, light, mode', [('#000', '#fff', '1'),
+                                               ('black', 'white', '1'),
+                                               ('#333', '#ddd', 'L'),
+                                               ('darkblue', 'yellow', 'P'),
+                                               ('red', None, 'P'),
+                                               (None, '#00f', 'P'),
+                                               ('#ff000080', 'white', 'P'),
+                                               ])
+def test_pil_image(dark, light, mode):
+    qr = segno.make('Segno', micro=False)
+    img = writers.as_pil_image(qr.matrix, qr.symbol_size(scale=1, border=0), scale=3,
+                               dark=dark, light=light)
+    assert mode == img.mode
+    assert qr.symbol_size(scale=3) == img.size
+    transparent = (0, 0, 0, 0)
+    dark_color = writers._color_to_rgba(dark, alpha_float=False) if dark is not None else transparent
+    light_color = writers._color_to_rgba(light, alpha_float=False) if light is not None else transparent
+    expected = [dark_color if bit else light_color for row in qr.matrix_iter(scale=3) for bit in row]
+    assert expected == _pixels(img)
+
+
+def test_pil_image_border():
+    qr = segno.make_micro('Segno')
+    img = writers.as_pil_image(qr.matrix, qr.symbol_size(scale=1, border=0), scale=2, border=0)
+    assert qr.symbol_size(scale=2, border=0) == img.size
+
+
+def test_pil_image_transparent():
+    qr = segno.make('Segno')
+    with pytest.raises(ValueError):
+        writers.as_pil_image(qr.matrix, qr.symbol_size(scale=1, border=0), dark=None, light=None)
+
+
+def test_to_pil_without_plugin(monkeypatch):
+    from importlib import metadata
+    monkeypatch.setattr(metadata, 'entry_points', lambda **kw: [])
+    qr = segno.make('Segno')
+    img = qr.to_pil(scale=2, dark='darkred')
+    assert 'P' == img.mode
+    assert qr.symbol_size(scale=2) == img.size
+
+
+def test_to_array():
+    np = pytest.importorskip('numpy')
+    qr = segno.make('Segno')
+    arr = qr.to_array(scale=3, border=1)
+    assert np.uint8 == arr.dtype
+    assert qr.symbol_size(scale=3, border=1)[::-1] == arr.shape
+    assert [list(row) for row in qr.matrix_iter(scale=3, border=1)] == arr.tolist()
+    arr[0, 0] = 1  # Writable
+
+
+def test_to_array_no_border():
+    pytest.importorskip('numpy')
+    qr = segno.make_micro('Segno')
+    arr = qr.to_array(border=0)
+    assert [list(row) for row in qr.matrix] == arr.tolist()
+    arr[0, 0] = 0  # Writable
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
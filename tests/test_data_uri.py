@@ -7,7 +7,12 @@
 """\
 Tests against Segno data URI.
 """
+import io
+import base64
+from urllib.parse import quote
+import pytest
 import segno
+from segno import writers
 
 
 def test_data_svg():
@@ -37,6 +42,33 @@ def test_data_svg_no_charset():
     assert val.endswith('%3C%2Fsvg%3E')
 
 
+def test_data_svg_base64():
+    qr = segno.make_qr('A')
+    val = qr.svg_data_uri(base64=True)
+    expected = 'data:image/svg+xml;charset=utf-8;base64,'
+    assert val.startswith(expected)
+    buff = io.BytesIO()
+    qr.save(buff, kind='svg', xmldecl=False, nl=False)
+    assert buff.getvalue() == base64.b64decode(val[len(expected):])
+
+
+def test_data_svg_base64_no_charset():
+    qr = segno.make_qr('A')
+    val = qr.svg_data_uri(base64=True, omit_charset=True)
+    assert val.startswith('data:image/svg+xml;base64,')
+
+
+@pytest.mark.parametrize('encode_minimal', [False, True])
+def test_data_svg_percent_encoding(encode_minimal):
+    qr = segno.make_qr('A')
+    val = qr.svg_data_uri(encode_minimal=encode_minimal, title='Grüße "Segno"', scale=2, dark='red')
+    buff = io.BytesIO()
+    qr.save(buff, kind='svg', xmldecl=False, nl=False, title='Grüße "Segno"', scale=2, dark='red')
+    safe = b" :/='" if encode_minimal else b''
+    expected = quote(writers._replace_quotes(buff.getvalue()), safe=safe)
+    assert 'data:image/svg+xml;charset=utf-8,' + expected == val
+
+
 def test_data_png():
     qr = segno.make_qr('A')
     val = qr.png_data_uri()
@@ -44,6 +76,22 @@ def test_data_png():
     assert val.startswith('data:image/png;base64,')
 
 
+def test_data_png_content():
+    qr = segno.make_qr('A')
+    val = qr.png_data_uri(scale=3, dark='darkblue')
+    buff = io.BytesIO()
+    qr.save(buff, kind='png', scale=3, dark='darkblue')
+    assert buff.getvalue() == base64.b64decode(val[len('data:image/png;base64,'):])
+
+
+def test_data_uri_writer_chunks():
+    # Chunks which are not a multiple of 3 must not produce padding
+    buff = writers._DataURIWriter('data:,')
+    data = bytes(range(256)) * 3
+    for i in range(0, len(data), 7):
+        buff.write(data[i:i + 7])
+    assert 'data:,' + base64.b64encode(data).decode('ascii') == buff.getvalue()
+
+
 if __name__ == '__main__':
-    import pytest
     pytest.main([__file__])
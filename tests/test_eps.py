@@ -113,6 +113,18 @@ def test_scale_float():
     assert f'{scale} {scale} scale' in out.getvalue()
 
 
+def test_outline():
+    qr = segno.make_qr('test')
+    out = io.StringIO()
+    qr.save(out, kind='eps', outline=True)
+    val = out.getvalue()
+    assert '/z { closepath } bind def' in val
+    # Upper left finder pattern, 0, 0 = lower left corner
+    assert '4 25 moveto 7 0 l 0 -7 l -7 0 l z' in val
+    assert '\nfill\n' in val
+    assert 'stroke' not in val
+
+
 def eps_as_matrix(buff, border):
     """\
     Reads the path in the EPS and returns it as list of 0, 1 lists.
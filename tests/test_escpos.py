@@ -0,0 +1,131 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+ESC/POS related tests.
+"""
+import io
+from struct import unpack
+import pytest
+import segno
+from segno import writers
+
+
+def _decode_raster(data):
+    """\
+    Decodes a sequence of GS v 0 raster bit images.
+
+    Returns a list of rows, each row is a string of "0" and "1".
+    """
+    rows = []
+    pos = 0
+    while pos < len(data):
+        assert b'\x1dv0\x00' == data[pos:pos + 4]
+        bytes_per_row, height = unpack('<HH', data[pos + 4:pos + 8])
+        pos += 8
+        for i in range(height):
+            rows.append(''.join(f'{b:08b}' for b in data[pos:pos + bytes_per_row]))
+            pos += bytes_per_row
+    return rows
+
+
+def _decode_column(data):
+    """\
+    Decodes 24-dot ESC * column bands.
+
+    Returns a list of rows, each row is a string of "0" and "1".
+    """
+    assert data.startswith(b'\x1b3\x18')
+    assert data.endswith(b'\x1b2')
+    data = data[3:-2]
+    rows = []
+    pos = 0
+    while pos < len(data):
+        assert b'\x1b*\x21' == data[pos:pos + 3]
+        width, = unpack('<H', data[pos + 3:pos + 5])
+        pos += 5
+        columns = data[pos:pos + width * 3]
+        pos += width * 3
+        assert b'\n' == data[pos:pos + 1]
+        pos += 1
+        for k in range(24):
+            rows.append(''.join(str(columns[x * 3 + k // 8] >> (7 - k % 8) & 0x1) for x in range(width)))
+    return rows
+
+
+def _expected(qr, scale, border, padding=0):
+    return [('0' * padding) + ''.join(str(bit) for bit in row)
+            for row in qr.matrix_iter(scale=scale, border=border)]
+
+
+@pytest.mark.parametrize('scale, border', [(1, None), (3, 0), (8, 2)])
+def test_raster(scale, border):
+    qr = segno.make('Segno ESC/POS')
+    out = io.BytesIO()
+    qr.save(out, kind='escpos', scale=scale, border=border)
+    rows = _decode_raster(out.getvalue())
+    expected = _expected(qr, scale, border)
+    width = len(expected[0])
+    assert expected == [row[:width] for row in rows]
+    assert all(set(row[width:]) <= {'0'} for row in rows)
+
+
+def test_raster_bands():
+    qr = segno.make('Segno', version=40)
+    out = io.BytesIO()
+    qr.save(out, kind='escpos', scale=7)
+    data = out.getvalue()
+    height = qr.symbol_size(scale=7)[1]
+    assert height > writers._ESCPOS_MAX_RASTER_ROWS
+    assert -(-height // writers._ESCPOS_MAX_RASTER_ROWS) == data.count(b'\x1dv0\x00')
+    assert _expected(qr, 7, None) == [row[:qr.symbol_size(scale=7)[0]] for row in _decode_raster(data)]
+
+
+@pytest.mark.parametrize('scale, border', [(1, None), (3, 0), (5, 1)])
+def test_column(scale, border):
+    qr = segno.make('Segno ESC/POS')
+    out = io.BytesIO()
+    qr.save(out, kind='escpos', scale=scale, border=border, column=True)
+    rows = _decode_column(out.getvalue())
+    expected = _expected(qr, scale, border)
+    assert expected == rows[:len(expected)]
+    assert all(set(row) == {'0'} for row in rows[len(expected):])
+
+
+@pytest.mark.parametrize('column', [False, True])
+def test_head_width(column):
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='escpos', scale=4, head_width=384, column=column)
+    width = qr.symbol_size(scale=4)[0]
+    padding = (384 - width) // 2
+    decode = _decode_column if column else _decode_raster
+    rows = decode(out.getvalue())
+    expected = _expected(qr, 4, None, padding)
+    assert expected == [row[:padding + width] for row in rows[:len(expected)]]
+
+
+def test_head_width_too_small():
+    qr = segno.make_qr('test')
+    with pytest.raises(ValueError):
+        qr.save(io.BytesIO(), kind='escpos', scale=10, head_width=200)
+
+
+def test_single_write():
+    class WriteCounter(io.BytesIO):
+        calls = 0
+
+        def write(self, b):
+            self.calls += 1
+            return super().write(b)
+
+    out = WriteCounter()
+    segno.make_qr('test').save(out, kind='escpos', column=True)
+    assert 1 == out.calls
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,125 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Tests against QRCode.iter_bytes and QRCode.aiter_bytes.
+"""
+import io
+import re
+import asyncio
+from struct import unpack
+import pytest
+import segno
+
+
+def _png_chunk_names(data):
+    names = []
+    pos = 8
+    while pos < len(data):
+        length, = unpack('>I', data[pos:pos + 4])
+        names.append(data[pos + 4:pos + 8])
+        pos += length + 12
+    return names
+
+
+def _pdf_strip_date(data):
+    return re.sub(br'CreationDate\(D:[^)]+\)', b'', data)
+
+
+@pytest.mark.parametrize('kind, kw', [('png', {}),
+                                      ('png', {'scale': 4, 'border': 0}),
+                                      ('png', {'scale': 3, 'dark': 'darkred', 'finder_dark': 'blue', 'light': None}),
+                                      ('svg', {}),
+                                      ('svg', {'scale': 2.5, 'dark': 'green', 'data_dark': 'red'}),
+                                      ('svg', {'encoding': None}),
+                                      ('svg', {'encoding': 'latin-1', 'title': 'Ça va'}),
+                                      ('eps', {'scale': 2}),
+                                      ('txt', {}),
+                                      ('xbm', {}),
+                                      ])
+def test_same_as_save(kind, kw):
+    qr = segno.make('Here Comes the Sun', error='h')
+    assert qr.save(None, kind=kind, **kw) == b''.join(qr.iter_bytes(kind, chunk_size=64, **kw))
+
+
+@pytest.mark.parametrize('kw', [{}, {'scale': 3, 'dark': 'blue', 'light': 'yellow', 'outline': True}])
+def test_pdf_same_as_save(kw):
+    qr = segno.make('Here Comes the Sun')
+    expected = _pdf_strip_date(qr.save(None, kind='pdf', **kw))
+    assert expected == _pdf_strip_date(b''.join(qr.iter_bytes('pdf', chunk_size=64, **kw)))
+
+
+def test_png_idat_chunks():
+    qr = segno.make('Here Comes the Sun', version=40)
+    # Without compression, zlib emits the data continuously
+    data = b''.join(qr.iter_bytes('png', chunk_size=256, scale=20, compresslevel=0))
+    names = _png_chunk_names(data)
+    assert b'IHDR' == names[0]
+    assert b'IEND' == names[-1]
+    assert names.count(b'IDAT') > 1
+    Image = pytest.importorskip('PIL.Image')
+    img = Image.open(io.BytesIO(data))
+    assert qr.symbol_size(scale=20) == img.size
+    img.load()
+
+
+def test_png_single_idat():
+    qr = segno.make('Here Comes the Sun', version=40)
+    data = qr.save(None, kind='png', scale=20)
+    assert 1 == _png_chunk_names(data).count(b'IDAT')
+
+
+def test_chunks():
+    qr = segno.make('Here Comes the Sun')
+    chunks = list(qr.iter_bytes('txt', chunk_size=10))
+    assert len(chunks) > 1
+    assert all(len(chunk) == 10 for chunk in chunks[:-1])
+
+
+def test_svg_chunks():
+    qr = segno.make('Here Comes the Sun', version=20)
+    chunks = list(qr.iter_bytes('svg', chunk_size=100))
+    assert len(chunks) > 1
+    assert all(len(chunk) >= 100 for chunk in chunks[:-1])
+
+
+@pytest.mark.parametrize('kind', ['png', 'svg', 'pdf', 'eps'])
+def test_invalid_options(kind):
+    qr = segno.make('Here Comes the Sun')
+    with pytest.raises(ValueError):
+        qr.iter_bytes(kind, scale=0)
+
+
+def test_invalid_chunk_size():
+    qr = segno.make('Here Comes the Sun')
+    with pytest.raises(ValueError):
+        qr.iter_bytes('png', chunk_size=0)
+
+
+def test_unknown_kind():
+    qr = segno.make('Here Comes the Sun')
+    with pytest.raises(ValueError):
+        qr.iter_bytes('unknown')
+
+
+@pytest.mark.parametrize('kind', ['png', 'svg', 'ppm'])
+def test_aiter_bytes(kind):
+    qr = segno.make('Here Comes the Sun')
+
+    async def collect():
+        return b''.join([chunk async for chunk in qr.aiter_bytes(kind, chunk_size=32, scale=2)])
+
+    assert qr.save(None, kind=kind, scale=2) == asyncio.run(collect())
+
+
+def test_aiter_bytes_invalid_options():
+    qr = segno.make('Here Comes the Sun')
+    with pytest.raises(ValueError):
+        qr.aiter_bytes('svg', scale=0)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,150 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Tests against the segno.pack module.
+"""
+import io
+import os
+import tempfile
+import pytest
+import segno
+from segno import pack
+
+
+def _codes():
+    return [segno.make('Ticket 1'), segno.make_micro('2'), segno.make_micro('3', version='M1'),
+            segno.make_qr('Ticket 4', error='h', mask=5), segno.make('x', version=40),
+            segno.make('Ticket 6', boost_error=False)]
+
+
+def _write(codes):
+    out = io.BytesIO()
+    with pack.PackWriter(out) as writer:
+        for i, qr in enumerate(codes):
+            assert i == writer.add(qr)
+    return out.getvalue()
+
+
+def _assert_same(qr, packed):
+    assert isinstance(packed, segno.QRCode)
+    assert qr == packed
+    assert packed == qr
+    assert qr.matrix == packed.matrix
+    assert (qr.version, qr.error, qr.mask, qr.mode, qr.designator, qr.is_micro) \
+        == (packed.version, packed.error, packed.mask, packed.mode, packed.designator, packed.is_micro)
+    assert qr.symbol_size(scale=2) == packed.symbol_size(scale=2)
+
+
+def test_roundtrip():
+    codes = _codes()
+    reader = pack.PackReader(_write(codes))
+    assert len(codes) == len(reader)
+    for qr, packed in zip(codes, reader):
+        _assert_same(qr, packed)
+    _assert_same(codes[-1], reader[-1])
+    _assert_same(codes[2], reader[-len(codes) + 2])
+
+
+def test_save():
+    qr = segno.make('Ticket')
+    packed = pack.PackReader(_write([qr]))[0]
+    assert qr.save(None, kind='png', scale=3) == packed.save(None, kind='png', scale=3)
+    assert qr.svg_data_uri(dark='red') == packed.svg_data_uri(dark='red')
+
+
+def test_file():
+    codes = _codes()
+    with tempfile.NamedTemporaryFile('wb', suffix='.qrp', delete=False) as f:
+        fn = f.name
+    with pack.PackWriter(fn) as writer:
+        for qr in codes:
+            writer.add(qr)
+    with pack.PackReader(fn) as reader:
+        decoded = reader[3]
+        decoded.matrix
+        not_decoded = reader[4]
+        for qr, packed in zip(codes, reader):
+            _assert_same(qr, packed)
+    os.unlink(fn)
+    # Decoded QR codes remain usable
+    assert codes[3] == decoded
+    with pytest.raises(ValueError):
+        not_decoded.matrix
+    with pytest.raises(ValueError):
+        reader[0]
+
+
+def test_record_not_copied(monkeypatch):
+    records = []
+
+    def unpack_matrix(data, width, height):
+        records.append(type(data))
+        return _unpack_matrix(data, width, height)
+
+    _unpack_matrix = pack._unpack_matrix
+    monkeypatch.setattr(pack, '_unpack_matrix', unpack_matrix)
+    qr = segno.make('Ticket')
+    _assert_same(qr, pack.PackReader(_write([qr]))[0])
+    assert [memoryview] == records
+
+
+def test_empty_pack():
+    reader = pack.PackReader(_write([]))
+    assert 0 == len(reader)
+    assert [] == list(reader)
+    with pytest.raises(IndexError):
+        reader[0]
+
+
+@pytest.mark.parametrize('index', [6, -7])
+def test_index_out_of_range(index):
+    reader = pack.PackReader(_write(_codes()))
+    with pytest.raises(IndexError):
+        reader[index]
+
+
+def test_incomplete():
+    out = io.BytesIO()
+    writer = pack.PackWriter(out)
+    writer.add(segno.make('Ticket'))
+    with pytest.raises(ValueError):
+        pack.PackReader(out.getvalue())
+
+
+@pytest.mark.parametrize('data', [b'', b'SEGNOQRP', b'PK\x03\x04' + bytes(40)])
+def test_not_a_pack(data):
+    with pytest.raises(ValueError):
+        pack.PackReader(data)
+
+
+def test_unsupported_version():
+    data = bytearray(_write([]))
+    data[8] = 2
+    with pytest.raises(ValueError):
+        pack.PackReader(bytes(data))
+
+
+def test_empty_file():
+    with tempfile.NamedTemporaryFile('wb', suffix='.qrp', delete=False) as f:
+        fn = f.name
+    with pytest.raises(ValueError):
+        pack.PackReader(fn)
+    os.unlink(fn)
+
+
+def test_closed_writer():
+    out = io.BytesIO()
+    writer = pack.PackWriter(out)
+    writer.close()
+    writer.close()
+    with pytest.raises(ValueError):
+        writer.add(segno.make('Ticket'))
+    assert 0 == len(pack.PackReader(out.getvalue()))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
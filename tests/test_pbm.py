@@ -35,6 +35,21 @@ def test_p1():
     assert out.getvalue().startswith(b'P1')
 
 
+@pytest.mark.parametrize('scale', [1, 3])
+def test_p4_raster(scale):
+    qr = segno.make_micro('test')
+    out = io.BytesIO()
+    qr.save(out, kind='pbm', scale=scale, border=1)
+    width, height = qr.symbol_size(scale=scale, border=1)
+    row_len = (width + 7) // 8
+    data = out.getvalue().split(b'\n', 3)[3]
+    assert row_len * height == len(data)
+    for i, row in enumerate(qr.matrix_iter(scale=scale, border=1)):
+        bits = ''.join(f'{b:08b}' for b in data[i * row_len:(i + 1) * row_len])
+        assert ''.join(str(bit) for bit in row) == bits[:width]
+        assert set(bits[width:]) <= {'0'}
+
+
 _is_size = re.compile(br'^([0-9]+)\s+[0-9]+$').match
 
 
@@ -50,6 +50,31 @@ def test_background_none():
     assert 're' not in graphic
 
 
+def test_outline():
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='pdf', outline=True, compresslevel=0)
+    graphic = _find_graphic(out)
+    assert graphic.endswith(' f')
+    assert ' S' not in graphic
+    assert 'rg' not in graphic
+    assert '1 0 0 -1 4 25 cm' in graphic
+    # Upper left finder pattern and its hole (reversed orientation)
+    assert '1 0 0 -1 4 25 cm 0 0 7 7 re ' in graphic
+    assert ' 6 1 -5 5 re ' in graphic
+    # Polygon
+    assert '8 0 m 9 0 l 9 1 l 10 1 l 10 0 l' in graphic
+
+
+def test_outline_color():
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='pdf', outline=True, light='white', compresslevel=0)
+    graphic = _find_graphic(out)
+    assert '1.0 1.0 1.0 rg' in graphic
+    assert '0.0 0.0 0.0 rg' in graphic
+
+
 def test_background_set():
     qr = segno.make_qr('test')
     out = io.BytesIO()
@@ -99,6 +124,109 @@ def test_illegal_color_float():
         qr.save(out, kind='pdf', dark=color)
 
 
+def test_save_pdf_pages():
+    codes = [segno.make_qr('One'), segno.make_qr('Two'), segno.make_qr('Three')]
+    out = io.BytesIO()
+    segno.save_multipage(codes, out, kind='pdf')
+    pdf = out.getvalue()
+    assert b'/Type /Pages /Kids [7 0 R 10 0 R 13 0 R] /Count 3' in pdf
+    assert 3 == pdf.count(b'/Subtype /Form')
+    assert 3 == pdf.count(b'/Resources 3 0 R')
+    width, height = codes[0].symbol_size()
+    assert 3 == pdf.count(f'/MediaBox [0 0 {width} {height}]'.encode('ascii'))
+
+
+def test_save_pdf_matrix():
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    segno.save_multipage([qr.matrix], out, kind='pdf', compresslevel=0)
+    assert pdf_as_matrix(out, border=4) == [list(row) for row in qr.matrix]
+
+
+def test_save_pdf_shared_symbols():
+    qr = segno.make_qr('Same')
+    out = io.BytesIO()
+    segno.save_multipage([qr, segno.make_qr('Other'), segno.make_qr('Same')], out, kind='pdf')
+    pdf = out.getvalue()
+    assert 2 == pdf.count(b'/Subtype /Form')
+    assert b'<</XObject <</S1 5 0 R /S2 8 0 R>>>>' in pdf
+    assert 3 == pdf.count(b'/Type /Page ')
+
+
+def test_save_pdf_grid():
+    codes = [segno.make_qr(str(i), version=1) for i in range(7)]
+    out = io.BytesIO()
+    segno.save_multipage(codes, out, kind='pdf', scale=2, cols=2, rows=3, gap=5, light='white',
+                         compresslevel=0)
+    pdf = out.getvalue()
+    assert b'/Count 2' in pdf
+    size = codes[0].symbol_size(scale=2)[0]
+    assert 2 == pdf.count(f'/MediaBox [0 0 {2 * size + 5} {3 * size + 10}]'.encode('ascii'))
+    assert b'/Matrix [2 0 0 2 0 0]' in pdf
+    streams = (zlib.decompress(stream).decode('ascii')
+               for stream in re.findall(br'stream\r\n(.*?)\r\nendstream', pdf, re.DOTALL))
+    contents = [graphic for graphic in streams if ' Do ' in graphic]
+    assert 2 == len(contents)
+    first_page = contents[0]
+    assert first_page.startswith('1.0 1.0 1.0 rg 0 {0} {1} {1} re'.format(2 * size + 10, size))
+    assert f'q 1 0 0 1 {size + 5} 0 cm /S6 Do Q' in first_page
+    assert 6 == first_page.count(' Do ')
+    assert 1 == contents[1].count(' Do ')
+
+
+def test_save_pdf_xref():
+    codes = [segno.make_qr(str(i)) for i in range(5)]
+    out = io.BytesIO()
+    segno.save_multipage(codes, out, kind='pdf', dark='red', outline=True)
+    pdf = out.getvalue()
+    startxref = int(re.search(br'startxref\r\n(\d+)\r\n%%EOF\r\n$', pdf).group(1))
+    assert pdf[startxref:].startswith(b'xref\r\n0 20\r\n')
+    offsets = re.findall(br'(\d{10}) 00000 n', pdf[startxref:])
+    assert 19 == len(offsets)
+    for num, offset in enumerate(offsets, start=1):
+        assert pdf[int(offset):].startswith(f'{num} 0 obj '.encode('ascii'))
+
+
+class _Unseekable(io.RawIOBase):
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data.extend(b)
+        return len(b)
+
+
+def test_save_pdf_unseekable():
+    out = _Unseekable()
+    segno.save_multipage((segno.make_qr(str(i)) for i in range(3)), out, kind='pdf')
+    buff = io.BytesIO()
+    segno.save_multipage((segno.make_qr(str(i)) for i in range(3)), buff, kind='pdf')
+    assert re.sub(br'\(D:[^)]+\)', b'', bytes(out.data)) == re.sub(br'\(D:[^)]+\)', b'', buff.getvalue())
+
+
+def test_save_pdf_single_unseekable():
+    qr = segno.make_qr('test')
+    out = _Unseekable()
+    qr.save(out, kind='pdf')
+    buff = io.BytesIO()
+    qr.save(buff, kind='pdf')
+    assert re.sub(br'\(D:[^)]+\)', b'', bytes(out.data)) == re.sub(br'\(D:[^)]+\)', b'', buff.getvalue())
+
+
+def test_save_pdf_empty():
+    with pytest.raises(ValueError):
+        segno.save_multipage([], io.BytesIO(), kind='pdf')
+
+
+@pytest.mark.parametrize('cols, rows, gap', [(0, 1, 0), (1, 0, 0), (1.5, 1, 0), (1, 1, -1)])
+def test_save_pdf_invalid_layout(cols, rows, gap):
+    with pytest.raises(ValueError):
+        segno.save_multipage([segno.make_qr('test')], io.BytesIO(), kind='pdf', cols=cols, rows=rows, gap=gap)
+
+
 def _find_graphic(out):
     val = out.getvalue()
     start = b'stream\r\n'
@@ -11,6 +11,40 @@ import pytest
 import segno
 
 
+class _EntryPoint:
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+        self.loaded = 0
+
+    def load(self):
+        self.loaded += 1
+        return self.value
+
+
+@pytest.fixture
+def entry_points(monkeypatch):
+    """\
+    Replaces the installed plugins by the returned list of entry points.
+    """
+    try:
+        import importlib_metadata as metadata
+    except ImportError:
+        from importlib import metadata
+    eps = []
+    calls = []
+
+    def fake_entry_points(group):
+        assert 'segno.plugin.converter' == group
+        calls.append(group)
+        return list(eps)
+
+    monkeypatch.setattr(metadata, 'entry_points', fake_entry_points)
+    segno.clear_converter_cache()
+    yield eps, calls
+    segno.clear_converter_cache()
+
+
 def test_noplugin():
     qr = segno.make('The Beatles')
     with pytest.raises(AttributeError):
@@ -22,5 +56,70 @@ def test_plugin():
     assert qr.to_pil() is not None
 
 
+def test_plugin_cached(entry_points):
+    eps, calls = entry_points
+    ep = _EntryPoint('rows', lambda qrcode: len(qrcode.matrix))
+    eps.append(ep)
+    qr = segno.make('The Beatles')
+    assert len(qr.matrix) == qr.to_rows()
+    assert len(qr.matrix) == segno.make('Abbey Road').to_rows()
+    with pytest.raises(AttributeError):
+        qr.to_unknown_plugin()
+    assert 1 == len(calls)
+    assert 1 == ep.loaded
+
+
+def test_plugin_first_wins(entry_points):
+    eps, _ = entry_points
+    eps.extend([_EntryPoint('rows', lambda qrcode: 1), _EntryPoint('rows', lambda qrcode: 2)])
+    assert 1 == segno.make('The Beatles').to_rows()
+
+
+def test_plugin_overrides_builtin(entry_points):
+    eps, _ = entry_points
+    eps.append(_EntryPoint('array', lambda qrcode: 'plugin'))
+    assert 'plugin' == segno.make('The Beatles').to_array()
+
+
+def test_clear_converter_cache(entry_points):
+    eps, calls = entry_points
+    qr = segno.make('The Beatles')
+    with pytest.raises(AttributeError):
+        qr.to_rows()
+    eps.append(_EntryPoint('rows', lambda qrcode: len(qrcode.matrix)))
+    with pytest.raises(AttributeError):
+        qr.to_rows()
+    segno.clear_converter_cache()
+    assert len(qr.matrix) == qr.to_rows()
+    assert 2 == len(calls)
+
+
+def test_register_converter(entry_points):
+    eps, _ = entry_points
+    eps.append(_EntryPoint('rows', lambda qrcode: 'plugin'))
+    qr = segno.make('The Beatles', micro=False)
+    segno.register_converter('rows', lambda qrcode, factor=1: len(qrcode.matrix) * factor)
+    try:
+        assert len(qr.matrix) * 2 == qr.to_rows(factor=2)
+        assert len(qr.matrix) == segno.make_sequence('The Beatles', symbol_count=1).to_rows()
+        # Not affected by clearing the cache
+        segno.clear_converter_cache()
+        assert len(qr.matrix) == qr.to_rows()
+    finally:
+        segno.register_converter('rows', None)
+    assert 'plugin' == qr.to_rows()
+
+
+def test_unregister_unknown_converter():
+    segno.register_converter('unknown_plugin', None)
+    with pytest.raises(AttributeError):
+        segno.make('The Beatles').to_unknown_plugin()
+
+
+def test_register_invalid_converter():
+    with pytest.raises(TypeError):
+        segno.register_converter('rows', 'not callable')
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -12,6 +12,7 @@ import os
 import re
 import pytest
 import segno
+from segno import writers
 from png import Reader as PNGReader
 
 
@@ -182,6 +183,21 @@ def test_dpi():
     assert b'\x70\x48\x59\x73\x00\x00\x2E\x23\x00\x00\x2E\x23\x01\x78\xA5\x3F\x76' in out.getvalue()
 
 
+@pytest.mark.parametrize('scale, border', [(1, 0), (3, 2), (5, None)])
+def test_multicolor_pixels(scale, border):
+    qr = segno.make_qr('Segno', version=7)
+    colors = dict(dark='darkblue', light='yellow', data_dark='green', finder_light='red',
+                  version_dark='black', quiet_zone='white')
+    out = io.BytesIO()
+    qr.save(out, kind='png', scale=scale, border=border, **colors)
+    width, height, pixels, meta = PNGReader(bytes=out.getvalue()).asRGB8()
+    assert 4 == PNGReader(bytes=out.getvalue()).read()[3]['bitdepth']
+    colormap = writers._make_colormap(*qr.symbol_size(border=0), **colors)
+    expected = [[writers._color_to_rgb(colormap[mt]) for mt in row]
+                for row in qr.matrix_iter(scale=scale, border=border, verbose=True)]
+    assert expected == [[tuple(row[i:i + 3]) for i in range(0, len(row), 3)] for row in pixels]
+
+
 def png_as_matrix(buff, border):
     """\
     Reads the PNG from the provided buffer and returns the code matrix (list
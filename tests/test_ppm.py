@@ -12,6 +12,7 @@ import io
 from struct import unpack
 import pytest
 import segno
+from segno import consts
 
 
 def test_invalid_color():
@@ -28,6 +29,22 @@ def test_not_plain():
     assert out.getvalue().startswith(b'P6')
 
 
+def test_colorful_raster():
+    scale = 2
+    colors = {'dark': (1, 2, 3), 'light': (4, 5, 6), 'finder_dark': (7, 8, 9),
+              'data_light': (10, 11, 12), 'quiet_zone': (13, 14, 15)}
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='ppm', scale=scale, **colors)
+    data, size = _image_data(out)
+    mt_colors = {consts.TYPE_FINDER_PATTERN_DARK: colors['finder_dark'],
+                 consts.TYPE_DATA_LIGHT: colors['data_light'],
+                 consts.TYPE_QUIET_ZONE: colors['quiet_zone']}
+    expected = b''.join(bytes(mt_colors.get(mt, colors['dark'] if mt >> 8 else colors['light']))
+                        for row in qr.matrix_iter(scale=scale, verbose=True) for mt in row)
+    assert expected == data
+
+
 _size = re.compile(br'^P6\s+(?:#[^\n]+\s*)([0-9]+)\s+(?:[0-9]+\s+[0-9]+\n)').match
 
 
@@ -0,0 +1,91 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Tests against the Renderer.
+"""
+import io
+import gzip
+import threading
+import pytest
+import segno
+
+
+@pytest.mark.parametrize('kind, kw', [('png', {}),
+                                      ('png', {'scale': 3, 'dark': 'darkblue', 'light': None}),
+                                      ('png', {'dark': 'red', 'data_dark': 'green', 'finder_light': 'yellow',
+                                               'dpi': 300}),
+                                      ('svg', {'scale': 2, 'dark': 'red', 'data_dark': 'green'}),
+                                      ('svg', {'xmldecl': False, 'nl': False}),
+                                      ('ppm', {'scale': 2, 'alignment_dark': 'blue'}),
+                                      ('txt', {'border': 1}),
+                                      ('xbm', {'scale': 4}),
+                                      ('zpl', {'x': 10}),
+                                      ])
+def test_same_output_as_save(kind, kw):
+    renderer = segno.Renderer(kind, **kw)
+    for qr in (segno.make('Segno'), segno.make_qr('Segno', version=7), segno.make_micro('A')):
+        assert qr.save(None, kind=kind, **kw) == renderer.render(qr)
+
+
+def test_svgz():
+    qr = segno.make('Segno')
+    renderer = segno.Renderer('SVGZ', scale=2, compresslevel=1)
+    assert 'svgz' == renderer.kind
+    assert qr.save(None, kind='svg', scale=2) == gzip.decompress(renderer.render(qr))
+
+
+def test_render_stream_and_matrix():
+    qr = segno.make('Segno')
+    renderer = segno.Renderer('txt')
+    buff = io.StringIO()
+    renderer.render(qr.matrix, buff)
+    assert qr.save(None, kind='txt').decode('ascii') == buff.getvalue()
+
+
+def test_render_filename(tmp_path):
+    qr = segno.make('Segno')
+    fn = tmp_path / 'segno.png'
+    segno.Renderer('png', scale=2).render(qr, str(fn))
+    assert qr.save(None, kind='png', scale=2) == fn.read_bytes()
+
+
+@pytest.mark.parametrize('kind, kw', [('png', {'scale': 0}),
+                                      ('png', {'border': -1}),
+                                      ('png', {'dark': 'not-a-color'}),
+                                      ('svg', {'unit': 'mm', 'omitsize': True}),
+                                      ('unknown', {}),
+                                      ])
+def test_invalid_options(kind, kw):
+    with pytest.raises(ValueError):
+        segno.Renderer(kind, **kw)
+
+
+def test_unknown_keyword():
+    with pytest.raises(TypeError):
+        segno.Renderer('png', color='red')
+
+
+def test_threads():
+    renderer = segno.Renderer('png', scale=2, dark='darkred', data_dark='green')
+    codes = [segno.make(f'Segno {i}', version=i % 10 + 1) for i in range(40)]
+    expected = [qr.save(None, kind='png', scale=2, dark='darkred', data_dark='green') for qr in codes]
+    results = [None] * len(codes)
+
+    def render(start):
+        for i in range(start, len(codes), 4):
+            results[i] = renderer.render(codes[i])
+
+    threads = [threading.Thread(target=render, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert expected == results
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,81 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Tests against QRCode.save_many and the geometry cache.
+"""
+import io
+import pytest
+import segno
+from segno import writers
+
+
+@pytest.mark.parametrize('kind, kw', [('svg', {'scale': 2, 'border': 1}),
+                                      ('svg', {'dark': 'red', 'data_dark': 'green'}),
+                                      ('svg', {'outline': True}),
+                                      ('png', {'scale': 3, 'dark': 'red', 'data_dark': 'green'}),
+                                      ('eps', {'outline': True, 'scale': 2}),
+                                      ('pdf', {}),
+                                      ('pbm', {'scale': 2}),
+                                      ('xbm', {'scale': 3}),
+                                      ('zpl', {'scale': 2}),
+                                      ('txt', {}),
+                                      ])
+def test_geometry_cache_same_output(kind, kw):
+    qr = segno.make('Segno')
+    expected = qr.save(None, kind=kind, **kw)
+    with writers.geometry_cache():
+        first = qr.save(None, kind=kind, **kw)
+        second = qr.save(None, kind=kind, **kw)
+    if kind in ('eps', 'pdf'):  # Creation date
+        assert len(expected) == len(first) == len(second)
+    else:
+        assert expected == first == second
+
+
+def test_geometry_cache_reuses_results():
+    qr = segno.make('Segno')
+    size = qr.symbol_size(border=0)
+    assert writers._matrix_rows(qr.matrix, size, 2) is not writers._matrix_rows(qr.matrix, size, 2)
+    with writers.geometry_cache():
+        rows = writers._matrix_rows(qr.matrix, size, 2)
+        assert rows is writers._matrix_rows(qr.matrix, size, scale=2, border=None)
+        assert rows is not writers._matrix_rows(qr.matrix, size, 2, border=0)
+        assert writers._dark_runs(qr.matrix) is writers._dark_runs(qr.matrix)
+        assert writers._dark_runs(qr.matrix) is not writers._dark_runs(segno.make('Segno').matrix)
+    assert rows is not writers._matrix_rows(qr.matrix, size, 2)
+
+
+@pytest.mark.parametrize('x, y, incby', [(0, 0, 1), (4, 4.5, 1), (0, 20.5, -1)])
+def test_cached_lines(x, y, incby):
+    qr = segno.make('Segno')
+    expected = list(segno.utils.matrix_to_lines(qr.matrix, x, y, incby))
+    with writers.geometry_cache():
+        assert expected == list(writers._matrix_to_lines(qr.matrix, x, y, incby))
+        assert expected == list(writers._matrix_to_lines(qr.matrix, x, y, incby))
+
+
+def test_save_many():
+    qr = segno.make('Segno')
+    png, svg, txt = io.BytesIO(), io.BytesIO(), io.StringIO()
+    qr.save_many({png: {'kind': 'png', 'scale': 4},
+                  svg: {'kind': 'svg'},
+                  txt: {'kind': 'txt', 'border': 1}}, border=2)
+    assert qr.save(None, kind='png', scale=4, border=2) == png.getvalue()
+    assert qr.save(None, kind='svg', border=2) == svg.getvalue()
+    assert qr.save(None, kind='txt', border=1).decode('ascii') == txt.getvalue()
+
+
+def test_save_many_filenames(tmp_path):
+    qr = segno.make('Segno')
+    targets = {str(tmp_path / 'segno.png'): None, str(tmp_path / 'segno.svg'): {'dark': 'red'}}
+    qr.save_many(targets)
+    assert qr.save(None, kind='png') == (tmp_path / 'segno.png').read_bytes()
+    assert qr.save(None, kind='svg', dark='red') == (tmp_path / 'segno.svg').read_bytes()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
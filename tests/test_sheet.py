@@ -0,0 +1,145 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Tests against segno.render_sheet.
+"""
+import io
+import os
+import tempfile
+import pytest
+import segno
+
+
+def _read_pbm(data):
+    """\
+    Returns the width, height and the rows (one pixel per byte) of a P4 image.
+    """
+    magic, comment, size, pixels = data.split(b'\n', 3)
+    assert b'P4' == magic
+    width, height = (int(i) for i in size.split())
+    bytes_per_row = (width + 7) // 8
+    rows = []
+    for i in range(height):
+        bits = ''.join(f'{b:08b}' for b in pixels[i * bytes_per_row:(i + 1) * bytes_per_row])
+        rows.append(bytes(int(bit) for bit in bits[:width]))
+    assert len(pixels) == height * bytes_per_row
+    return width, height, rows
+
+
+def _image_rows(img):
+    """\
+    Returns the rows of the image, one pixel (1 = black) per byte.
+    """
+    data = img.convert('L').tobytes()
+    return [bytes(int(p == 0) for p in data[y * img.width:(y + 1) * img.width]) for y in range(img.height)]
+
+
+def _assert_tiles(rows, codes, tiles, scale, border=None):
+    for qr, (x, y, w, h) in zip(codes, tiles):
+        assert qr.symbol_size(scale=scale, border=border) == (w, h)
+        expected = [bytes(row) for row in qr.matrix_iter(scale=scale, border=border)]
+        assert expected == [row[x:x + w] for row in rows[y:y + h]]
+
+
+@pytest.mark.parametrize('cols, gap, scale, border', [(None, 0, 1, None),
+                                                      (3, 5, 2, None),
+                                                      (1, 0, 3, 0),
+                                                      (10, 7, 1, 1)])
+def test_pbm(cols, gap, scale, border):
+    codes = [segno.make(f'Sheet {i}', micro=i % 3 == 0) for i in range(7)]
+    out = io.BytesIO()
+    tiles = segno.render_sheet(codes, out, kind='pbm', cols=cols, gap=gap, scale=scale, border=border)
+    assert len(codes) == len(tiles)
+    width, height, rows = _read_pbm(out.getvalue())
+    cell_width = max(w for _, _, w, _ in tiles)
+    cell_height = max(h for _, _, _, h in tiles)
+    cols = cols or 3
+    sheet_rows = -(-len(codes) // cols)
+    assert cols * cell_width + (cols - 1) * gap == width
+    assert sheet_rows * cell_height + (sheet_rows - 1) * gap == height
+    _assert_tiles(rows, codes, tiles, scale, border)
+    # All pixels outside of the tiles are white
+    dark = sum(sum(row) for row in rows)
+    assert dark == sum(sum(row) for qr in codes for row in qr.matrix) * scale * scale
+
+
+def test_tiles():
+    codes = [segno.make_qr('A', version=1), segno.make_qr('B', version=2), segno.make_qr('C', version=1)]
+    tiles = segno.render_sheet(codes, io.BytesIO(), kind='pbm', cols=2, gap=3, scale=2)
+    assert [(0, 0, 58, 58), (69, 0, 66, 66), (0, 69, 58, 58)] == tiles
+    assert 69 == tiles[1].x
+    assert 66 == tiles[1].width
+
+
+def test_png():
+    Image = pytest.importorskip('PIL.Image')
+    codes = [segno.make(f'Sheet {i}', micro=False) for i in range(5)]
+    out = io.BytesIO()
+    tiles = segno.render_sheet(codes, out, kind='png', cols=2, gap=4, scale=3, dpi=300)
+    img = Image.open(io.BytesIO(out.getvalue()))
+    assert (300, 300) == tuple(round(v) for v in img.info['dpi'])
+    rows = _image_rows(img)
+    _assert_tiles(rows, codes, tiles, 3)
+
+
+def test_png_colors():
+    Image = pytest.importorskip('PIL.Image')
+    codes = [segno.make('Sheet', micro=False)] * 2
+    out = io.BytesIO()
+    x, y, w, h = segno.render_sheet(codes, out, kind='png', gap=2, dark='darkblue', light=None)[0]
+    img = Image.open(io.BytesIO(out.getvalue())).convert('RGBA')
+    assert (0, 0, 139, 255) == img.getpixel((x + 4, y + 4))
+    assert 0 == img.getpixel((x + w, y))[3]
+
+
+def test_tiff():
+    Image = pytest.importorskip('PIL.Image')
+    codes = [segno.make(f'Sheet {i}') for i in range(4)]
+    out = io.BytesIO()
+    tiles = segno.render_sheet(codes, out, kind='tiff', gap=1, scale=2)
+    img = Image.open(io.BytesIO(out.getvalue()))
+    assert 'group4' == img.info['compression']
+    rows = _image_rows(img)
+    _assert_tiles(rows, codes, tiles, 2)
+
+
+def test_filename():
+    codes = [segno.make('One'), segno.make('Two')]
+    with tempfile.NamedTemporaryFile('wb', suffix='.pbm', delete=False) as f:
+        fn = f.name
+    tiles = segno.render_sheet(codes, fn)
+    with open(fn, 'rb') as f:
+        data = f.read()
+    os.unlink(fn)
+    _assert_tiles(_read_pbm(data)[2], codes, tiles, 1)
+
+
+def test_generator():
+    tiles = segno.render_sheet((segno.make(str(i)) for i in range(3)), io.BytesIO(), kind='png')
+    assert 3 == len(tiles)
+
+
+@pytest.mark.parametrize('kw', [{'cols': 0}, {'cols': 1.5}, {'gap': -1}, {'gap': 1.5},
+                                {'scale': 0}, {'border': -1}, {'kind': 'svg'}, {'dpi': -1}])
+def test_invalid(kw):
+    kw.setdefault('kind', 'png')
+    with pytest.raises(ValueError):
+        segno.render_sheet([segno.make('test')], io.BytesIO(), **kw)
+
+
+def test_empty():
+    with pytest.raises(ValueError):
+        segno.render_sheet([], io.BytesIO(), kind='png')
+
+
+def test_unsupported_keyword():
+    with pytest.raises(TypeError):
+        segno.render_sheet([segno.make('test')], io.BytesIO(), kind='pbm', dark='red')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -10,6 +10,7 @@ SVG related tests.
 import os
 import re
 import io
+import gzip
 import tempfile
 import xml.etree.ElementTree as etree
 import pytest
@@ -569,6 +570,125 @@ def test_draw_transparent():
     assert 1 == len([p for p in paths if p.attrib.get('stroke') is None])
 
 
+def test_outline():
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='svg', dark='red', outline=True, border=2)
+    root = _parse_xml(out)
+    path = _get_first_path(root)
+    assert 'red' == path.attrib.get('fill')
+    assert path.attrib.get('stroke') is None
+    assert _PATH_CLASS == path.attrib.get('class')
+    d = path.attrib['d']
+    # Upper left finder pattern incl. hole
+    assert d.startswith('M2 2h7v7h-7zm')
+    assert d.endswith('z')
+
+
+def test_outline_background():
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='svg', light='yellow', outline=True, scale=2)
+    root = _parse_xml(out)
+    g = _get_group(root)
+    assert g is not None
+    paths = g.findall('{%s}path' % _SVG_NS)
+    assert 2 == len(paths)
+    assert ['#ff0', '#000'] == [p.attrib.get('fill') for p in paths]
+
+
+def test_outline_multicolor():
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='svg', finder_dark='red', dark_module='blue', outline=True)
+    root = _parse_xml(out)
+    paths = root.findall('.//{%s}path' % _SVG_NS)
+    assert {'red', '#00f', '#000'} == {p.attrib.get('fill') for p in paths}
+    assert all(p.attrib.get('stroke') is None for p in paths)
+    dark_module = [p for p in paths if p.attrib.get('fill') == '#00f'][0]
+    assert 'M12 17h1v1h-1z' == dark_module.attrib['d']
+
+
+def test_outline_draw_transparent():
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='svg', finder_dark='red', outline=True, draw_transparent=True)
+    root = _parse_xml(out)
+    paths = root.findall('.//{%s}path' % _SVG_NS)
+    assert 1 == len([p for p in paths if p.attrib.get('fill') == 'none'])
+
+
+class _WriteCounter(io.BytesIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, b):
+        self.writes += 1
+        return super().write(b)
+
+
+def test_write_chunks():
+    qr = segno.make_qr('Segno', error='h')
+    out = _WriteCounter()
+    qr.save(out, kind='svg', light='yellow', scale=2)
+    # Header, background, dark modules, footer
+    assert 4 == out.writes
+    expected = (b'<?xml version="1.0" encoding="utf-8"?>\n<svg xmlns="http://www.w3.org/2000/svg"'
+                b' width="58" height="58" class="segno"><g transform="scale(2)"><path fill="#ff0" d="M0'
+                b' 0h29v29h-29z"/><path class="qrline" stroke="#000" d="M4 4.5h7m1 0h1m1 0h1m1 0h1m1'
+                b' 0h7m-21 1h1m5 0h1m2 0h4m1 0h1m5 0h1m-21 1h1m1 0h3m1 0h1m2 0h1m1 0h1m2 0h1m1 0h3m1'
+                b' 0h1m-21 1h1m1 0h3m1 0h1m1 0h5m1 0h1m1 0h3m1 0h1m-21 1h1m1 0h3m1 0h1m3 0h1m3 0h1m1 0h3m1'
+                b' 0h1m-21 1h1m5 0h1m2 0h1m1 0h2m1 0h1m5 0h1m-21 1h7m1 0h1m1 0h1m1 0h1m1 0h7m-12 1h1m1'
+                b' 0h2m-11 1h1m1 0h3m1 0h1m1 0h2m1 0h1m3 0h1m2 0h1m-21 1h3m1 0h1m2 0h1m2 0h2m2 0h2m3'
+                b' 0h2m-21 1h4m1 0h6m1 0h4m1 0h4m-18 1h3m1 0h1m1 0h1m4 0h3m3 0h1m-21 1h3m1 0h3m1 0h3m2'
+                b' 0h1m1 0h1m4 0h1m-13 1h1m1 0h2m1 0h3m-16 1h7m3 0h1m1 0h1m3 0h2m1 0h2m-21 1h1m5 0h1m1'
+                b' 0h2m2 0h1m1 0h2m-16 1h1m1 0h3m1 0h1m1 0h4m4 0h1m2 0h2m-21 1h1m1 0h3m1 0h1m3 0h1m1 0h2m1'
+                b' 0h1m2 0h2m-20 1h1m1 0h3m1 0h1m1 0h3m5 0h1m3 0h1m-21 1h1m5 0h1m3 0h4m2 0h1m2 0h1m-20'
+                b' 1h7m4 0h1m3 0h1m3 0h2"/></g></svg>\n')
+    assert expected == out.getvalue()
+
+
+def test_write_chunks_large_path():
+    qr = segno.make_qr('Segno' * 100, error='h')
+    out = _WriteCounter()
+    qr.save(out, kind='svg', light='yellow', scale=2)
+    # The path of the dark modules is split into several chunks
+    assert out.writes > 4
+    root = _parse_xml(out)
+    paths = root.findall('.//{%s}path' % _SVG_NS)
+    assert 2 == len(paths)
+    background = paths[0]
+    assert '#ff0' == background.attrib.get('fill')
+    assert background.attrib.get('stroke') is None
+    assert background.attrib.get('class') is None
+    assert background.attrib['d'].endswith('z')
+
+
+def test_background_opacity():
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='svg', light='#0000ff80')
+    root = _parse_xml(out)
+    background = root.findall('.//{%s}path' % _SVG_NS)[0]
+    assert '#00f' == background.attrib.get('fill')
+    assert '0.5' == background.attrib.get('fill-opacity')
+    assert background.attrib.get('stroke-opacity') is None
+
+
+def test_svgz_equals_svg():
+    qr = segno.make_qr('Segno' * 100)
+    with tempfile.NamedTemporaryFile('wb', suffix='.svgz', delete=False) as f:
+        fn = f.name
+    qr.save(fn, scale=3, light='red')
+    with gzip.open(fn) as f:
+        content = f.read()
+    os.unlink(fn)
+    out = io.BytesIO()
+    qr.save(out, kind='svg', scale=3, light='red')
+    assert out.getvalue() == content
+
+
 def svg_as_matrix(buff, border):
     """\
     Returns the QR code path as list of [0,1] lists.
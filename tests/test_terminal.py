@@ -46,6 +46,30 @@ def test_terminal_compact():
     assert expected == val
 
 
+def test_terminal_odd_height():
+    qr = segno.make_micro('test')
+    out = io.StringIO()
+    qr.terminal(out, border=1, compact=True)
+    lines = out.getvalue().splitlines()
+    assert (len(qr.matrix) + 2 + 1) // 2 == len(lines)
+    # The last line has no bottom row, the missing modules are treated as dark
+    assert set(lines[-1]) == {'\u2580'}
+
+
+@pytest.mark.parametrize('compact', [False, True])
+def test_terminal_single_write(compact):
+    class WriteCounter(io.StringIO):
+        calls = 0
+
+        def write(self, s):
+            self.calls += 1
+            return super().write(s)
+
+    out = WriteCounter()
+    segno.make_qr('test').terminal(out, compact=compact)
+    assert 1 == out.calls
+
+
 def terminal_as_matrix(buff, border):
     """\
     Returns the text QR code as list of [0,1] lists.
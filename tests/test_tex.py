@@ -57,6 +57,19 @@ def test_write_tex_color2():
     assert r'\color{green}' in out.getvalue()
 
 
+def test_write_tex_outline():
+    qr = segno.make_qr('test', error='m', boost_error=False)
+    out = io.StringIO()
+    qr.save(out, kind='tex', border=4, scale=2, outline=True)
+    val = out.getvalue()
+    assert r'\pgfsetlinewidth' not in val
+    assert r'\pgfpathmoveto{\pgfqpoint{8pt}{-8pt}}' in val
+    assert r'\pgfpathlineto{\pgfqpoint{22pt}{-8pt}}' in val
+    assert r'\pgfpathclose' in val
+    assert r'\pgfusepath{fill}' in val
+    assert r'\pgfusepath{stroke}' not in val
+
+
 _COMMAND_PATTERN = re.compile(r'pgfpath(move|line)to{\\pgfqpoint{(-?[0-9]+)pt}{(-?[0-9]+)pt}')
 
 
@@ -0,0 +1,132 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+TIFF related tests.
+"""
+import io
+import os
+import random
+import tempfile
+from struct import unpack
+import pytest
+import segno
+from segno import writers
+from PIL import Image, ImageSequence
+
+
+def _read_ifd(data, offset):
+    """\
+    Returns the tags of the IFD at the provided offset and the offset of the
+    next IFD.
+    """
+    count, = unpack('<H', data[offset:offset + 2])
+    tags = {}
+    for i in range(count):
+        tag, typ, cnt, value = unpack('<HHII', data[offset + 2 + i * 12:offset + 14 + i * 12])
+        if typ == 3:
+            value &= 0xffff
+        tags[tag] = value
+    next_ifd, = unpack('<I', data[offset + 2 + count * 12:offset + 6 + count * 12])
+    return tags, next_ifd
+
+
+def _expected_pixels(matrix_iter):
+    return bytes(0 if bit else 255 for row in matrix_iter for bit in row)
+
+
+def test_header():
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='tiff')
+    data = out.getvalue()
+    assert data.startswith(b'II*\0\x08\0\0\0')
+    tags, next_ifd = _read_ifd(data, 8)
+    width, height = qr.symbol_size()
+    assert width == tags[256]
+    assert height == tags[257]
+    assert 1 == tags[258]
+    assert 4 == tags[259]  # CCITT Group 4
+    assert 0 == tags[262]  # WhiteIsZero
+    assert 0 == next_ifd
+    assert 282 not in tags
+
+
+def test_dpi():
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='tiff', dpi=300)
+    data = out.getvalue()
+    tags, _ = _read_ifd(data, 8)
+    assert 2 == tags[296]
+    assert (300, 1) == unpack('<II', data[tags[282]:tags[282] + 8])
+    assert (300, 1) == unpack('<II', data[tags[283]:tags[283] + 8])
+
+
+def test_invalid_dpi():
+    qr = segno.make_qr('test')
+    with pytest.raises(ValueError):
+        qr.save(io.BytesIO(), kind='tiff', dpi=-1)
+
+
+@pytest.mark.parametrize('scale, border', [(1, None), (4, 0), (3, 1), (30, 2)])
+def test_decode(scale, border):
+    qr = segno.make('Segno TIFF writer', error='h')
+    out = io.BytesIO()
+    qr.save(out, kind='tiff', scale=scale, border=border)
+    img = Image.open(io.BytesIO(out.getvalue()))
+    assert qr.symbol_size(scale=scale, border=border) == img.size
+    assert 'group4' == img.info['compression']
+    assert _expected_pixels(qr.matrix_iter(scale=scale, border=border)) == img.convert('L').tobytes()
+
+
+def test_decode_random():
+    rnd = random.Random(42)
+    for i in range(50):
+        width, height = rnd.randint(1, 30), rnd.randint(1, 30)
+        density = rnd.random()
+        matrix = tuple(bytearray(int(rnd.random() < density) for _ in range(width)) for _ in range(height))
+        # Scale 100 creates runs which require several make-up codes
+        scale = rnd.choice([1, 2, 5, 100])
+        out = io.BytesIO()
+        writers.write_tiff(matrix, (width, height), out, scale=scale, border=1)
+        img = Image.open(io.BytesIO(out.getvalue()))
+        expected = _expected_pixels(segno.utils.matrix_iter(matrix, (width, height), scale, 1))
+        assert expected == img.convert('L').tobytes()
+
+
+def test_multipage():
+    codes = [segno.make(f'Page {i}', micro=i % 2 == 0) for i in range(4)]
+    out = io.BytesIO()
+    segno.save_multipage(codes, out, kind='tiff', scale=2)
+    img = Image.open(io.BytesIO(out.getvalue()))
+    assert len(codes) == img.n_frames
+    for frame, qr in zip(ImageSequence.Iterator(img), codes):
+        assert qr.symbol_size(scale=2) == frame.size
+        assert _expected_pixels(qr.matrix_iter(scale=2)) == frame.convert('L').tobytes()
+
+
+def test_multipage_filename():
+    codes = [segno.make('One'), segno.make('Two')]
+    with tempfile.NamedTemporaryFile('wb', suffix='.tif', delete=False) as f:
+        fn = f.name
+    segno.save_multipage(codes, fn)
+    with open(fn, 'rb') as f:
+        data = f.read()
+    os.unlink(fn)
+    tags, next_ifd = _read_ifd(data, 8)
+    assert next_ifd
+    _, next_ifd = _read_ifd(data, next_ifd)
+    assert 0 == next_ifd
+
+
+def test_multipage_unsupported_kind():
+    with pytest.raises(ValueError):
+        segno.save_multipage([segno.make('test')], io.BytesIO(), kind='png')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,141 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Tests against QRCode.to_bytes, QRCode.from_bytes and pickling.
+"""
+import pickle
+import struct
+import pytest
+import segno
+from segno import encoder
+
+
+def _assert_same(expected, qr):
+    assert segno.QRCode is type(qr)
+    assert expected == qr
+    assert (expected.version, expected.error, expected.mask, expected.mode, expected.designator) \
+        == (qr.version, qr.error, qr.mask, qr.mode, qr.designator)
+    assert expected.symbol_size() == qr.symbol_size()
+
+
+@pytest.mark.parametrize('qr', [segno.make('Getting Better', error='h'),
+                                segno.make_micro('1'),
+                                segno.make_micro('ABC', version='M3'),
+                                segno.make_qr('Getting Better', version=40, mask=7),
+                                segno.make_qr(1234567, mode='numeric'),
+                                segno.make_qr('Getting Better', encoding='utf-8', eci=True)])
+def test_roundtrip(qr):
+    data = qr.to_bytes()
+    assert isinstance(data, bytes)
+    _assert_same(qr, segno.QRCode.from_bytes(data))
+    _assert_same(qr, segno.QRCode.from_bytes(bytearray(data)))
+    _assert_same(qr, segno.QRCode.from_bytes(memoryview(data)))
+
+
+@pytest.mark.parametrize('protocol', range(2, pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    qr = segno.make('Getting Better', micro=False)
+    _assert_same(qr, pickle.loads(pickle.dumps(qr, protocol=protocol)))
+
+
+def test_pickle_compact():
+    qr = segno.make('Getting Better', version=10)
+    assert len(pickle.dumps(qr)) < len(pickle.dumps(qr.matrix)) / 5
+
+
+def test_from_bytes_does_not_encode(monkeypatch):
+    data = segno.make('Getting Better').to_bytes()
+
+    def fail(*args, **kw):
+        raise AssertionError('Unexpected call of the encoder')
+
+    monkeypatch.setattr(encoder, 'encode', fail)
+    segno.QRCode.from_bytes(data)
+
+
+def test_matrix_mutable():
+    qr = segno.QRCode.from_bytes(segno.make('Getting Better').to_bytes())
+    assert all(isinstance(row, bytearray) for row in qr.matrix)
+    qr.matrix[0][0] = 0x0
+    assert 0x0 == qr.matrix[0][0]
+
+
+@pytest.mark.parametrize('data', [b'', b'Q1', b'X' * 100])
+def test_from_bytes_invalid(data):
+    with pytest.raises(ValueError):
+        segno.QRCode.from_bytes(data)
+
+
+@pytest.mark.parametrize('width, height', [(0, 0), (0, 21), (21, 0)])
+def test_from_bytes_invalid_size(width, height):
+    data = b'Q1' + struct.pack('<HHbbbb', width, height, 1, 0, 0, 4)
+    with pytest.raises(ValueError, match='Invalid QR code representation'):
+        segno.QRCode.from_bytes(data)
+
+
+@pytest.mark.parametrize('version, error, mask, mode', [(99, 0, 0, 4),  # Invalid version
+                                                         (-4, 0, 0, 4),
+                                                         (1, 7, 0, 4),  # Invalid error level
+                                                         (1, -128, 0, 4),
+                                                         (-3, 0, 0, 1),  # M1 has no error level
+                                                         (1, 0, 8, 4),  # Invalid mask
+                                                         (-1, 1, 4, 4),
+                                                         (1, 0, 0, 5)])  # Invalid mode
+def test_from_bytes_invalid_header(version, error, mask, mode):
+    data = bytearray(segno.make_qr('Getting Better', version=1).to_bytes())
+    data[6:10] = struct.pack('<bbbb', version, error, mask, mode)
+    with pytest.raises(ValueError, match='Invalid QR code representation'):
+        segno.QRCode.from_bytes(data)
+
+
+def test_from_bytes_size_mismatch():
+    data = bytearray(segno.make_qr('Getting Better', version=1).to_bytes())
+    data[6] = 2
+    with pytest.raises(ValueError, match='Invalid matrix size'):
+        segno.QRCode.from_bytes(data)
+
+
+def test_from_bytes_incomplete():
+    data = segno.make('Getting Better').to_bytes()
+    with pytest.raises(ValueError):
+        segno.QRCode.from_bytes(data[:-1])
+    with pytest.raises(ValueError):
+        segno.QRCode.from_bytes(data + b'\0')
+
+
+def test_sequence():
+    seq = segno.make_sequence('ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789' * 3, version=1)
+    assert len(seq) > 1
+    for restored in (segno.QRCodeSequence.from_bytes(seq.to_bytes()), pickle.loads(pickle.dumps(seq))):
+        assert segno.QRCodeSequence is type(restored)
+        assert len(seq) == len(restored)
+        for qr, qr2 in zip(seq, restored):
+            _assert_same(qr, qr2)
+
+
+def test_sequence_single_item():
+    seq = segno.make_sequence('Getting Better', symbol_count=1)
+    assert 1 == len(seq)
+    restored = pickle.loads(pickle.dumps(seq))
+    assert segno.QRCodeSequence is type(restored)
+    assert seq.designator == restored.designator
+
+
+@pytest.mark.parametrize('data', [b'', b'S1', b'Q1\x01', b'S1\x02'])
+def test_sequence_from_bytes_invalid(data):
+    with pytest.raises(ValueError):
+        segno.QRCodeSequence.from_bytes(data)
+
+
+def test_sequence_from_bytes_trailing_data():
+    data = segno.make_sequence('Getting Better', symbol_count=1).to_bytes()
+    with pytest.raises(ValueError):
+        segno.QRCodeSequence.from_bytes(data + b'\0')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -22,6 +22,33 @@ def test_write_txt():
     assert expected == val[:len(expected)]
 
 
+def test_write_txt_strings():
+    qr = segno.make_qr('test')
+    out = io.StringIO()
+    qr.save(out, kind='txt', border=1, dark='##', light='..')
+    lines = out.getvalue().splitlines()
+    assert len(qr.matrix) + 2 == len(lines)
+    assert '..' * (len(qr.matrix[0]) + 2) == lines[0]
+    assert '..' + '##' * 7 + '..' == lines[1][:18]
+
+
+class _WriteCounter(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def write(self, s):
+        self.calls += 1
+        return super().write(s)
+
+
+def test_write_txt_single_write():
+    qr = segno.make_qr('test')
+    out = _WriteCounter()
+    qr.save(out, kind='txt')
+    assert 1 == out.calls
+
+
 def txt_as_matrix(buff, border):
     """\
     Returns the text QR code as list of [0,1] lists.
@@ -8,6 +8,7 @@
 Tests against the ``utils`` module.
 """
 import pytest
+import segno
 from segno import utils
 
 
@@ -77,5 +78,60 @@ def test_invalid_border(border):
         utils.check_valid_border(border)
 
 
+def _outlines_to_matrix(polygons, width, height):
+    """\
+    Converts the polygons into a matrix using the nonzero winding rule.
+    """
+    res = [[0] * width for i in range(height)]
+    for polygon in polygons:
+        for (x1, y1), (x2, y2) in zip(polygon, polygon[1:] + polygon[:1]):
+            if x1 != x2:
+                continue
+            direction = 1 if y2 > y1 else -1
+            for y in range(min(y1, y2), max(y1, y2)):
+                for x in range(x1):
+                    res[y][x] += direction
+    assert all(v in (0, 1) for row in res for v in row)
+    return [bytearray(row) for row in res]
+
+
+def test_outlines_single_module():
+    matrix = [bytearray([0, 0, 0]), bytearray([0, 1, 0]), bytearray([0, 0, 0])]
+    assert [[(1, 1), (2, 1), (2, 2), (1, 2)]] == utils.matrix_to_outlines(matrix)
+    assert [[(5, 6), (6, 6), (6, 7), (5, 7)]] == utils.matrix_to_outlines(matrix, 4, 5)
+
+
+def test_outlines_hole():
+    matrix = [bytearray([1, 1, 1]), bytearray([1, 0, 1]), bytearray([1, 1, 1])]
+    outer, hole = utils.matrix_to_outlines(matrix)
+    assert [(0, 0), (3, 0), (3, 3), (0, 3)] == outer
+    assert [(2, 1), (1, 1), (1, 2), (2, 2)] == hole
+    assert matrix == _outlines_to_matrix([outer, hole], 3, 3)
+
+
+def test_outlines_diagonal():
+    matrix = [bytearray([1, 0]), bytearray([0, 1])]
+    assert [[(0, 0), (1, 0), (1, 1), (0, 1)],
+            [(1, 1), (2, 1), (2, 2), (1, 2)]] == utils.matrix_to_outlines(matrix)
+
+
+def test_outlines_empty():
+    assert [] == utils.matrix_to_outlines([bytearray(3), bytearray(3)])
+
+
+@pytest.mark.parametrize('version', ['M1', 'M4', 1, 7, 25])
+def test_outlines(version):
+    qr = segno.make('1', version=version)
+    matrix = list(qr.matrix)
+    width, height = qr.symbol_size(border=0)
+    polygons = utils.matrix_to_outlines(matrix)
+    for polygon in polygons:
+        assert 0 == len(polygon) % 2
+        for i, ((x1, y1), (x2, y2)) in enumerate(zip(polygon, polygon[1:] + polygon[:1])):
+            # Horizontal and vertical edges alternate
+            assert (y1 == y2) if i % 2 == 0 else (x1 == x2)
+    assert matrix == _outlines_to_matrix(polygons, width, height)
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
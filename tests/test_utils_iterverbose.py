@@ -390,5 +390,37 @@ def test_convert_to_boolean():
     assert expected == res
 
 
+def test_module_type_template_cached():
+    template = utils.get_module_type_template((21, 21))
+    assert template is utils.get_module_type_template((21, 21))
+    assert 21 == len(template)
+    assert all(isinstance(row, bytes) and len(row) == 21 for row in template)
+    assert all(code % 2 == 0 for row in template for code in row)
+
+
+@pytest.mark.parametrize('version', ['M1', 'M4', 1, 2, 7, 40])
+def test_module_codes(version):
+    code = encoder.encode('12345', version=version)
+    matrix = code.matrix
+    matrix_size = len(matrix[0]), len(matrix)
+    expected = list(utils.matrix_iter_verbose(matrix, matrix_size, border=3))
+    res = [tuple(utils.MODULE_CODE_TO_TYPE[c] for c in row)
+           for row in utils.matrix_iter_module_codes(matrix, matrix_size, border=3)]
+    assert expected == res
+    res = [bytearray([c & 0x1 for c in row])
+           for row in utils.matrix_iter_module_codes(matrix, matrix_size, border=0)]
+    assert list(matrix) == res
+
+
+def test_verbose_scale():
+    code = encoder.encode('Segno', version=7)
+    matrix = code.matrix
+    matrix_size = len(matrix[0]), len(matrix)
+    rows = list(utils.matrix_iter_verbose(matrix, matrix_size, scale=1))
+    rows_scaled = list(utils.matrix_iter_verbose(matrix, matrix_size, scale=3))
+    assert len(rows) * 3 == len(rows_scaled)
+    assert [tuple(mt for mt in row for _ in range(3)) for row in rows for _ in range(3)] == rows_scaled
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
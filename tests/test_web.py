@@ -0,0 +1,317 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Tests against the segno.web module and the --serve-http option.
+"""
+import json
+import asyncio
+import threading
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError
+import pytest
+import segno
+from segno import web, cli
+
+
+def _headers(headers):
+    return dict(headers)
+
+
+@pytest.fixture
+def server():
+    srv = web.make_server(port=0)
+    thread = threading.Thread(target=srv.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield srv
+    finally:
+        srv.shutdown()
+        srv.server_close()
+        thread.join()
+
+
+def _url(srv, target):
+    host, port = srv.server_address[:2]
+    return f'http://{host}:{port}{target}'
+
+
+@pytest.mark.parametrize('kind, content_type', [('png', 'image/png'),
+                                                ('svg', 'image/svg+xml'),
+                                                ('pdf', 'application/pdf'),
+                                                ('eps', 'application/postscript'),
+                                                ('txt', 'text/plain')])
+def test_render(kind, content_type):
+    service = web.RenderService()
+    status, headers, body = service.handle('GET', f'/qr.{kind}?data=Penny+Lane&scale=2&error=h')
+    assert 200 == status
+    headers = _headers(headers)
+    assert content_type == headers['Content-Type']
+    assert str(len(body)) == headers['Content-Length']
+    assert 'public, max-age=86400' == headers['Cache-Control']
+    if kind != 'pdf':  # The PDF contains the creation date
+        kw = {'scale': 2} if kind != 'txt' else {}  # Unsupported options are ignored
+        assert segno.make('Penny Lane', error='h', micro=False).save(None, kind=kind, **kw) == body
+
+
+def test_render_options():
+    service = web.RenderService()
+    status, _, body = service.handle('GET', '/qr.svg?data=Yellow&dark=darkblue&no-classes=1&micro=1')
+    assert 200 == status
+    assert segno.make('Yellow', micro=True).save(None, kind='svg', dark='darkblue', svgclass=None,
+                                                 lineclass=None) == body
+
+
+def test_etag():
+    service = web.RenderService()
+    etag = _headers(service.handle('GET', '/qr.png?data=Penny+Lane&scale=2')[1])['ETag']
+    assert etag.startswith('"') and etag.endswith('"')
+    # The ETag is derived from the normalized parameters
+    assert etag == _headers(service.handle('GET', '/qr.png?scale=2.0&data=Penny%20Lane')[1])['ETag']
+    etag_h = _headers(service.handle('GET', '/qr.png?data=Penny+Lane&scale=2&error=h')[1])['ETag']
+    assert etag_h == _headers(service.handle('HEAD', '/qr.png?data=Penny+Lane&error=H&scale=2')[1])['ETag']
+    assert etag != etag_h
+    assert etag != _headers(service.handle('GET', '/qr.png?data=Penny+Lane&scale=3')[1])['ETag']
+    assert etag != _headers(service.handle('GET', '/qr.svg?data=Penny+Lane&scale=2')[1])['ETag']
+
+
+@pytest.mark.parametrize('kind', ['pdf', 'eps'])
+def test_etag_weak(kind):
+    # The documents contain the creation date, the content may differ
+    service = web.RenderService()
+    etag = _headers(service.handle('GET', f'/qr.{kind}?data=Penny+Lane')[1])['ETag']
+    assert etag.startswith('W/"')
+    for if_none_match in (etag, etag[2:]):
+        assert 304 == service.handle('GET', f'/qr.{kind}?data=Penny+Lane', if_none_match)[0]
+
+
+@pytest.mark.parametrize('if_none_match', ['{etag}', 'W/{etag}', '"abc", {etag}', '*'])
+def test_not_modified(if_none_match):
+    service = web.RenderService()
+    etag = _headers(service.handle('GET', '/qr.png?data=Penny+Lane')[1])['ETag']
+    status, headers, body = service.handle('GET', '/qr.png?data=Penny+Lane',
+                                           if_none_match.format(etag=etag))
+    assert 304 == status
+    assert b'' == body
+    assert etag == _headers(headers)['ETag']
+    assert 1 == service.metrics()['not_modified']
+
+
+def test_not_modified_without_rendering():
+    service = web.RenderService()
+    etag = _headers(service.handle('GET', '/qr.png?data=Penny+Lane')[1])['ETag']
+    service = web.RenderService()
+    assert 304 == service.handle('GET', '/qr.png?data=Penny+Lane', etag)[0]
+    assert 0 == service.metrics()['misses']
+
+
+def test_modified():
+    service = web.RenderService()
+    status, _, body = service.handle('GET', '/qr.png?data=Penny+Lane', '"abc"')
+    assert 200 == status
+    assert body
+
+
+def test_head():
+    service = web.RenderService()
+    status, headers, body = service.handle('HEAD', '/qr.png?data=Penny+Lane')
+    assert 200 == status
+    assert b'' == body
+    assert str(len(segno.make('Penny Lane', micro=False).save(None, kind='png'))) \
+           == _headers(headers)['Content-Length']
+
+
+def test_cache():
+    service = web.RenderService()
+    body = service.handle('GET', '/qr.png?data=Penny+Lane')[2]
+    assert body == service.handle('GET', '/qr.png?data=Penny+Lane')[2]
+    service.handle('GET', '/qr.svg?data=Penny+Lane')
+    metrics = service.metrics()
+    assert 3 == metrics['requests']
+    assert 1 == metrics['hits']
+    assert 2 == metrics['misses']
+    assert pytest.approx(1 / 3) == metrics['hit_rate']
+    assert 2 == metrics['cache_entries']
+    assert metrics['cache_bytes'] > len(body)
+    assert metrics['render_seconds_total'] > 0
+    assert metrics['render_seconds_avg'] > 0
+
+
+def test_cache_eviction():
+    size = len(segno.make('Penny Lane', micro=False).save(None, kind='png'))
+    service = web.RenderService(cache_size=size * 2)
+    service.handle('GET', '/qr.png?data=Penny+Lane')
+    service.handle('GET', '/qr.png?data=Penny+Lane&border=3')
+    service.handle('GET', '/qr.png?data=Penny+Lane')  # Most recently used
+    service.handle('GET', '/qr.png?data=Penny+Lane&border=2')
+    metrics = service.metrics()
+    assert 2 == metrics['cache_entries']
+    assert metrics['cache_bytes'] <= size * 2
+    service.handle('GET', '/qr.png?data=Penny+Lane')
+    assert 2 == service.metrics()['hits']
+
+
+def test_cache_disabled():
+    service = web.RenderService(cache_size=0)
+    service.handle('GET', '/qr.png?data=Penny+Lane')
+    service.handle('GET', '/qr.png?data=Penny+Lane')
+    metrics = service.metrics()
+    assert 0 == metrics['hits']
+    assert 2 == metrics['misses']
+    assert 0 == metrics['cache_entries']
+
+
+@pytest.mark.parametrize('kw', [{'cache_size': -1}, {'max_age': -1}, {'max_size': 0}])
+def test_invalid_service(kw):
+    with pytest.raises(ValueError):
+        web.RenderService(**kw)
+
+
+@pytest.mark.parametrize('target', ['/qr.png?data=x&scale=3000',
+                                    '/qr.svg?data=x&scale=3000',
+                                    '/qr.png?data=x&border=100000000',
+                                    '/qr.txt?data=x&border=100000000'])
+def test_max_size(target):
+    service = web.RenderService()
+    status, _, body = service.handle('GET', target)
+    assert 400 == status
+    assert b'maximum size of 8192 pixels' in body
+    assert 0 == service.metrics()['misses']
+
+
+def test_max_size_custom():
+    service = web.RenderService(max_size=1000)
+    assert 200 == service.handle('GET', '/qr.png?data=x&scale=5&border=0')[0]
+    assert 400 == service.handle('GET', '/qr.png?data=x&scale=6&border=0')[0]
+    # The scale is not used by the text serializer
+    assert 200 == service.handle('GET', '/qr.txt?data=x&scale=6&border=0')[0]
+
+
+def test_max_age():
+    service = web.RenderService(max_age=60)
+    assert 'public, max-age=60' == _headers(service.handle('GET', '/qr.png?data=Penny+Lane')[1])['Cache-Control']
+
+
+@pytest.mark.parametrize('target, msg', [('/qr.png', '"data"'),
+                                         ('/qr.png?data=Hello&scale=0', 'scale'),
+                                         ('/qr.png?data=Hello&scale=x', 'scale'),
+                                         ('/qr.png?data=Hello&error=x', 'error'),
+                                         ('/qr.png?data=Hello&color=red', 'Unknown option "color"'),
+                                         ('/qr.png?data=Hello&output=x.png', 'Unsupported option "output"'),
+                                         ('/qr.png?data=Hello&port=80', 'Unsupported option "port"'),
+                                         ('/qr.png?data=Hello&seq=1', 'Unsupported option "seq"'),
+                                         ('/qr.png?data=Too+much+data&version=1&error=h', '')])
+def test_bad_request(target, msg):
+    service = web.RenderService()
+    status, headers, body = service.handle('GET', target)
+    assert 400 == status
+    assert msg in body.decode('utf-8')
+    assert 'text/plain; charset=utf-8' == _headers(headers)['Content-Type']
+    assert 1 == service.metrics()['errors']
+
+
+@pytest.mark.parametrize('target', ['/', '/qr.gif?data=Hello', '/qr.png/x?data=Hello', '/qrcode.png?data=Hello'])
+def test_not_found(target):
+    status = web.RenderService().handle('GET', target)[0]
+    assert 404 == status
+
+
+def test_method_not_allowed():
+    status, headers, _ = web.RenderService().handle('POST', '/qr.png?data=Hello')
+    assert 405 == status
+    assert 'GET, HEAD' == _headers(headers)['Allow']
+
+
+def test_metrics():
+    service = web.RenderService()
+    service.handle('GET', '/qr.png?data=Hello')
+    status, headers, body = service.handle('GET', '/metrics')
+    assert 200 == status
+    headers = _headers(headers)
+    assert 'application/json' == headers['Content-Type']
+    assert 'no-store' == headers['Cache-Control']
+    metrics = json.loads(body)
+    assert 2 == metrics['requests']
+    assert 1 == metrics['misses']
+
+
+def test_server(server):
+    url = _url(server, '/qr.png?data=Penny+Lane&scale=3')
+    with urlopen(url) as response:
+        assert 200 == response.status
+        assert 'image/png' == response.headers['Content-Type']
+        etag = response.headers['ETag']
+        assert segno.make('Penny Lane', micro=False).save(None, kind='png', scale=3) == response.read()
+    with pytest.raises(HTTPError) as ex:
+        urlopen(Request(url, headers={'If-None-Match': etag}))
+    assert 304 == ex.value.code
+    assert etag == ex.value.headers['ETag']
+    ex.value.close()
+    with urlopen(Request(url, method='HEAD')) as response:
+        assert 200 == response.status
+        assert b'' == response.read()
+    with urlopen(_url(server, '/metrics')) as response:
+        metrics = json.loads(response.read())
+    assert 1 == metrics['hits']
+    assert 1 == metrics['misses']
+    assert 1 == metrics['not_modified']
+    assert 4 == server.service.metrics()['requests']
+
+
+@pytest.mark.parametrize('target, status', [('/qr.png', 400), ('/index.html', 404)])
+def test_server_errors(server, target, status):
+    with pytest.raises(HTTPError) as ex:
+        urlopen(_url(server, target))
+    assert status == ex.value.code
+    ex.value.close()
+
+
+def _call_asgi(application, scope, messages=()):
+    sent = []
+    messages = list(messages)
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(application(scope, receive, send))
+    return sent
+
+
+def test_asgi():
+    application = web.app()
+    scope = {'type': 'http', 'method': 'GET', 'path': '/qr.svg', 'query_string': b'data=Penny+Lane&scale=2',
+             'headers': []}
+    start, body = _call_asgi(application, scope)
+    assert 'http.response.start' == start['type']
+    assert 200 == start['status']
+    headers = _headers(start['headers'])
+    assert b'image/svg+xml' == headers[b'content-type']
+    assert segno.make('Penny Lane', micro=False).save(None, kind='svg', scale=2) == body['body']
+    scope['headers'] = [(b'if-none-match', headers[b'etag'])]
+    start, body = _call_asgi(application, scope)
+    assert 304 == start['status']
+    assert b'' == body['body']
+    assert 1 == application.service.metrics()['not_modified']
+
+
+def test_asgi_lifespan():
+    sent = _call_asgi(web.app(), {'type': 'lifespan'}, [{'type': 'lifespan.startup'},
+                                                        {'type': 'lifespan.shutdown'}])
+    assert [{'type': 'lifespan.startup.complete'}, {'type': 'lifespan.shutdown.complete'}] == sent
+
+
+def test_cli_serve_http(monkeypatch):
+    calls = []
+    monkeypatch.setattr(web, 'serve', lambda host, port: calls.append((host, port)))
+    assert 0 == cli.main(['--serve-http', '--host', '0.0.0.0', '--port', '8080'])
+    assert [('0.0.0.0', 8080)] == calls
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
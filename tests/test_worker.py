@@ -0,0 +1,118 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+Tests against the segno.worker module and the --serve-stdio option.
+"""
+import io
+import os
+import sys
+import json
+import base64
+import shutil
+import tempfile
+import subprocess
+import pytest
+import segno
+from segno import worker, cli
+
+
+def _requests(*requests):
+    return [json.dumps(request) + '\n' for request in requests]
+
+
+def _serve(lines, **kw):
+    out = io.StringIO()
+    worker.serve(lines, out, **kw)
+    return [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_handle_request():
+    response = json.loads(worker.handle_request(json.dumps({'id': 'a', 'content': 'Penny Lane', 'kind': 'svg',
+                                                            'error': 'h', 'scale': 2, 'dark': [255, 0, 0]})))
+    expected = segno.make('Penny Lane', error='h').save(None, kind='svg', scale=2, dark=(255, 0, 0))
+    assert {'id': 'a', 'kind': 'svg', 'data': base64.b64encode(expected).decode('ascii')} == response
+
+
+def test_handle_request_default_kind():
+    response = json.loads(worker.handle_request('{"content": 1234, "micro": false}'))
+    assert response['id'] is None
+    assert 'png' == response['kind']
+    assert segno.make(1234, micro=False).save(None, kind='png') == base64.b64decode(response['data'])
+
+
+@pytest.mark.parametrize('line, ident', [('no json', None),
+                                         ('[1, 2]', None),
+                                         ('{"id": 1}', 1),
+                                         ('{"id": 2, "content": "x", "kind": "unknown"}', 2),
+                                         ('{"id": 3, "content": "x", "scale": 0}', 3),
+                                         ('{"id": 4, "content": "Penny Lane", "version": 1, "error": "h"}', 4),
+                                         ('{"id": 5, "content": "x", "unknown": 1}', 5)])
+def test_handle_request_error(line, ident):
+    response = json.loads(worker.handle_request(line))
+    assert ident == response['id']
+    assert response['error']
+    assert 'data' not in response
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_serve(jobs):
+    lines = _requests(*({'id': i, 'content': f'Penny Lane {i}', 'kind': 'txt'} for i in range(50)))
+    lines.insert(10, '\n')
+    lines.insert(20, 'invalid\n')
+    responses = _serve(lines, jobs=jobs)
+    assert 51 == len(responses)
+    assert 'error' in responses[19]
+    responses.pop(19)
+    for i, response in enumerate(responses):
+        assert i == response['id']
+        assert segno.make(f'Penny Lane {i}').save(None, kind='txt') == base64.b64decode(response['data'])
+
+
+def test_serve_cache():
+    directory = tempfile.mkdtemp()
+    responses = _serve(_requests({'content': 'Penny Lane'}, {'content': 'Penny Lane'}), cache=directory)
+    cached_files = sum(len(files) for _, _, files in os.walk(directory))
+    shutil.rmtree(directory)
+    assert 2 == cached_files
+    assert responses[0] == responses[1]
+
+
+def test_serve_invalid_jobs():
+    with pytest.raises(ValueError):
+        worker.serve([], io.StringIO(), jobs=0)
+
+
+@pytest.mark.parametrize('args', [['-m', 'segno.worker'], ['-m', 'segno.cli', '--serve-stdio']])
+def test_process(args):
+    proc = subprocess.Popen([sys.executable] + args, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                            text=True)
+    try:
+        # The response is written before the next request is sent
+        for i in range(3):
+            proc.stdin.write(json.dumps({'id': i, 'content': 'Penny Lane', 'kind': 'svg'}) + '\n')
+            proc.stdin.flush()
+            response = json.loads(proc.stdout.readline())
+            assert i == response['id']
+            assert segno.make('Penny Lane').save(None, kind='svg') == base64.b64decode(response['data'])
+        proc.stdin.close()
+        assert '' == proc.stdout.read()
+        assert 0 == proc.wait(timeout=30)
+    finally:
+        proc.kill()
+        proc.stdout.close()
+
+
+def test_cli_serve_stdio(monkeypatch, capsys):
+    monkeypatch.setattr('sys.stdin', io.StringIO('{"content": "Penny Lane", "kind": "txt"}\n'))
+    assert 0 == cli.main(['--serve-stdio'])
+    out, err = capsys.readouterr()
+    response = json.loads(out)
+    assert segno.make('Penny Lane').save(None, kind='txt') == base64.b64decode(response['data'])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -74,6 +74,99 @@ def test_writable_not_stream3():
     assert f.closed
 
 
+def test_byte_writer_text_stream():
+    buff = io.StringIO()
+    with writers._byte_writer(buff, 'wt') as f:
+        f.write('Grüße'.encode('utf-8'))
+    assert 'Grüße' == buff.getvalue()
+
+
+def test_byte_writer_not_stream():
+    fn = tempfile.NamedTemporaryFile()
+    name = fn.name
+    fn.close()
+    try:
+        with writers._byte_writer(name, 'wt') as f:
+            f.write(b'Segno\n')
+        assert f.closed
+        with open(name, 'rb') as f:
+            assert b'Segno\n' == f.read()
+    finally:
+        os.remove(name)
+
+
+@pytest.mark.parametrize('kind', ['svg', 'svgz', 'png', 'eps', 'pdf', 'txt', 'xpm', 'xbm',
+                                  'pbm', 'pam', 'ppm', 'tex', 'ans', 'tiff', 'zpl', 'escpos'])
+def test_save_out_none(kind):
+    qr = segno.make('Segno')
+    kw = {} if kind in ('txt', 'ans') else {'scale': 2}
+    buff = io.BytesIO()
+    qr.save(buff, kind=kind, **kw)
+    val = qr.save(None, kind=kind, **kw)
+    assert isinstance(val, bytes)
+    if kind in ('svgz', 'pdf', 'eps', 'tex', 'tiff'):  # Creation date and compression
+        assert val
+    else:
+        assert buff.getvalue() == val
+
+
+@pytest.mark.parametrize('kind', ['txt', 'xpm', 'xbm', 'ans'])
+def test_text_formats_binary_stream(kind):
+    qr = segno.make('Segno')
+    str_buff = io.StringIO()
+    qr.save(str_buff, kind=kind)
+    buff = io.BytesIO()
+    qr.save(buff, kind=kind)
+    assert str_buff.getvalue() == buff.getvalue().decode('utf-8')
+
+
+class _WriteOnly:
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+
+
+@pytest.mark.parametrize('kind', ['eps', 'txt', 'xpm', 'xbm', 'tex', 'ans', 'zpl'])
+def test_text_formats_write_only_stream(kind):
+    qr = segno.make('Segno')
+    out = _WriteOnly()
+    qr.save(out, kind=kind)
+    assert all(isinstance(chunk, str) for chunk in out.chunks)
+    assert qr.save(None, kind=kind).decode('utf-8') == ''.join(out.chunks)
+
+
+@pytest.mark.parametrize('kind', ['svg', 'png', 'pdf', 'pbm'])
+def test_write_only_stream(kind):
+    qr = segno.make('Segno')
+    out = _WriteOnly()
+    qr.save(out, kind=kind)
+    assert all(isinstance(chunk, bytes) for chunk in out.chunks)
+
+
+@pytest.mark.parametrize('kind', ['png', 'pdf', 'pbm', 'pam', 'ppm', 'tiff', 'escpos'])
+def test_binary_formats_text_stream(kind):
+    qr = segno.make('Segno')
+    with pytest.raises(TypeError):
+        qr.save(io.StringIO(), kind=kind)
+
+
+def test_save_out_none_requires_kind():
+    qr = segno.make('Segno')
+    with pytest.raises(ValueError):
+        qr.save(None)
+
+
+def test_save_multipage_out_none():
+    codes = [segno.make('One'), segno.make('Two')]
+    buff = io.BytesIO()
+    segno.save_multipage(codes, buff, kind='zpl')
+    assert buff.getvalue() == segno.save_multipage(codes, None, kind='zpl')
+    with pytest.raises(ValueError):
+        segno.save_multipage(codes, None)
+
+
 def test_colormap_dark_light():
     qr = segno.make('123', version=7)
     width, height = len(qr.matrix[0]), len(qr.matrix)
@@ -102,5 +195,25 @@ def test_colormap_micro():
     assert consts.TYPE_DARKMODULE not in cm
 
 
+def test_colormap_cached():
+    cm = writers._make_colormap(21, 21, dark='blue', light='white')
+    assert cm is writers._make_colormap(21, 21, dark='blue', light='white')
+    assert cm is writers._make_colormap(25, 25, dark='blue', light='white')
+    assert cm is not writers._make_colormap(45, 45, dark='blue', light='white')
+    assert cm is not writers._make_colormap(21, 21, dark='blue', light='red')
+    with pytest.raises(TypeError):
+        cm[consts.TYPE_DATA_DARK] = 'red'
+
+
+def test_colormap_not_cached():
+    cm = writers._make_colormap(21, 21, dark=(0, 0, 0, 1.0), light='white')
+    assert (0, 0, 0, 1.0) == cm[consts.TYPE_DATA_DARK]
+    assert isinstance(cm[consts.TYPE_DATA_DARK][3], float)
+    cm = writers._make_colormap(21, 21, dark=(0, 0, 0, 1), light='white')
+    assert isinstance(cm[consts.TYPE_DATA_DARK][3], int)
+    cm = writers._make_colormap(21, 21, dark=[0, 0, 0], light='white')
+    assert [0, 0, 0] == cm[consts.TYPE_DATA_DARK]
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
@@ -61,6 +61,17 @@ def test_write_xpm_width_height():
     assert img_data.startswith(f'{width} {height}')
 
 
+def test_write_xpm_scale():
+    scale = 3
+    qr = segno.make_qr('test')
+    out = io.StringIO()
+    qr.save(out, kind='xpm', border=0, scale=scale)
+    rows = _img_data(out.getvalue())[3:]
+    assert len(qr.matrix) * scale == len(rows)
+    for i, row in enumerate(rows):
+        assert ''.join(' X'[bit] * scale for bit in qr.matrix[i // scale]) == row
+
+
 def xpm_as_matrix(buff, border):
     """\
     Returns the XPM QR code as list of [0, 1] lists.
@@ -0,0 +1,144 @@
+#
+# Copyright (c) 2016 - 2024 -- Lars Heuer
+# All rights reserved.
+#
+# License: BSD License
+#
+"""\
+ZPL related tests.
+"""
+import io
+import re
+import random
+import pytest
+import segno
+from segno import writers
+
+_GFA_PATTERN = re.compile(r'\^FO(\d+),(\d+)\^GFA,(\d+),(\d+),(\d+),([^^]*)\^FS')
+
+
+def _decode_gfa(data, bytes_per_row):
+    """\
+    Decodes the compressed ASCII hexadecimal data of a graphic field.
+
+    Returns a list of rows, each row is a string of "0" and "1".
+    """
+    hex_width = bytes_per_row * 2
+    rows = []
+    row = ''
+    count = 0
+    for ch in data:
+        if ch.isspace():
+            continue
+        if 'G' <= ch <= 'Y':
+            count += ord(ch) - ord('F')
+            continue
+        if 'g' <= ch <= 'z':
+            count += (ord(ch) - ord('f')) * 20
+            continue
+        if ch == ':':
+            assert not row
+            rows.append(rows[-1])
+            continue
+        if ch == ',':
+            row = row.ljust(hex_width, '0')
+        elif ch == '!':
+            row = row.ljust(hex_width, 'F')
+        else:
+            row += ch * (count or 1)
+            count = 0
+        assert len(row) <= hex_width
+        if len(row) == hex_width:
+            rows.append(row)
+            row = ''
+    assert not row
+    return [''.join(f'{int(c, 16):04b}' for c in r) for r in rows]
+
+
+def _labels(buff):
+    return _GFA_PATTERN.findall(buff.getvalue().decode('ascii'))
+
+
+def _assert_label(label, matrix_iter, width):
+    x, y, total, field_count, bytes_per_row, data = label
+    bytes_per_row = int(bytes_per_row)
+    assert (width + 7) // 8 == bytes_per_row
+    rows = _decode_gfa(data, bytes_per_row)
+    assert int(total) == int(field_count) == len(rows) * bytes_per_row
+    expected = [''.join(str(bit) for bit in row) for row in matrix_iter]
+    assert expected == [row[:width] for row in rows]
+    assert all(set(row[width:]) <= {'0'} for row in rows)
+
+
+def test_label():
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='zpl')
+    val = out.getvalue()
+    assert val.startswith(b'^XA\n^FO0,0^GFA,')
+    assert val.endswith(b'^FS\n^XZ\n')
+
+
+def test_position():
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='zpl', x=50, y=120)
+    label, = _labels(out)
+    assert ('50', '120') == label[:2]
+
+
+@pytest.mark.parametrize('scale, border', [(1, None), (2, 0), (5, 1), (12, 4)])
+def test_decode(scale, border):
+    qr = segno.make('Segno ZPL', micro=False)
+    out = io.BytesIO()
+    qr.save(out, kind='zpl', scale=scale, border=border)
+    label, = _labels(out)
+    width = qr.symbol_size(scale=scale, border=border)[0]
+    _assert_label(label, qr.matrix_iter(scale=scale, border=border), width)
+
+
+def test_decode_random():
+    rnd = random.Random(7)
+    for i in range(50):
+        width, height = rnd.randint(1, 40), rnd.randint(1, 20)
+        density = rnd.choice([0.0, 0.1, 0.5, 0.9, 1.0])
+        matrix = tuple(bytearray(int(rnd.random() < density) for _ in range(width)) for _ in range(height))
+        scale = rnd.choice([1, 2, 3, 30])
+        out = io.BytesIO()
+        writers.write_zpl(matrix, (width, height), out, scale=scale, border=0)
+        label, = _labels(out)
+        _assert_label(label, segno.utils.matrix_iter(matrix, (width, height), scale, 0), width * scale)
+
+
+def test_vertical_scaling():
+    qr = segno.make_qr('test')
+    out = io.BytesIO()
+    qr.save(out, kind='zpl', scale=4, border=0)
+    label, = _labels(out)
+    lines = label[-1].strip().split('\n')
+    assert len(qr.matrix) == len(lines)
+    assert all(line.endswith(':::') for line in lines)
+
+
+def test_repeat_count():
+    assert 'G' == writers._zpl_repeat_count(1)
+    assert 'Y' == writers._zpl_repeat_count(19)
+    assert 'g' == writers._zpl_repeat_count(20)
+    assert 'hK' == writers._zpl_repeat_count(45)
+    assert 'z' == writers._zpl_repeat_count(400)
+    assert 'zzgG' == writers._zpl_repeat_count(821)
+
+
+def test_batch():
+    codes = [segno.make(f'Label {i}') for i in range(3)]
+    out = io.BytesIO()
+    segno.save_multipage(codes, out, kind='zpl', scale=2)
+    val = out.getvalue()
+    assert 3 == val.count(b'^XA')
+    assert 3 == val.count(b'^XZ')
+    for label, qr in zip(_labels(out), codes):
+        _assert_label(label, qr.matrix_iter(scale=2), qr.symbol_size(scale=2)[0])
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])